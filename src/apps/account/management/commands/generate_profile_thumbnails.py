@@ -0,0 +1,50 @@
+import time
+
+import redis
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.account.thumbnails import profile_thumbnails
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker making the avatar variants of new profile pictures. '
+        'Run a single instance (e.g. under supervisor / systemd), or with --once from cron. '
+        '--backfill queues every picture without variants and drains the queue.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.PROFILE_THUMBNAIL_CONFIG.get('PROCESSES', 1),
+                            help='Resizing processes')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds between polls of an empty queue')
+        parser.add_argument('--retry-after', type=float, default=10.0, help='Seconds to wait when redis is unavailable')
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--backfill', action='store_true', help='Queue every picture without variants, implies --once')
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            self.stdout.write(f'{profile_thumbnails.backfill()} profiles queued')
+
+        once = options['once'] or options['backfill']
+        while True:
+            close_old_connections()
+            try:
+                ready, failed = profile_thumbnails.run(options['processes'])
+            except redis.RedisError as e:
+                # claimed ids stay in the processing set and are retried
+                self.stderr.write(f'Thumbnails failed: {e}')
+                if once:
+                    raise CommandError('Profile thumbnails failed.') from e
+                time.sleep(options['retry_after'])
+                continue
+
+            if ready or failed:
+                self.stdout.write(f'{ready} profiles ready, {failed} failed')
+                continue
+            if once:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+from apps.core.migration_operations import AddIndexConcurrentlyIfPostgreSQL
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('account', '0002_remove_userprofilemodel_national_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='user',
+            index=models.Index(fields=['created_at'], name='user_created_idx'),
+        ),
+    ]
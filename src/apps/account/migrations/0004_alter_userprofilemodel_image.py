@@ -0,0 +1,18 @@
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_user_created_idx'),
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofilemodel',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=apps.core.storage.get_blob_storage, upload_to='images/profiles/', verbose_name='Picture'),
+        ),
+    ]
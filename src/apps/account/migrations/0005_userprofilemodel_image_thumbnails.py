@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_alter_userprofilemodel_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofilemodel',
+            name='image_thumbnails',
+            field=models.CharField(blank=True, default='', editable=False, max_length=100, verbose_name='Picture thumbnails'),
+        ),
+    ]
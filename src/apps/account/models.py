@@ -1,6 +1,8 @@
+import os
 from datetime import timedelta
 from secrets import token_hex
 
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
@@ -10,6 +12,7 @@ from django.templatetags.static import static
 from django.shortcuts import reverse
 
 from apps.core.models import BaseModel
+from apps.core.storage import get_blob_storage
 from apps.core.validators import OnlyPersianCharsValidator
 
 from .managers import UserManager
@@ -36,6 +39,10 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            # daily rollups (apps.dashboard.rollup)
+            models.Index(fields=['created_at'], name='user_created_idx'),
+        ]
 
     def __str__(self):
         return self.email
@@ -81,10 +88,14 @@ class UserProfileModel(BaseModel):
     phone_number = models.CharField(_('Phone number'), max_length=11)
     gender = models.CharField(_('Gender'), max_length=10, choices=Gender.choices, null=True, blank=True)
     bio = models.TextField(_('Bio'), blank=True, null=True)
-    image = models.ImageField(_('Picture'), upload_to='images/profiles/', null=True, blank=True)
+    image = models.ImageField(_('Picture'), upload_to='images/profiles/', storage=get_blob_storage,
+                              null=True, blank=True)
     degree = models.CharField(_('Degree'), max_length=128, null=True, blank=True)
     city = models.CharField(_('City'), max_length=64, null=True, blank=True)
     skills = models.TextField(_('Skills'), blank=True, null=True)
+    # name of the image whose variants are ready (apps.account.thumbnails)
+    image_thumbnails = models.CharField(_('Picture thumbnails'), max_length=100, blank=True, default='',
+                                        editable=False)
 
     class Meta:
         verbose_name = _('User profile')
@@ -93,11 +104,26 @@ class UserProfileModel(BaseModel):
     def __str__(self):
         return f'{self.user}'
 
-    def get_image_url(self):
+    def get_image_url(self, size=None):
+        """`size` of PROFILE_THUMBNAIL_CONFIG['SIZES'], the original is sent until the variants are made"""
         if self.image:
-            return self.image.url
+            # the stored name is the content hash (apps.core.storage), a new picture gets a new url
+            version = os.path.splitext(os.path.basename(self.image.name))[0][:16]
+            url = f"{reverse('account:profile_image', args=[self.pk])}?v={version}"
+            if size in settings.PROFILE_THUMBNAIL_CONFIG['SIZES'] and self.has_thumbnails():
+                url += f'&size={size}'
+            return url
         return static('images/default/user.jpg')
 
+    def get_small_image_url(self):
+        return self.get_image_url(size='small')
+
+    def get_medium_image_url(self):
+        return self.get_image_url(size='medium')
+
+    def has_thumbnails(self):
+        return bool(self.image) and self.image_thumbnails == self.image.name
+
     def get_absolute_url(self):
         return reverse('account:public_profile', args=[self.pk])
 
@@ -1,7 +1,10 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from apps.core.storage import track_file_references
+
 from .models import User, UserProfileModel
+from .thumbnails import profile_thumbnails
 
 
 # User model save receiver (Create profile)
@@ -9,3 +12,14 @@ from .models import User, UserProfileModel
 def user_post_save(sender, instance, created, *args, **kwargs):
     if created:
         UserProfileModel.objects.create(user=instance)
+
+
+# Profile model save receiver (Queue avatar variants of a new picture)
+@receiver(post_save, sender=UserProfileModel)
+def profile_post_save(sender, instance, *args, **kwargs):
+    if instance.image and not instance.has_thumbnails():
+        profile_thumbnails.push(instance.pk)
+
+
+# Release the stored picture of deleted / updated profiles
+track_file_references(UserProfileModel, 'image')
@@ -0,0 +1,179 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import redis
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+
+from apps.core.redis_utils import redis_manager
+
+from .models import UserProfileModel
+
+
+logger = logging.getLogger(__name__)
+
+# (Pillow format, extension, save options), webp for browsers accepting it and jpeg for the others
+FORMATS = (
+    ('WEBP', 'webp', {'method': 4}),
+    ('JPEG', 'jpg', {'optimize': True, 'progressive': True}),
+)
+
+
+def get_variant_name(image_name, size, extension):
+    # next to the content addressed original, removed with it (apps.core.storage)
+    return f'{os.path.splitext(image_name)[0]}-{size}.{extension}'
+
+
+def get_variant_names(image_name, sizes=None):
+    sizes = sizes or settings.PROFILE_THUMBNAIL_CONFIG['SIZES']
+    return [get_variant_name(image_name, size, extension) for size in sizes for _format, extension, _options in FORMATS]
+
+
+def _make_variants(path, config):
+    """(path, error), runs in the worker processes"""
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(path) as image:
+            # only the header is read so far, the pixels are never decoded for a bomb
+            if image.width * image.height > config['MAX_PIXELS']:
+                raise Image.DecompressionBombError(f'{image.width}x{image.height} pixels')
+            largest = max(config['SIZES'].values())
+            # jpeg is decoded at the smallest scale still larger than the variants
+            image.draft('RGB', (largest, largest))
+            image = ImageOps.exif_transpose(image).convert('RGBA')
+
+        flat = Image.new('RGB', image.size, (255, 255, 255))
+        flat.paste(image, mask=image.getchannel('A'))
+        for size, pixels in config['SIZES'].items():
+            variant = ImageOps.fit(flat, (pixels, pixels), Image.Resampling.LANCZOS)
+            for image_format, extension, options in FORMATS:
+                target = get_variant_name(path, size, extension)
+                # written aside and renamed, a reader never sees a partial file
+                temp = f'{target}.tmp'
+                try:
+                    variant.save(temp, image_format, quality=config['QUALITY'], **options)
+                    os.replace(temp, target)
+                finally:
+                    if os.path.exists(temp):
+                        os.remove(temp)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return path, f'{type(e).__name__}: {e}'
+    return path, None
+
+
+class ProfileThumbnails:
+    """
+        fixed size avatar variants of profile pictures, made outside the request by `generate_profile_thumbnails`
+        saved profiles with a new picture are queued in a redis set (claimed by renaming it, like
+        apps.job.search.queue), variants are named after the content addressed original, so a picture
+        shared by many profiles is resized once, and `image_thumbnails` switches the urls once they exist
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.key = config.get('QUEUE_KEY', 'profile_thumbnails:pending')
+        self.processing_key = f'{self.key}:processing'
+
+    @property
+    def conn(self):
+        return redis_manager.get_conn()
+
+    @property
+    def storage(self):
+        return UserProfileModel._meta.get_field('image').storage
+
+    # Queue
+    def push(self, *ids):
+        """queue `ids` once the current transaction commits"""
+
+        def push():
+            try:
+                self.conn.sadd(self.key, *ids)
+            except redis.RedisError as e:
+                # the original is sent meanwhile, `--backfill` queues it again
+                logger.warning('Could not queue profiles %s for thumbnails: %s', ids, e)
+
+        transaction.on_commit(push)
+
+    def claim(self):
+        if not self.conn.exists(self.processing_key):
+            try:
+                self.conn.rename(self.key, self.processing_key)
+            except redis.ResponseError:
+                # nothing queued
+                return []
+        return sorted(int(pk) for pk in self.conn.smembers(self.processing_key))
+
+    def ack(self, ids):
+        if ids:
+            self.conn.srem(self.processing_key, *ids)
+
+    def backfill(self):
+        """queue every profile whose picture has no variants, returns their number"""
+        ids = list(UserProfileModel.objects.exclude(image='').exclude(image__isnull=True)
+                   .exclude(image_thumbnails=F('image')).values_list('pk', flat=True))
+        for start in range(0, len(ids), 1000):
+            self.conn.sadd(self.key, *ids[start:start + 1000])
+        return len(ids)
+
+    # Variants
+    def has_variants(self, name):
+        return all(self.storage.exists(variant) for variant in get_variant_names(name, self.config['SIZES']))
+
+    def make(self, names, processes=1):
+        """{name: error or None} of the pictures `names`, existing variants are kept"""
+        results = {name: None for name in names if self.has_variants(name)}
+        missing = [name for name in names if name not in results]
+        paths = {self.storage.path(name): name for name in missing}
+        if processes <= 1 or len(missing) <= 1:
+            made = map(_make_variants, paths, repeat(self.config))
+        else:
+            # forked workers must not share the parent's database connections
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                made = list(executor.map(_make_variants, paths, repeat(self.config)))
+        for path, error in made:
+            results[paths[path]] = error
+        return results
+
+    @staticmethod
+    def mark_ready(pk, name):
+        """switch the profile urls to the variants, unless the picture changed meanwhile"""
+        with transaction.atomic():
+            profile = UserProfileModel.objects.select_for_update().filter(pk=pk, image=name).first()
+            if profile is None:
+                return False
+            profile.image_thumbnails = name
+            # a save, so the pages showing the picture are invalidated by their signals
+            profile.save(update_fields=['image_thumbnails', 'updated_at'])
+        return True
+
+    def run(self, processes=1):
+        """make the variants of the queued profiles, returns (ready, failed)"""
+        ids = self.claim()
+        if not ids:
+            return 0, 0
+
+        profiles = [
+            (pk, image) for pk, image, ready in
+            UserProfileModel.objects.filter(pk__in=ids).exclude(image='').exclude(image__isnull=True)
+            .values_list('pk', 'image', 'image_thumbnails')
+            if image != ready
+        ]
+        results = self.make(sorted({image for _, image in profiles}), processes)
+        ready = failed = 0
+        for pk, image in profiles:
+            if results[image] is None:
+                ready += self.mark_ready(pk, image)
+            else:
+                failed += 1
+                logger.warning('Could not make thumbnails of profile %s: %s', pk, results[image])
+        self.ack(ids)
+        return ready, failed
+
+
+profile_thumbnails = ProfileThumbnails(settings.PROFILE_THUMBNAIL_CONFIG)
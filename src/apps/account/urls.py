@@ -32,6 +32,7 @@ urlpatterns = [
     path('create-admin/', template_views.CreateAdminView.as_view(), name='create_admin'),
     path('profile/', template_views.ProfileView.as_view(), name='profile'),
     path('profile/<int:pk>/', template_views.PublicProfileView.as_view(), name='public_profile'),
+    path('profile/<int:pk>/image/', template_views.ProfileImageView.as_view(), name='profile_image'),
     path('profile/edit/', template_views.EditProfileView.as_view(), name='edit_profile'),
     path('users/', template_views.UserListView.as_view(), name='user_list'),
     path('blocklist/', template_views.UserBlockListView.as_view(), name='block_list'),
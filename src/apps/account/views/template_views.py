@@ -7,11 +7,17 @@ from django.views.generic import FormView, RedirectView, DetailView, UpdateView,
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.utils.translation import gettext_lazy as _
 from django.contrib import messages
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.utils.cache import patch_vary_headers
 
+from apps.core.downloads import serve_file
 from apps.core.utils import validate_form, toast_form_errors
+from apps.core.views.mixins import ConditionalGetMixin, CursorPaginationMixin
 
 from ..models import UserProfileModel, User, UserBlock
 from ..mixins import LogoutRequiredMixin, AccessRequiredMixin
+from ..thumbnails import get_variant_name
 from ..forms import LoginForm, GetEmailForm, ResetPassForm, VerifyEmailForm, RegisterForm, EditProfileForm, AdminCreationForm
 
 
@@ -216,7 +222,7 @@ class CreateAdminView(AccessRequiredMixin, FormView):
         return super().form_invalid(form)
 
 
-class ProfileView(LoginRequiredMixin, DetailView):
+class ProfileView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     template_name = 'account/profile/profile.html'
     model = UserProfileModel
     context_object_name = 'profile'
@@ -224,17 +230,40 @@ class ProfileView(LoginRequiredMixin, DetailView):
     def get_object(self, queryset=None):
         return self.request.user.profile
 
+    def get_conditional_queryset(self):
+        return UserProfileModel.objects.filter(user=self.request.user)
 
-class PublicProfileView(LoginRequiredMixin, DetailView):
+
+class PublicProfileView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = UserProfileModel
     template_name = 'account/profile/public_profile.html'
     context_object_name = 'profile'
+    conditional_fields = ('updated_at', 'user__updated_at')
 
     def get_object(self):
         profile_id = self.kwargs.get('pk')
         return get_object_or_404(UserProfileModel, pk=profile_id)
 
 
+class ProfileImageView(LoginRequiredMixin, View):
+    """
+        profile picture, visible to signed in users like the public profile
+        `size` sends an avatar variant, webp when the browser accepts it
+    """
+
+    def get(self, request, pk):
+        profile = get_object_or_404(UserProfileModel.objects.exclude(image=''), pk=pk)
+        size = request.GET.get('size')
+        if size not in settings.PROFILE_THUMBNAIL_CONFIG['SIZES'] or not profile.has_thumbnails():
+            return serve_file(request, profile.image)
+
+        extension = 'webp' if 'image/webp' in request.headers.get('Accept', '') else 'jpg'
+        variant = FieldFile(profile, profile.image.field, get_variant_name(profile.image.name, size, extension))
+        response = serve_file(request, variant if variant.storage.exists(variant.name) else profile.image)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
 class EditProfileView(LoginRequiredMixin, UpdateView):
     model = UserProfileModel
     form_class = EditProfileForm
@@ -257,7 +286,7 @@ class EditProfileView(LoginRequiredMixin, UpdateView):
         return response
 
 
-class UserListView(LoginRequiredMixin, AccessRequiredMixin, ListView):
+class UserListView(LoginRequiredMixin, AccessRequiredMixin, CursorPaginationMixin, ListView):
     model = User
     template_name = 'account/user/user_list.html'
     context_object_name = 'users'
@@ -301,7 +330,7 @@ class DeleteUserView(LoginRequiredMixin, AccessRequiredMixin, View):
         return redirect('account:user_list')
 
 
-class UserBlockListView(LoginRequiredMixin, AccessRequiredMixin, ListView):
+class UserBlockListView(LoginRequiredMixin, AccessRequiredMixin, CursorPaginationMixin, ListView):
     template_name = 'account/user/block_list.html'
     model = User
     roles = ['admin']
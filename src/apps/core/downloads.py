@@ -0,0 +1,77 @@
+import mimetypes
+import os
+from urllib.parse import quote
+
+import ranged_response
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header
+
+
+READ_SIZE = 64 * 1024
+
+
+class RangedFileReader(ranged_response.RangedFileReader):
+    """sized by seeking, the reader of django-ranged-response reads the whole file to get its size"""
+
+    def __init__(self, file_like, block_size=READ_SIZE):
+        file_like.seek(0, os.SEEK_END)
+        self.size = file_like.tell()
+        self.f = file_like
+        self.start, self.stop = 0, self.size
+        self.block_size = block_size
+
+
+class RangedFileResponse(ranged_response.RangedFileResponse):
+    """file streamed in READ_SIZE blocks, a single `Range` is answered with 206 (multiple ranges get the whole file)"""
+
+    def __init__(self, request, file, *args, **kwargs):
+        self.ranged_file = RangedFileReader(file)
+        FileResponse.__init__(self, self.ranged_file, *args, **kwargs)
+        self._resource_closers.append(file.close)
+        self['Accept-Ranges'] = 'bytes'
+        self['Content-Length'] = self.ranged_file.size
+        if 'HTTP_RANGE' in request.META:
+            self.add_range_headers(request.META['HTTP_RANGE'])
+        if self.status_code == 416:
+            self.ranged_file.stop = self.ranged_file.start
+            self['Content-Range'] = f'bytes */{self.ranged_file.size}'
+            self['Content-Length'] = 0
+
+
+def get_config():
+    return settings.FILE_DOWNLOAD_CONFIG
+
+
+def serve_file(request, file, filename=None, as_attachment=False):
+    """
+        response of a stored `file` (FieldFile) to a caller already authorized by the view
+        with SENDFILE the web server sends the bytes (ranges included) and the worker is released at once,
+        otherwise it is streamed by RangedFileResponse
+    """
+    if not file or not file.storage.exists(file.name):
+        raise Http404()
+
+    config = get_config()
+    filename = filename or os.path.basename(file.name)
+    # content addressed names (apps.core.storage) never change content, the name is the etag
+    etag = '"%s"' % os.path.basename(file.name)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        sendfile = config.get('SENDFILE')
+        if sendfile == 'nginx':
+            response = HttpResponse(content_type=content_type)
+            response['X-Accel-Redirect'] = config['INTERNAL_URL'] + quote(file.name)
+        elif sendfile == 'apache':
+            response = HttpResponse(content_type=content_type)
+            response['X-Sendfile'] = file.storage.path(file.name)
+        else:
+            response = RangedFileResponse(request, file.storage.open(file.name, 'rb'), content_type=content_type)
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+
+    response['ETag'] = etag
+    # private, shared caches must not keep files of one user for another
+    patch_cache_control(response, private=True, max_age=config.get('MAX_AGE', 3600))
+    return response
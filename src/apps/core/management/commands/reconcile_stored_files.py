@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.storage import get_blob_fields, store_legacy_files, reconcile_references
+
+
+class Command(BaseCommand):
+    help = (
+        'Move files saved before deduplication into the blob store and recount blob references '
+        '(run once after deploying, then periodically)'
+    )
+
+    def handle(self, *args, **options):
+        for model, field in get_blob_fields():
+            moved, missing = store_legacy_files(model, field)
+            self.stdout.write(f'{model._meta.label}.{field}: {moved} files moved, {missing} missing')
+        updated, deleted, swept = reconcile_references()
+        self.stdout.write(self.style.SUCCESS(
+            f'Done. {updated} references updated, {deleted} unused blobs deleted, {swept} files without a blob removed.'
+        ))
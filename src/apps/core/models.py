@@ -25,3 +25,17 @@ class BaseModel(models.Model):
     def get_created_at_time_past(self):
         return get_timesince_persian(self.created_at)
 
+
+class StoredFileModel(models.Model):
+    """blob of apps.core.storage.ContentAddressedStorage and the number of file fields pointing to it"""
+    name = models.CharField(_('Name'), max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(_('Size'))
+    references = models.PositiveIntegerField(_('References'), default=1)
+    created_at = models.DateTimeField(_('Creation Time'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Stored File')
+        verbose_name_plural = _('Stored Files')
+
+    def __str__(self):
+        return f'{self.name} ({self.references})'
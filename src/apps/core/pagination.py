@@ -0,0 +1,102 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# Cursor utils
+def encode_cursor(value, pk, backwards=False):
+    payload = json.dumps([value.isoformat(), pk, int(backwards)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, pk, backwards = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(value), int(pk), bool(backwards)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise InvalidCursor(cursor) from e
+
+
+class CursorPage:
+    is_cursor = True
+    number = None
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+        keyset pagination on (`field`, pk)
+        every page is fetched with one indexed range query, no COUNT(*) and no OFFSET
+    """
+
+    def __init__(self, queryset, per_page, ordering='-created_at'):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.field = ordering.lstrip('-')
+        self.descending = ordering.startswith('-')
+
+    def get_ordering(self, descending):
+        sign = '-' if descending else ''
+        return f'{sign}{self.field}', f'{sign}pk'
+
+    def get_position_filter(self, value, pk, descending):
+        op = 'lt' if descending else 'gt'
+        return Q(**{f'{self.field}__{op}e': value}) & (
+            Q(**{f'{self.field}__{op}': value}) | Q(**{self.field: value, f'pk__{op}': pk})
+        )
+
+    def page(self, cursor=None):
+        value = pk = None
+        backwards = False
+        if cursor:
+            value, pk, backwards = decode_cursor(cursor)
+
+        descending = self.descending != backwards
+        qs = self.queryset.order_by(*self.get_ordering(descending))
+        if cursor:
+            qs = qs.filter(self.get_position_filter(value, pk, descending))
+
+        rows = list(qs[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        has_next = True if backwards else has_more
+        has_previous = has_more if backwards else bool(cursor)
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(getattr(rows[-1], self.field), rows[-1].pk)
+        if rows and has_previous:
+            previous_cursor = encode_cursor(getattr(rows[0], self.field), rows[0].pk, backwards=True)
+
+        return CursorPage(rows, self, next_cursor, previous_cursor)
@@ -3,7 +3,7 @@ from rest_framework import serializers
 
 class PaginatorSerializer(serializers.Serializer):
     objects_count = serializers.IntegerField(source='count')
-    pages_count = serializers.IntegerField(source='num_page')
+    pages_count = serializers.IntegerField(source='num_pages')
 
     
 class ListSerializer(serializers.Serializer):
@@ -14,6 +14,19 @@ class ListParamsSerializer(serializers.Serializer):
     page = serializers.IntegerField(default=1, required=False)
 
 
+class CursorPaginatorSerializer(serializers.Serializer):
+    next_cursor = serializers.CharField(allow_null=True)
+    previous_cursor = serializers.CharField(allow_null=True)
+
+
+class CursorListSerializer(serializers.Serializer):
+    paginator = CursorPaginatorSerializer()
+
+
+class CursorListParamsSerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False)
+
+
 class FilterByDateSerializer(serializers.Serializer):
     fb_dc_start_from = serializers.DateTimeField(required=False)
     fb_dc_end_to = serializers.DateTimeField(required=False)
\ No newline at end of file
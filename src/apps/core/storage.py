@@ -0,0 +1,283 @@
+import hashlib
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import F, FileField
+from django.db.models.signals import post_init, post_save, post_delete
+from django.utils import timezone
+
+from .models import StoredFileModel
+
+
+READ_SIZE = 64 * 1024
+BLOB_NAME = re.compile(r'[0-9a-f]{64}')
+# <sha256><ext> of a blob or <sha256>-<suffix> of a file made from it
+BLOB_FILE = re.compile(r'(?P<digest>[0-9a-f]{64})(?P<derived>-[^.]*)?(\.[^/]*)?')
+
+
+def get_blob_storage():
+    # FileField(storage=...) callable, the backend is set in settings.STORAGES['blobs']
+    return storages['blobs']
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+        stores each distinct content once, named by the sha256 of its bytes: <upload_to>/ab/cd/<sha256><ext>
+        the upload is hashed while it is streamed to a temporary file, a known blob only gains a reference
+        StoredFileModel counts the references, `delete` removes the file with the last one
+        (`track_file_references` releases the references of deleted rows and replaced files,
+        the same content saved again on the same row keeps an extra one until `reconcile_references`)
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # the final name is chosen from the content in _save
+        return name
+
+    def spool(self, content):
+        """(sha256, size, path of a file with the content, whether the path is a temporary copy)"""
+        digest = hashlib.sha256()
+        if hasattr(content, 'temporary_file_path'):
+            # already on disk (large uploads, apps.job.uploads), hashed in place and linked
+            path = content.temporary_file_path()
+            with open(path, 'rb') as source:
+                for data in iter(lambda: source.read(READ_SIZE), b''):
+                    digest.update(data)
+            return digest.hexdigest(), os.path.getsize(path), path, False
+
+        temp_dir = os.path.join(self.location, '.tmp')
+        os.makedirs(temp_dir, exist_ok=True)
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp:
+            if hasattr(content, 'seek'):
+                content.seek(0)
+            for data in content.chunks(READ_SIZE):
+                if isinstance(data, str):
+                    data = data.encode()
+                digest.update(data)
+                temp.write(data)
+                size += len(data)
+        return digest.hexdigest(), size, temp.name, True
+
+    def _save(self, name, content):
+        digest, size, path, is_copy = self.spool(content)
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()[:16]
+        name = posixpath.join(directory, digest[:2], digest[2:4], digest + extension)
+
+        with transaction.atomic():
+            blob, created = StoredFileModel.objects.select_for_update().get_or_create(
+                name=name, defaults={'size': size}
+            )
+            if not created:
+                StoredFileModel.objects.filter(pk=blob.pk).update(references=F('references') + 1)
+
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                if is_copy:
+                    os.remove(path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                if is_copy:
+                    file_move_safe(path, full_path, allow_overwrite=True)
+                else:
+                    # the source stays with its owner until the row is committed (apps.job.uploads.attach)
+                    self.link(path, full_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(full_path, self.file_permissions_mode)
+        return name
+
+    @staticmethod
+    def link(source, target):
+        """hard link `source` to `target`, copied when they are on different file systems"""
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, f'{target}.tmp')
+            os.replace(f'{target}.tmp', target)
+
+    def delete(self, name):
+        if not name:
+            return
+        with transaction.atomic():
+            blob = StoredFileModel.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                # files stored before deduplication have no row and a single reference
+                return super().delete(name)
+            if blob.references > 1:
+                StoredFileModel.objects.filter(pk=blob.pk).update(references=F('references') - 1)
+                return
+            blob.delete()
+            self.remove(name)
+
+    @staticmethod
+    def is_blob_name(name):
+        return bool(BLOB_NAME.fullmatch(os.path.splitext(posixpath.basename(name))[0]))
+
+    def remove(self, name):
+        """the file of the blob `name` and the files made from it, whatever its references"""
+        super().delete(name)
+        if self.is_blob_name(name):
+            # avatar variants, named after the blob (apps.account.thumbnails)
+            from apps.account.thumbnails import get_variant_names
+
+            for derived in get_variant_names(name):
+                super().delete(derived)
+
+
+    def sweep(self, before):
+        """
+            remove blob files without a StoredFileModel row (left by rolled back saves), the files made from them
+            and spooled temporary files, all modified before `before` (timestamp), returns their number
+        """
+        known = {os.path.splitext(name)[0] for name in StoredFileModel.objects.values_list('name', flat=True)}
+        removed = 0
+        for root, _dirs, files in os.walk(self.location):
+            directory = os.path.relpath(root, self.location).replace(os.sep, '/')
+            old = {filename for filename in files if os.path.getmtime(os.path.join(root, filename)) < before}
+            if directory == '.tmp':
+                for filename in old:
+                    super().delete(posixpath.join(directory, filename))
+                removed += len(old)
+                continue
+
+            matches = [(filename, BLOB_FILE.fullmatch(filename)) for filename in files]
+            # only <upload_to>/ab/cd/<sha256>..., other files of the location are not blobs
+            matches = [
+                (filename, match) for filename, match in matches
+                if match and directory.endswith(f'{match["digest"][:2]}/{match["digest"][2:4]}')
+                and posixpath.join(directory, match['digest']) not in known
+            ]
+            # blobs first, their derived files are kept while a recent blob is kept
+            kept = {match['digest'] for filename, match in matches if not match['derived']}
+            for filename, match in sorted(matches, key=lambda item: bool(item[1]['derived'])):
+                name = posixpath.join(directory, filename)
+                if filename not in old:
+                    continue
+                if not match['derived']:
+                    if self.remove_orphan(name):
+                        kept.discard(match['digest'])
+                        removed += 1
+                elif match['digest'] not in kept:
+                    super().delete(name)
+                    removed += 1
+        return removed
+
+    def remove_orphan(self, name):
+        """remove the blob `name` unless a save created its row meanwhile"""
+        with transaction.atomic():
+            # the row locks the name, a concurrent _save waits and then stores the file again
+            blob, created = StoredFileModel.objects.select_for_update().get_or_create(
+                name=name, defaults={'size': 0, 'references': 0}
+            )
+            if not created:
+                return False
+            blob.delete()
+            self.remove(name)
+        return True
+
+
+def track_file_references(model, *fields):
+    """
+        release the stored file of `fields` when a row is deleted or its file replaced,
+        once the transaction commits (a rolled back delete keeps its file)
+    """
+
+    def get_names(instance):
+        deferred = instance.get_deferred_fields()
+        return {field: getattr(instance, field).name for field in fields if field not in deferred}
+
+    def release(instance, field, name):
+        storage = instance._meta.get_field(field).storage
+        transaction.on_commit(lambda: storage.delete(name))
+
+    def remember(sender, instance, *args, **kwargs):
+        instance._stored_files = get_names(instance) if instance.pk else {}
+
+    def release_replaced(sender, instance, *args, **kwargs):
+        names = get_names(instance)
+        for field, old_name in instance._stored_files.items():
+            if old_name and old_name != names.get(field, old_name):
+                release(instance, field, old_name)
+        instance._stored_files = names
+
+    def release_deleted(sender, instance, *args, **kwargs):
+        for field, name in get_names(instance).items():
+            if name:
+                release(instance, field, name)
+
+    post_init.connect(remember, sender=model, weak=False)
+    post_save.connect(release_replaced, sender=model, weak=False)
+    post_delete.connect(release_deleted, sender=model, weak=False)
+
+
+def get_blob_fields():
+    """(model, field name) of every file field stored by ContentAddressedStorage"""
+    return [
+        (model, field.name)
+        for model in apps.get_models() for field in model._meta.get_fields()
+        if isinstance(field, FileField) and isinstance(field.storage, ContentAddressedStorage)
+    ]
+
+
+def store_legacy_files(model, field):
+    """
+        move files of `field` saved before content addressing into the blob store,
+        returns (moved rows, missing files)
+    """
+    storage = model._meta.get_field(field).storage
+    known = set(StoredFileModel.objects.values_list('name', flat=True))
+    moved = missing = 0
+    rows = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True}).values_list('pk', field)
+    for pk, name in rows.iterator():
+        if name in known:
+            continue
+        if not storage.exists(name):
+            missing += 1
+            continue
+        with storage.open(name) as content:
+            new_name = storage.save(name, content)
+        # queryset update, the legacy name is released below and not by track_file_references
+        model.objects.filter(pk=pk).update(**{field: new_name})
+        known.add(new_name)
+        storage.delete(name)
+        moved += 1
+    return moved, missing
+
+
+def reconcile_references(grace=timedelta(hours=1)):
+    """
+        set the references of every blob to the number of rows pointing to it,
+        blobs without rows stored more than `grace` ago are deleted,
+        then files without a blob row are swept (see ContentAddressedStorage.sweep),
+        returns (updated, deleted, swept)
+    """
+    counts = Counter()
+    for model, field in get_blob_fields():
+        counts.update(model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+                      .values_list(field, flat=True).iterator())
+
+    storage = get_blob_storage()
+    updated = deleted = 0
+    for blob in StoredFileModel.objects.iterator():
+        references = counts.get(blob.name, 0)
+        if references:
+            if references != blob.references:
+                StoredFileModel.objects.filter(pk=blob.pk).update(references=references)
+                updated += 1
+        elif blob.created_at < timezone.now() - grace:
+            # a recent blob may belong to an upload whose row is not committed yet
+            with transaction.atomic():
+                StoredFileModel.objects.filter(pk=blob.pk).delete()
+                storage.remove(blob.name)
+            deleted += 1
+    swept = storage.sweep((timezone.now() - grace).timestamp())
+    return updated, deleted, swept
@@ -1,6 +1,7 @@
 from django.utils.translation import gettext as _
 from django.utils import timezone
 from datetime import datetime
+import re
 from os.path import splitext
 from django.contrib import messages
 import jdatetime
@@ -113,3 +114,32 @@ def send_email(subject, template_name, recipient_list, context, from_email=None)
     email.content_subtype = 'html'  # Set content type to HTML
     # Send email
     email.send()
+
+
+# Persian text normalization (arabic letters, digits, diacritics, half-space)
+PERSIAN_TRANSLATION = str.maketrans({
+    'ي': 'ی', 'ى': 'ی', 'ك': 'ک', 'ة': 'ه', 'ۀ': 'ه', 'أ': 'ا', 'إ': 'ا', 'ٱ': 'ا',
+    **{chr(0x06F0 + i): str(i) for i in range(10)},
+    **{chr(0x0660 + i): str(i) for i in range(10)},
+    '\u200c': ' ', 'ـ': None,
+    **{chr(code): None for code in range(0x064B, 0x0653)},
+})
+
+
+def normalize_text(text):
+    if not text:
+        return ''
+    return ' '.join(text.translate(PERSIAN_TRANSLATION).lower().split())
+
+
+# Word tokenizer on top of `normalize_text`
+TOKEN_RE = re.compile(r'[^\W_]{2,}')
+
+STOP_WORDS = {
+    'and', 'or', 'the', 'of', 'in', 'on', 'for', 'to', 'with', 'a', 'an', 'is', 'are', 'be',
+    'و', 'در', 'به', 'از', 'با', 'که', 'را', 'این', 'آن', 'برای', 'یا', 'است', 'هست', 'می', 'ها', 'های',
+}
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(normalize_text(text)) if token not in STOP_WORDS]
@@ -1,7 +1,36 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.contrib import messages
 from django.core.paginator import Paginator
+from django.db.models import Count, Max, QuerySet
+from django.http import Http404, QueryDict
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language, gettext_lazy as _
 from rest_framework.response import Response
 from rest_framework import status
 
+from apps.core.exceptions import FieldIsNotValid
+from apps.core.pagination import CursorPaginator, InvalidCursor
+
+
+def make_etag(value):
+    """quoted strong ETag of a json serializable value"""
+    key = json.dumps(value, default=str, separators=(',', ':'))
+    return quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+
+
+def copy_request_data(data):
+    # QueryDict.copy() deep copies the values, which fails for uploads spooled to temporary files
+    if isinstance(data, QueryDict):
+        copied = QueryDict(mutable=True)
+        for key, values in data.lists():
+            copied.setlist(key, list(values))
+        return copied
+    return data.copy()
+
 
 class ViewMixin:
     serializer = None
@@ -15,13 +44,17 @@ class ViewMixin:
             return self.serializer_response
         return self.serializer
 
+    def get_not_modified_response(self, objects, *state):
+        # see ConditionalResponseMixin
+        return None
+
 
 class CreateViewMixin(ViewMixin):
     validated_data = None
     obj = None
 
     def create(self, request, response=True, *args, **kwargs):
-        data = request.data.copy()
+        data = copy_request_data(request.data)
         # add request to serializer data
         self.data = data
         data['request'] = request
@@ -60,7 +93,7 @@ class UpdateViewMixin(ViewMixin):
     obj = None
 
     def update(self, request, response=True, *args, **kwargs):
-        data = request.data.copy()
+        data = copy_request_data(request.data)
         # add request to serializer data
         self.data = data
         data['request'] = request
@@ -91,6 +124,9 @@ class UpdateViewMixin(ViewMixin):
 class ListViewMixin(ViewMixin):
     page_size = 20
     query_params = None
+    # keyset pagination on (created_at, id), see apps.core.pagination
+    cursor_pagination = False
+    cursor_ordering = '-created_at'
 
     def list(self, request, response=True, *args, **kwargs):
         serializer = self.get_serializer()
@@ -100,9 +136,21 @@ class ListViewMixin(ViewMixin):
             self.query_params = serializer.validated_data
         else:
             self.query_params = request.data
-        query_set = self.get_queryset() or []
-        paginator = Paginator(query_set, self.page_size)
-        page = self.get_page(paginator)
+        query_set = self.get_queryset()
+        if query_set is None:
+            query_set = []
+        if self.cursor_pagination:
+            paginator = CursorPaginator(query_set, self.page_size, self.cursor_ordering)
+            page = self.get_cursor_page(paginator)
+            paginator = page
+        else:
+            paginator = Paginator(query_set, self.page_size)
+            page = self.get_page(paginator)
+        if response:
+            state = (page.next_cursor, page.previous_cursor) if self.cursor_pagination else (paginator.count, page.number)
+            not_modified = self.get_not_modified_response(page.object_list, *state)
+            if not_modified is not None:
+                return not_modified
         serializer_resp_data = {
             'paginator': paginator,
             'data': page.object_list
@@ -115,6 +163,12 @@ class ListViewMixin(ViewMixin):
     def get_page(self, paginator):
         return paginator.get_page(self.query_params.get('page', 1))
 
+    def get_cursor_page(self, paginator):
+        try:
+            return paginator.page(self.query_params.get('cursor'))
+        except InvalidCursor as e:
+            raise FieldIsNotValid(e, message=_('Cursor is not valid'))
+
     def get_queryset(self):
         return None
 
@@ -148,6 +202,10 @@ class DetailViewMixin(ViewMixin):
             serializer.is_valid(raise_exception=True)
             self.validated_data = serializer.validated_data
         instance = self.get_instance()
+        if response:
+            not_modified = self.get_not_modified_response([instance])
+            if not_modified is not None:
+                return not_modified
         ser_resp_data = self.get_serializer_response()(instance).data
         if response:
             return Response(ser_resp_data, status=status.HTTP_200_OK)
@@ -161,6 +219,132 @@ class CreateOrUpdateViewMixin(CreateViewMixin, UpdateViewMixin):
     pass
 
 
+class ConditionalResponseMixin:
+    """
+        ETag of api views using List/DetailViewMixin, built from (pk, updated_at) of the returned objects
+        a GET with a matching If-None-Match gets 304 without running the serializer
+        payload parts that depend on other rows (e.g. the current user) go to `get_etag_extra`
+    """
+    etag = None
+    # related objects serialized into the payload, their `updated_at` is part of the ETag too
+    etag_related = ()
+
+    def get_etag_stamp(self, obj):
+        related = (getattr(obj, name) for name in self.etag_related)
+        return [obj.pk, obj.updated_at.isoformat(), *(rel.updated_at.isoformat() for rel in related if rel)]
+
+    def get_etag_extra(self):
+        return None
+
+    def get_not_modified_response(self, objects, *state):
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        stamps = [self.get_etag_stamp(obj) for obj in objects]
+        self.etag = make_etag([stamps, state, self.get_etag_extra()])
+        return get_conditional_response(self.request, etag=self.etag)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.etag and response.status_code in (200, 304):
+            response['ETag'] = self.etag
+            # responses are per user, clients always revalidate
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ('Authorization',))
+        return response
+
+
+class ConditionalGetMixin:
+    """
+        conditional GET for template views (ETag / Last-Modified, 304 Not Modified)
+        the validator is one aggregate query (Max of `conditional_fields`, row count) over
+        `get_conditional_queryset()`, taken before the object and the context are built,
+        plus the user, language, csrf cookie and CONDITIONAL_GET_CONFIG['VERSION']
+        `conditional_fields` are lookups or aggregate expressions, e.g. 'employer__updated_at'
+        responses with pending flash messages are always rendered
+    """
+    conditional_fields = ('updated_at',)
+
+    def get_conditional_queryset(self):
+        # detail views: only the requested object
+        queryset = self.get_queryset()
+        pk = self.kwargs.get(getattr(self, 'pk_url_kwarg', 'pk'))
+        return queryset.filter(pk=pk) if pk is not None else queryset
+
+    def get_conditional_fields(self):
+        return self.conditional_fields
+
+    def get_conditional_extra(self):
+        # cheap page inputs that are not in the queryset (e.g. cached per user state)
+        return None
+
+    def get_validators(self):
+        """(etag, last modified timestamp) or None when the response must be rendered"""
+        if not settings.CONDITIONAL_GET_CONFIG['ENABLED'] or len(messages.get_messages(self.request)):
+            return None
+
+        aggregates = {
+            f'field_{i}': Max(field) if isinstance(field, str) else field
+            for i, field in enumerate(self.get_conditional_fields())
+        }
+        state = self.get_conditional_queryset().aggregate(count=Count('pk', distinct=True), **aggregates)
+        if not state['count']:
+            # 404 or empty list, nothing worth validating
+            return None
+
+        user = self.request.user
+        stamps = [value for value in state.values() if hasattr(value, 'timestamp')]
+        if user.is_authenticated:
+            stamps.append(user.updated_at)
+
+        etag = make_etag([
+            state, self.get_conditional_extra(), user.pk, getattr(user, 'updated_at', None), get_language(),
+            self.request.COOKIES.get(settings.CSRF_COOKIE_NAME), settings.CONDITIONAL_GET_CONFIG['VERSION'],
+        ])
+        return etag, max(stamps).timestamp() if stamps else None
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = validators
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+            # pages are per user, browsers revalidate on every visit
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ('Cookie',))
+        return response
+
+
+class CursorPaginationMixin:
+    """
+        opt-in keyset pagination for generic ListView (`?cursor=`)
+        querysets not ordered by `cursor_ordering` keep page-number pagination
+    """
+    cursor_ordering = '-created_at'
+    cursor_kwarg = 'cursor'
+
+    def use_cursor_pagination(self, queryset):
+        return isinstance(queryset, QuerySet) and queryset.query.order_by[:1] == (self.cursor_ordering,)
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination(queryset):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(queryset, page_size, self.cursor_ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404(_('Invalid cursor.'))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
 class FilterByDateViewMixin:
     query_params = None
 
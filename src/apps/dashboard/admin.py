@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import DailyStatModel
+
+
+@admin.register(DailyStatModel)
+class DailyStatAdmin(admin.ModelAdmin):
+    list_display = ('date', 'metric', 'dimension', 'value')
+    list_filter = ('metric', 'dimension')
+    date_hierarchy = 'date'
+    readonly_fields = ('created_at', 'updated_at')
@@ -6,3 +6,6 @@ class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.dashboard'
     verbose_name = _('Dashboard')
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,229 @@
+import logging
+from collections import Counter, defaultdict
+
+import redis
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
+
+from apps.core.redis_utils import redis_manager
+from apps.job.enums import STATUS
+from apps.job.models import JobModel, ApplicationModel
+
+
+logger = logging.getLogger(__name__)
+
+SITE = 'site'
+EMPLOYER = 'employer'
+SEEKER = 'seeker'
+
+# Only increments hashes that exist, a missing hash is rebuilt from the database on read
+INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 1, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+# Deltas
+def job_counts(employer_id, is_approved, is_closed):
+    """counters one job contributes to"""
+    return {
+        (EMPLOYER, employer_id): {'jobs_count': 1},
+        (SITE, None): {
+            'pending_jobs': int(not is_approved),
+            'active_jobs': int(is_approved and not is_closed),
+        },
+    }
+
+
+def application_counts(employer_id, seeker_id, status):
+    return {
+        (EMPLOYER, employer_id): {
+            'applications_count': 1,
+            'accepted_count': int(status == STATUS.ACCEPTED),
+        },
+        (SEEKER, seeker_id): {
+            'applied_count': 1,
+            'accepted_count': int(status == STATUS.ACCEPTED),
+            'rejected_count': int(status == STATUS.REJECTED),
+        },
+        (SITE, None): {'applications_count': 1},
+    }
+
+
+def user_counts():
+    return {(SITE, None): {'users_count': 1}}
+
+
+def diff_counts(new=None, old=None):
+    """{(scope, owner id): {field: delta}} turning the `old` counts into the `new` ones"""
+    deltas = defaultdict(Counter)
+    for counts, sign in ((new, 1), (old, -1)):
+        for scope, fields in (counts or {}).items():
+            for field, value in fields.items():
+                deltas[scope][field] += sign * value
+    return {
+        scope: {field: value for field, value in fields.items() if value}
+        for scope, fields in deltas.items() if any(fields.values())
+    }
+
+
+def merge_counts(*deltas):
+    """sum of several `diff_counts` results"""
+    merged = defaultdict(Counter)
+    for delta in deltas:
+        for scope, fields in delta.items():
+            merged[scope].update(fields)
+    return {
+        scope: {field: value for field, value in fields.items() if value}
+        for scope, fields in merged.items() if any(fields.values())
+    }
+
+
+class DashboardCounters:
+    """
+        dashboard numbers kept in redis hashes, one per scope (site, employer, seeker)
+        signals (apps.dashboard.signals) apply deltas after commit, reading a dashboard is one HGETALL
+        a missing hash is counted from the database and stored,
+        `reconcile_dashboard_counters` command recomputes every hash from scratch
+    """
+    fields = {
+        SITE: ('pending_jobs', 'active_jobs', 'users_count', 'applications_count'),
+        EMPLOYER: ('jobs_count', 'applications_count', 'accepted_count'),
+        SEEKER: ('applied_count', 'accepted_count', 'rejected_count'),
+    }
+
+    def __init__(self, config):
+        self.config = config
+        self.prefix = config.get('PREFIX', 'dashboard')
+        self._increment = None
+
+    @property
+    def conn(self):
+        return redis_manager.get_conn()
+
+    def key(self, scope, owner_id=None):
+        return f'{self.prefix}:{scope}' if owner_id is None else f'{self.prefix}:{scope}:{owner_id}'
+
+    # Database
+    def count(self, scope, owner_id=None):
+        if scope == SITE:
+            return {
+                'pending_jobs': JobModel.objects.filter(is_approved=False).count(),
+                'active_jobs': JobModel.objects.filter(is_approved=True, is_closed=False).count(),
+                'users_count': get_user_model().objects.count(),
+                'applications_count': ApplicationModel.objects.count(),
+            }
+        if scope == EMPLOYER:
+            applications = ApplicationModel.objects.filter(job__employer_id=owner_id)
+            return {
+                'jobs_count': JobModel.objects.filter(employer_id=owner_id).count(),
+                'applications_count': applications.count(),
+                'accepted_count': applications.filter(status=STATUS.ACCEPTED).count(),
+            }
+        applications = ApplicationModel.objects.filter(seeker_id=owner_id)
+        return {
+            'applied_count': applications.count(),
+            'accepted_count': applications.filter(status=STATUS.ACCEPTED).count(),
+            'rejected_count': applications.filter(status=STATUS.REJECTED).count(),
+        }
+
+    def count_all(self):
+        """{(scope, owner id): counters} of every scope with at least one row"""
+        counts = defaultdict(lambda: defaultdict(int))
+        counts[(SITE, None)].update(self.count(SITE))
+
+        for employer_id, total in JobModel.objects.values_list('employer_id').annotate(total=Count('id')).order_by():
+            counts[(EMPLOYER, employer_id)]['jobs_count'] = total
+
+        rows = (ApplicationModel.objects
+                .values_list('job__employer_id', 'seeker_id', 'status')
+                .annotate(total=Count('id')).order_by())
+        for employer_id, seeker_id, status, total in rows:
+            employer, seeker = counts[(EMPLOYER, employer_id)], counts[(SEEKER, seeker_id)]
+            employer['applications_count'] += total
+            seeker['applied_count'] += total
+            if status == STATUS.ACCEPTED:
+                employer['accepted_count'] += total
+                seeker['accepted_count'] += total
+            elif status == STATUS.REJECTED:
+                seeker['rejected_count'] += total
+
+        return {
+            (scope, owner_id): {field: values.get(field, 0) for field in self.fields[scope]}
+            for (scope, owner_id), values in counts.items()
+        }
+
+    # Redis
+    def get(self, scope, owner_id=None):
+        key = self.key(scope, owner_id)
+        try:
+            values = self.conn.hgetall(key)
+            if values:
+                return {field.decode(): int(value) for field, value in values.items()}
+            values = self.count(scope, owner_id)
+            self.conn.hset(key, mapping=values)
+            return values
+        except redis.RedisError as e:
+            logger.warning('Dashboard counters unavailable: %s', e)
+            return self.count(scope, owner_id)
+
+    def apply(self, deltas):
+        if self._increment is None:
+            self._increment = self.conn.register_script(INCREMENT_SCRIPT)
+        pipe = self.conn.pipeline(transaction=False)
+        for (scope, owner_id), fields in deltas.items():
+            args = [item for field, value in fields.items() for item in (field, value)]
+            self._increment(keys=[self.key(scope, owner_id)], args=args, client=pipe)
+        pipe.execute()
+
+    def add(self, deltas):
+        """apply `deltas` once the current transaction commits"""
+        if not deltas:
+            return
+
+        def apply():
+            try:
+                self.apply(deltas)
+            except redis.RedisError as e:
+                # drop the hashes, they are counted again on the next read
+                logger.warning('Could not update dashboard counters: %s', e)
+                self.invalidate(*deltas)
+
+        transaction.on_commit(apply)
+
+    def reset(self, *scopes):
+        """drop the hashes of `scopes` once the current transaction commits"""
+        transaction.on_commit(lambda: self.invalidate(*scopes))
+
+    def invalidate(self, *scopes):
+        try:
+            self.conn.delete(*(self.key(scope, owner_id) for scope, owner_id in scopes))
+        except redis.RedisError:
+            pass
+
+    def reconcile(self):
+        """rewrite every hash from database counts, hashes of owners without rows are removed"""
+        counts = self.count_all()
+        keys = {self.key(scope, owner_id): values for (scope, owner_id), values in counts.items()}
+
+        pipe = self.conn.pipeline(transaction=False)
+        for key, values in keys.items():
+            pipe.hset(key, mapping=values)
+        stale = [
+            key for key in self.conn.scan_iter(match=f'{self.prefix}:*', count=1000)
+            if key.decode() not in keys
+        ]
+        if stale:
+            pipe.delete(*stale)
+        pipe.execute()
+        return len(keys), len(stale)
+
+
+dashboard_counters = DashboardCounters(settings.DASHBOARD_COUNTERS_CONFIG)
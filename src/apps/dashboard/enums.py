@@ -0,0 +1,11 @@
+from django.utils.translation import gettext_lazy as _
+from django.db.models import TextChoices
+
+
+class DailyMetric(TextChoices):
+
+    NEW_USERS = 'new_users', _('New users')
+    JOBS_POSTED = 'jobs_posted', _('Jobs posted')
+    JOBS_APPROVED = 'jobs_approved', _('Jobs approved')
+    JOBS_CLOSED = 'jobs_closed', _('Jobs closed')
+    APPLICATIONS = 'applications', _('Applications')
@@ -0,0 +1,252 @@
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, DurationField, ExpressionWrapper, F, Q, Sum, Value, When
+from django.db.models.functions import TruncDate
+
+from apps.core.redis_utils import redis_manager
+from apps.job.enums import STATUS
+from apps.job.models import JobModel, ApplicationModel
+
+
+logger = logging.getLogger(__name__)
+
+# marks a computed hash, an employer without applications still gets one
+READY = '-'
+
+
+def to_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def decision_time():
+    return Sum(ExpressionWrapper(F('decided_at') - F('created_at'), output_field=DurationField()))
+
+
+class EmployerFunnel:
+    """
+        per job funnel of an employer (views -> applications -> accepted / rejected, time to decision)
+        application aggregates are kept in two redis hashes per employer, one entry per job and per day,
+        apps.dashboard.signals marks changed jobs / days dirty and a read aggregates only those again
+        job views are buffered in a redis hash and added to JobModel.views_count by `flush_job_views` command
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.prefix = config.get('PREFIX', 'funnel')
+        self.views_key = f'{self.prefix}:views'
+
+    @property
+    def conn(self):
+        return redis_manager.get_conn()
+
+    @property
+    def days(self):
+        return self.config.get('DAYS', 30)
+
+    def key(self, employer_id, part):
+        return f'{self.prefix}:{employer_id}:{part}'
+
+    def keys(self, employer_id):
+        return [self.key(employer_id, part) for part in ('jobs', 'days', 'dirty_jobs', 'dirty_days')]
+
+    def window(self):
+        today = date.today()
+        return [today - timedelta(days=offset) for offset in range(self.days - 1, -1, -1)]
+
+    # Views
+    def record_view(self, job_id):
+        try:
+            self.conn.hincrby(self.views_key, job_id, 1)
+        except redis.RedisError as e:
+            logger.warning('Could not record view of job %s: %s', job_id, e)
+
+    def flush_views(self, batch_size=500):
+        """add buffered views to JobModel.views_count, returns the number of updated jobs"""
+        flushing_key = f'{self.views_key}:flushing'
+        if not self.conn.exists(flushing_key):
+            try:
+                self.conn.rename(self.views_key, flushing_key)
+            except redis.ResponseError:
+                # no views since the last flush
+                return 0
+
+        views = [(int(job_id), int(count)) for job_id, count in self.conn.hgetall(flushing_key).items()]
+        for start in range(0, len(views), batch_size):
+            batch = views[start:start + batch_size]
+            job_ids = [job_id for job_id, _ in batch]
+            with transaction.atomic():
+                # one UPDATE per batch
+                JobModel.objects.filter(pk__in=job_ids).update(views_count=F('views_count') + Case(
+                    *(When(pk=job_id, then=Value(count)) for job_id, count in batch), default=Value(0)
+                ))
+                # a committed batch leaves the claimed hash, a crashed flush retries only the others
+                # (redis removes the hash with its last field)
+                transaction.on_commit(lambda job_ids=job_ids: self.conn.hdel(flushing_key, *job_ids))
+        return len(views)
+
+    # Database
+    @staticmethod
+    def aggregate_jobs(employer_id, job_ids=None):
+        """{job id: counters} of jobs with applications, grouped in one query"""
+        applications = ApplicationModel.objects.filter(job__employer_id=employer_id)
+        if job_ids is not None:
+            applications = applications.filter(job_id__in=job_ids)
+        rows = applications.values('job_id').annotate(
+            applications=Count('id'),
+            accepted=Count('id', filter=Q(status=STATUS.ACCEPTED)),
+            rejected=Count('id', filter=Q(status=STATUS.REJECTED)),
+            decided=Count('decided_at'),
+            decision_time=decision_time(),
+        ).order_by()
+        return {
+            row.pop('job_id'): {**row, 'decision_time': row['decision_time'].total_seconds() if row['decided'] else 0}
+            for row in rows
+        }
+
+    @staticmethod
+    def aggregate_days(employer_id, days):
+        """{day: counters} of `days`, applications by submit day and decisions by decision day"""
+        start = datetime.combine(min(days), time.min)
+        end = datetime.combine(max(days), time.min) + timedelta(days=1)
+        applications = ApplicationModel.objects.filter(job__employer_id=employer_id)
+        counts = {day: {'applications': 0, 'accepted': 0, 'rejected': 0} for day in days}
+
+        submitted = (applications.filter(created_at__gte=start, created_at__lt=end)
+                     .annotate(day=TruncDate('created_at')).values_list('day').annotate(total=Count('id')).order_by())
+        for day, total in submitted:
+            if to_date(day) in counts:
+                counts[to_date(day)]['applications'] = total
+
+        decided = (applications.filter(decided_at__gte=start, decided_at__lt=end)
+                   .annotate(day=TruncDate('decided_at')).values_list('day', 'status')
+                   .annotate(total=Count('id')).order_by())
+        for day, status, total in decided:
+            if to_date(day) in counts and status in (STATUS.ACCEPTED, STATUS.REJECTED):
+                counts[to_date(day)][status] = total
+
+        return counts
+
+    # Redis
+    def load(self, employer_id):
+        jobs_key, days_key, dirty_jobs_key, dirty_days_key = self.keys(employer_id)
+
+        # read and clear the dirty sets atomically, marks made after this are seen by the next read
+        pipe = self.conn.pipeline(transaction=True)
+        pipe.hgetall(jobs_key)
+        pipe.hgetall(days_key)
+        pipe.smembers(dirty_jobs_key)
+        pipe.smembers(dirty_days_key)
+        pipe.delete(dirty_jobs_key, dirty_days_key)
+        cached_jobs, cached_days, dirty_jobs, dirty_days, _ = pipe.execute()
+
+        jobs = {int(job_id): json.loads(row) for job_id, row in cached_jobs.items() if job_id.decode() != READY}
+        days = {date.fromisoformat(day.decode()): json.loads(row) for day, row in cached_days.items()}
+        window = self.window()
+        pipe = self.conn.pipeline(transaction=False)
+
+        if READY.encode() not in cached_jobs:
+            jobs = self.aggregate_jobs(employer_id)
+            pipe.delete(jobs_key)
+            pipe.hset(jobs_key, mapping={READY: '', **{job_id: json.dumps(row) for job_id, row in jobs.items()}})
+        elif dirty_jobs:
+            job_ids = {int(job_id) for job_id in dirty_jobs}
+            changed = self.aggregate_jobs(employer_id, job_ids)
+            removed = job_ids - changed.keys()
+            for job_id in removed:
+                jobs.pop(job_id, None)
+            jobs.update(changed)
+            if changed:
+                pipe.hset(jobs_key, mapping={job_id: json.dumps(row) for job_id, row in changed.items()})
+            if removed:
+                pipe.hdel(jobs_key, *removed)
+
+        # days entering the window and dirty ones, days leaving it are dropped
+        stale = {date.fromisoformat(day.decode()) for day in dirty_days} | (set(window) - days.keys())
+        stale &= set(window)
+        if stale:
+            changed = self.aggregate_days(employer_id, stale)
+            days.update(changed)
+            pipe.hset(days_key, mapping={day.isoformat(): json.dumps(row) for day, row in changed.items()})
+        expired = days.keys() - set(window)
+        if expired:
+            pipe.hdel(days_key, *(day.isoformat() for day in expired))
+
+        timeout = self.config.get('TIMEOUT', 7 * 24 * 3600)
+        pipe.expire(jobs_key, timeout)
+        pipe.expire(days_key, timeout)
+        pipe.execute()
+        return jobs, {day: days[day] for day in window}
+
+    def get(self, employer_id):
+        """{'jobs': [...], 'days': [...], 'totals': {...}} of the employer's postings, newest job first"""
+        try:
+            applications, days = self.load(employer_id)
+        except redis.RedisError as e:
+            logger.warning('Funnel cache unavailable: %s', e)
+            window = self.window()
+            applications, days = self.aggregate_jobs(employer_id), self.aggregate_days(employer_id, window)
+            days = {day: days[day] for day in window}
+
+        empty = {'applications': 0, 'accepted': 0, 'rejected': 0, 'decided': 0, 'decision_time': 0}
+        totals = {'views': 0, **empty}
+        jobs = []
+        # job details and views are read fresh, one query on the employer job index
+        for job in (JobModel.objects.filter(employer_id=employer_id).order_by('-created_at')
+                    .values('id', 'title', 'views_count', 'is_approved', 'is_closed', 'created_at')):
+            counts = applications.get(job['id'], empty)
+            jobs.append({**job, **counts, **self.rates(job['views_count'], counts)})
+            totals['views'] += job['views_count']
+            for field in empty:
+                totals[field] += counts[field]
+
+        return {
+            'jobs': jobs,
+            'days': [{'day': day, **counts} for day, counts in days.items()],
+            'totals': {**totals, **self.rates(totals['views'], totals)},
+        }
+
+    @staticmethod
+    def rates(views, counts):
+        return {
+            'conversion': round(100 * counts['applications'] / views, 1) if views else None,
+            'acceptance': round(100 * counts['accepted'] / counts['decided'], 1) if counts['decided'] else None,
+            'decision_hours': round(counts['decision_time'] / counts['decided'] / 3600, 1) if counts['decided'] else None,
+        }
+
+    def mark(self, employer_id, job_ids, *days):
+        """aggregate `job_ids` and `days` again on the next read, once the current transaction commits"""
+        days = {to_date(day).isoformat() for day in days if day}
+        jobs_key, days_key, dirty_jobs_key, dirty_days_key = self.keys(employer_id)
+
+        def apply():
+            try:
+                pipe = self.conn.pipeline(transaction=False)
+                pipe.sadd(dirty_jobs_key, *job_ids)
+                if days:
+                    pipe.sadd(dirty_days_key, *days)
+                pipe.expire(dirty_jobs_key, self.config.get('TIMEOUT', 7 * 24 * 3600))
+                pipe.expire(dirty_days_key, self.config.get('TIMEOUT', 7 * 24 * 3600))
+                pipe.execute()
+            except redis.RedisError as e:
+                logger.warning('Could not mark funnel of employer %s: %s', employer_id, e)
+                self.invalidate(employer_id)
+
+        transaction.on_commit(apply)
+
+    def reset(self, employer_id):
+        """drop the employer's hashes once the current transaction commits"""
+        transaction.on_commit(lambda: self.invalidate(employer_id))
+
+    def invalidate(self, employer_id):
+        try:
+            self.conn.delete(*self.keys(employer_id))
+        except redis.RedisError:
+            pass
+
+
+employer_funnel = EmployerFunnel(settings.JOB_FUNNEL_CONFIG)
@@ -0,0 +1,35 @@
+import time
+
+import redis
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.dashboard.funnel import employer_funnel
+
+
+class Command(BaseCommand):
+    help = (
+        'Add job views buffered in redis to JobModel.views_count. '
+        'Run from cron (e.g. every minute), or with --interval as a long running worker.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0, help='Seconds between flushes, 0 flushes once')
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            try:
+                flushed = employer_funnel.flush_views()
+            except redis.RedisError as e:
+                # the claimed views stay in redis and are flushed on the next run
+                if not options['interval']:
+                    raise CommandError(f'Could not flush job views: {e}')
+                self.stderr.write(f'Flush failed: {e}')
+                flushed = 0
+
+            if flushed:
+                self.stdout.write(f'Views of {flushed} jobs flushed')
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
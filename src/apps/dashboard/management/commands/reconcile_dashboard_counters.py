@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.counters import dashboard_counters
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute every dashboard counter hash from the database '
+        '(run periodically, and after bulk updates that bypass model signals)'
+    )
+
+    def handle(self, *args, **options):
+        written, removed = dashboard_counters.reconcile()
+        self.stdout.write(self.style.SUCCESS(f'Done. {written} counter hashes written, {removed} stale removed.'))
@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.dashboard.rollup import rollup_day
+
+
+class Command(BaseCommand):
+    help = (
+        "Aggregate one day of users / jobs / applications into DailyStatModel rows, "
+        "yesterday by default (schedule it daily, e.g. from cron shortly after midnight)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='Day to aggregate (YYYY-MM-DD), defaults to yesterday')
+        parser.add_argument('--days', type=int, default=1, help='Number of days ending at --date (backfill)')
+
+    def handle(self, *args, **options):
+        try:
+            last = date.fromisoformat(options['date']) if options['date'] else date.today() - timedelta(days=1)
+        except ValueError:
+            raise CommandError('--date must be YYYY-MM-DD.')
+
+        for offset in range(options['days'] - 1, -1, -1):
+            day = last - timedelta(days=offset)
+            rows = rollup_day(day)
+            self.stdout.write(f'{day}: {rows} rows')
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStatModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creation Time')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Update Time')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('metric', models.CharField(choices=[('new_users', 'New users'), ('jobs_posted', 'Jobs posted'), ('jobs_approved', 'Jobs approved'), ('jobs_closed', 'Jobs closed'), ('applications', 'Applications')], max_length=32, verbose_name='Metric')),
+                ('dimension', models.CharField(blank=True, default='', max_length=32, verbose_name='Dimension')),
+                ('value', models.PositiveIntegerField(default=0, verbose_name='Value')),
+            ],
+            options={
+                'verbose_name': 'Daily stat',
+                'verbose_name_plural': 'Daily stats',
+                'indexes': [models.Index(fields=['metric', 'date'], name='daily_stat_metric_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'metric', 'dimension'), name='daily_stat_unique')],
+            },
+        ),
+    ]
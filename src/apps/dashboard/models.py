@@ -0,0 +1,28 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+from . import enums
+
+
+class DailyStatModel(BaseModel):
+    METRIC = enums.DailyMetric
+
+    date = models.DateField(_('Date'))
+    metric = models.CharField(_('Metric'), max_length=32, choices=METRIC.choices)
+    # user role / application status, empty for plain totals
+    dimension = models.CharField(_('Dimension'), max_length=32, blank=True, default='')
+    value = models.PositiveIntegerField(_('Value'), default=0)
+
+    class Meta:
+        verbose_name = _('Daily stat')
+        verbose_name_plural = _('Daily stats')
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'metric', 'dimension'], name='daily_stat_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['metric', 'date'], name='daily_stat_metric_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.metric} {self.dimension}: {self.value}"
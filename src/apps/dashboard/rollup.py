@@ -0,0 +1,72 @@
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
+
+from apps.job.models import JobModel, ApplicationModel
+
+from .enums import DailyMetric
+from .models import DailyStatModel
+
+
+def day_range(day):
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+def count_day(day):
+    """{(metric, dimension): value} of `day`, every query is an index range scan over that day only"""
+    start, end = day_range(day)
+    counts = {}
+
+    users = (get_user_model().objects
+             .filter(created_at__gte=start, created_at__lt=end)
+             .values_list('role').annotate(total=Count('id')).order_by())
+    for role, total in users:
+        counts[(DailyMetric.NEW_USERS, role)] = total
+
+    for metric, field in (
+        (DailyMetric.JOBS_POSTED, 'created_at'),
+        (DailyMetric.JOBS_APPROVED, 'approved_at'),
+        (DailyMetric.JOBS_CLOSED, 'closed_at'),
+    ):
+        counts[(metric, '')] = JobModel.objects.filter(**{f'{field}__gte': start, f'{field}__lt': end}).count()
+
+    applications = (ApplicationModel.objects
+                    .filter(created_at__gte=start, created_at__lt=end)
+                    .values_list('status').annotate(total=Count('id')).order_by())
+    for status, total in applications:
+        counts[(DailyMetric.APPLICATIONS, status)] = total
+
+    return counts
+
+
+def rollup_day(day):
+    """(re)write the rollup rows of `day`, safe to run again"""
+    rows = [
+        DailyStatModel(date=day, metric=metric, dimension=dimension, value=value)
+        for (metric, dimension), value in count_day(day).items() if value
+    ]
+    with transaction.atomic():
+        DailyStatModel.objects.filter(date=day).delete()
+        DailyStatModel.objects.bulk_create(rows)
+    return len(rows)
+
+
+def get_daily_stats(days, end=None):
+    """
+        [(date, {metric: total, 'metric:dimension': value}), ...] of the last `days` rolled up days, oldest first
+        reads at most a few rows per day from DailyStatModel
+    """
+    end = end or date.today()
+    start = end - timedelta(days=days)
+    stats = {start + timedelta(days=i): {} for i in range(days)}
+
+    rows = DailyStatModel.objects.filter(date__gte=start, date__lt=end).values_list('date', 'metric', 'dimension', 'value')
+    for day, metric, dimension, value in rows:
+        values = stats[day]
+        values[metric] = values.get(metric, 0) + value
+        if dimension:
+            values[f'{metric}:{dimension}'] = value
+    return list(stats.items())
@@ -0,0 +1,157 @@
+import threading
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_init, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from apps.job.decisions import applications_decided
+from apps.job.models import JobModel, ApplicationModel
+
+from .counters import (
+    dashboard_counters, diff_counts, merge_counts, job_counts, application_counts, user_counts,
+    EMPLOYER, SEEKER, SITE
+)
+from .funnel import employer_funnel
+
+
+User = get_user_model()
+
+JOB_FIELDS = ('employer_id', 'is_approved', 'is_closed')
+APPLICATION_FIELDS = ('job_id', 'seeker_id', 'status')
+FUNNEL_FIELDS = ('job_id', 'status', 'decided_at')
+
+# job id -> employer id of jobs being deleted, their applications are deleted first (cascade)
+_deleting = threading.local()
+
+
+def get_state(instance, fields):
+    # rows loaded with deferred fields are not tracked, reading them would cost a query each
+    if instance.get_deferred_fields().intersection(fields):
+        return None
+    return tuple(getattr(instance, field) for field in fields)
+
+
+def get_employer_id(job_id, application):
+    deleting = getattr(_deleting, 'jobs', {})
+    if job_id in deleting:
+        return deleting[job_id]
+    if application.job_id == job_id:
+        return application.job.employer_id
+    return JobModel.objects.filter(pk=job_id).values_list('employer_id', flat=True).first()
+
+
+def get_application_counts(application, state):
+    job_id, seeker_id, status = state
+    return application_counts(get_employer_id(job_id, application), seeker_id, status)
+
+
+# Job model receivers (Keep employer / site job counters)
+@receiver(post_init, sender=JobModel)
+def job_post_init(sender, instance, *args, **kwargs):
+    instance._counter_state = get_state(instance, JOB_FIELDS) if instance.pk else None
+
+
+@receiver(post_save, sender=JobModel)
+def job_post_save(sender, instance, created, *args, **kwargs):
+    state, old = get_state(instance, JOB_FIELDS), instance._counter_state
+    if state is None or (old is None and not created):
+        # unknown state, counted again on the next read
+        dashboard_counters.reset((EMPLOYER, instance.employer_id), (SITE, None))
+    elif state != old:
+        dashboard_counters.add(diff_counts(job_counts(*state), job_counts(*old) if old else None))
+    instance._counter_state = state
+
+
+@receiver(pre_delete, sender=JobModel)
+def job_pre_delete(sender, instance, *args, **kwargs):
+    if not hasattr(_deleting, 'jobs'):
+        _deleting.jobs = {}
+    _deleting.jobs[instance.pk] = instance.employer_id
+
+
+@receiver(post_delete, sender=JobModel)
+def job_post_delete(sender, instance, *args, **kwargs):
+    getattr(_deleting, 'jobs', {}).pop(instance.pk, None)
+    employer_funnel.reset(instance.employer_id)
+    state = get_state(instance, JOB_FIELDS)
+    if state is None:
+        dashboard_counters.reset((EMPLOYER, instance.employer_id), (SITE, None))
+    else:
+        dashboard_counters.add(diff_counts(old=job_counts(*state)))
+
+
+def mark_funnel(application, old_state=None):
+    # days of the application's submit and old / new decision
+    days = [old_state[-1]] if old_state else []
+    if 'created_at' in application.get_deferred_fields() or 'decided_at' in application.get_deferred_fields():
+        employer_funnel.reset(get_employer_id(application.job_id, application))
+        return
+    employer_funnel.mark(get_employer_id(application.job_id, application), [application.job_id],
+                         application.created_at, application.decided_at, *days)
+    if old_state and old_state[0] != application.job_id:
+        employer_funnel.mark(get_employer_id(old_state[0], application), [old_state[0]])
+
+
+# Application model receivers (Keep employer / seeker / site application counters and the employer funnel)
+@receiver(post_init, sender=ApplicationModel)
+def application_post_init(sender, instance, *args, **kwargs):
+    instance._counter_state = get_state(instance, APPLICATION_FIELDS) if instance.pk else None
+    instance._funnel_state = get_state(instance, FUNNEL_FIELDS) if instance.pk else None
+
+
+@receiver(post_save, sender=ApplicationModel)
+def application_post_save(sender, instance, created, *args, **kwargs):
+    state, old = get_state(instance, APPLICATION_FIELDS), instance._counter_state
+    if state is None or (old is None and not created):
+        dashboard_counters.reset(
+            (EMPLOYER, get_employer_id(instance.job_id, instance)), (SEEKER, instance.seeker_id), (SITE, None)
+        )
+    elif state != old:
+        dashboard_counters.add(diff_counts(
+            get_application_counts(instance, state), get_application_counts(instance, old) if old else None
+        ))
+    instance._counter_state = state
+
+    funnel_state = get_state(instance, FUNNEL_FIELDS)
+    if funnel_state != instance._funnel_state:
+        mark_funnel(instance, instance._funnel_state)
+    instance._funnel_state = funnel_state
+
+
+@receiver(post_delete, sender=ApplicationModel)
+def application_post_delete(sender, instance, *args, **kwargs):
+    state = get_state(instance, APPLICATION_FIELDS)
+    if state is None:
+        dashboard_counters.reset(
+            (EMPLOYER, get_employer_id(instance.job_id, instance)), (SEEKER, instance.seeker_id), (SITE, None)
+        )
+    else:
+        dashboard_counters.add(diff_counts(old=get_application_counts(instance, state)))
+
+    # a deleted job resets the whole funnel
+    if instance.job_id not in getattr(_deleting, 'jobs', {}):
+        mark_funnel(instance)
+
+
+# Bulk decision receiver (queryset updates skip post_save)
+@receiver(applications_decided)
+def applications_decided_receiver(sender, employer_id, decisions, *args, **kwargs):
+    dashboard_counters.add(merge_counts(*(
+        diff_counts(application_counts(employer_id, row['seeker_id'], status),
+                    application_counts(employer_id, row['seeker_id'], row['status']))
+        for row, status in decisions
+    )))
+    employer_funnel.mark(employer_id, {row['job_id'] for row, status in decisions}, date.today())
+
+
+# User model receivers (Keep site user counter)
+@receiver(post_save, sender=User)
+def user_post_save(sender, instance, created, *args, **kwargs):
+    if created:
+        dashboard_counters.add(user_counts())
+
+
+@receiver(post_delete, sender=User)
+def user_post_delete(sender, instance, *args, **kwargs):
+    dashboard_counters.add(diff_counts(old=user_counts()))
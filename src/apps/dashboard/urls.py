@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import DashboardBaseView
+from .views import DashboardBaseView, EmployerFunnelView
 
 app_name = 'apps.dashboard'
 
 urlpatterns = [
     path('', DashboardBaseView.as_view(), name='dashboard'),
+    path('funnel/', EmployerFunnelView.as_view(), name='employer_funnel'),
 ]
\ No newline at end of file
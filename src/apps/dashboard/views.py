@@ -1,14 +1,17 @@
 # apps/dashboard/views.py
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import Paginator
 from django.views.generic import TemplateView
-from django.contrib.auth import get_user_model
+from django.conf import settings
 
-from apps.job.models import JobModel, ApplicationModel
+from apps.job.mixins import JobEmployerRequiredMixin
+from apps.job.models import JobRecommendationModel
 from apps.account.enums import UserRoleEnum
-from apps.job.enums import STATUS
 
-
-User = get_user_model()
+from .counters import dashboard_counters, EMPLOYER, SEEKER, SITE
+from .enums import DailyMetric
+from .funnel import employer_funnel
+from .rollup import get_daily_stats
 
 
 class DashboardBaseView(LoginRequiredMixin, TemplateView):
@@ -31,28 +34,51 @@ class DashboardBaseView(LoginRequiredMixin, TemplateView):
         return context
 
     def get_employer_context(self, user):
-        jobs = JobModel.objects.filter(employer=user)
-        applications = ApplicationModel.objects.filter(job__employer=user)
+        return dashboard_counters.get(EMPLOYER, user.pk)
 
+    def get_jobseeker_context(self, user):
         return {
-            "jobs_count": jobs.count(),
-            "applications_count": applications.count(),
-            "accepted_count": applications.filter(status=STATUS.ACCEPTED).count(),
+            **dashboard_counters.get(SEEKER, user.pk),
+            "recommended_jobs": self.get_recommended_jobs(user),
         }
 
-    def get_jobseeker_context(self, user):
-        applications = ApplicationModel.objects.filter(seeker=user)
+    def get_recommended_jobs(self, user):
+        # stored by `update_job_recommendations` command
+        return list(JobRecommendationModel.objects
+                    .filter(seeker=user, job__is_approved=True, job__is_closed=False)
+                    .exclude(job__applications__seeker=user)
+                    .select_related('job')
+                    .order_by('-score')[:settings.JOB_RECOMMENDATION_CONFIG['TOP_N']])
 
+    def get_admin_context(self):
         return {
-            "applied_count": applications.count(),
-            "accepted_count": applications.filter(status=STATUS.ACCEPTED).count(),
-            "rejected_count": applications.filter(status=STATUS.REJECTED).count(),
+            **dashboard_counters.get(SITE),
+            **self.get_daily_context(),
         }
 
-    def get_admin_context(self):
+    def get_daily_context(self):
+        # precomputed rollups, the page never aggregates the raw tables
+        rows = [
+            (day, [stats.get(metric, 0) for metric in DailyMetric.values])
+            for day, stats in get_daily_stats(settings.DASHBOARD_ROLLUP_CONFIG['DAYS'])
+        ]
         return {
-            "pending_jobs": JobModel.objects.filter(is_approved=False).count(),
-            "active_jobs": JobModel.objects.filter(is_approved=True, is_closed=False).count(),
-            "users_count": User.objects.count(),
-            "applications_count": ApplicationModel.objects.count(),
+            "daily_stats": rows,
+            "daily_metrics": DailyMetric.labels,
         }
+
+
+class EmployerFunnelView(LoginRequiredMixin, JobEmployerRequiredMixin, TemplateView):
+    template_name = 'dashboard/employer_funnel.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        funnel = employer_funnel.get(self.request.user.pk)
+        page = Paginator(funnel['jobs'], settings.JOB_FUNNEL_CONFIG['PAGE_SIZE']).get_page(self.request.GET.get('page'))
+        context.update({
+            'totals': funnel['totals'],
+            'days': funnel['days'],
+            'page_obj': page,
+            'jobs': page.object_list,
+        })
+        return context
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import JobModel, ApplicationModel
+from .models import JobModel, ApplicationModel, JobRecommendationModel
 from django.utils.translation import gettext_lazy as _
 
 
@@ -57,6 +57,7 @@ class ApplicationAdmin(admin.ModelAdmin):
         'status',
         'job__employment_type',
         'job__is_closed',
+        'resume_text_status',
     )
     search_fields = (
         'seeker__email',
@@ -64,7 +65,7 @@ class ApplicationAdmin(admin.ModelAdmin):
         'cover_letter',
     )
     autocomplete_fields = ('seeker', 'job')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'resume_text_status', 'resume_text_attempts')
     ordering = ('-created_at',)
 
     @admin.display(description=_('Seeker'))
@@ -82,3 +83,20 @@ class ApplicationAdmin(admin.ModelAdmin):
     @admin.display(boolean=True, description=_('Is pending'))
     def is_pending_display(self, obj):
         return obj.is_pending()
+
+
+@admin.register(JobRecommendationModel)
+class JobRecommendationAdmin(admin.ModelAdmin):
+    list_display = (
+        'seeker',
+        'job',
+        'score',
+        'created_at',
+    )
+    search_fields = (
+        'seeker__email',
+        'job__title',
+    )
+    autocomplete_fields = ('seeker', 'job')
+    readonly_fields = ('created_at', 'updated_at')
+    ordering = ('seeker', '-score')
@@ -6,3 +6,6 @@ class JobConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.job'
     verbose_name = _('Job')
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+
+from .models import ApplicationModel
+
+
+class JobDetailCache:
+    """
+        per user applied job ids and the employer fragment of JobDetailView (jobs/job_detail.html)
+        invalidated by apps.job.signals on application and employer / profile changes
+    """
+    employer_fragment = 'job_employer'
+
+    def __init__(self, config):
+        self.config = config
+        self.prefix = config.get('PREFIX', 'job_detail')
+
+    @property
+    def fragment_timeout(self):
+        return self.config.get('EMPLOYER_FRAGMENT_TIMEOUT', 3600)
+
+    def _applied_key(self, user_id):
+        return f'{self.prefix}:applied:{user_id}'
+
+    def get_applied_job_ids(self, user):
+        key = self._applied_key(user.pk)
+        job_ids = cache.get(key)
+        if job_ids is None:
+            job_ids = frozenset(ApplicationModel.objects.filter(seeker=user).values_list('job_id', flat=True))
+            cache.set(key, job_ids, timeout=self.config.get('APPLIED_JOBS_TIMEOUT', 3600))
+        return job_ids
+
+    def invalidate_applied_job_ids(self, user_id):
+        # after commit, so a concurrent request can not cache the old state again
+        transaction.on_commit(lambda: cache.delete(self._applied_key(user_id)))
+
+    def invalidate_employer_fragment(self, user_id):
+        transaction.on_commit(lambda: cache.delete(make_template_fragment_key(self.employer_fragment, [user_id])))
+
+
+job_detail_cache = JobDetailCache(settings.JOB_DETAIL_CACHE_CONFIG)
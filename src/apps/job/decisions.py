@@ -0,0 +1,95 @@
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.notification.models import EmailNotificationModel
+
+from .enums import STATUS, PENDING_STATUSES
+from .exceptions import ApplicationNotPending
+from .models import JobModel, ApplicationModel
+
+
+# Sent after applications changed status with a queryset update, which skips post_save
+# kwargs: employer_id, decisions [(application row of `pending_applications`, new status)]
+applications_decided = Signal()
+
+# bulk actions of employers (reject / shortlist)
+BULK_ACTIONS = (STATUS.REJECTED, STATUS.SHORTLISTED)
+MAX_BULK_APPLICATIONS = 500
+
+NOTIFICATIONS = {
+    STATUS.ACCEPTED: (_('Your application was accepted'), _('Your application for "%(title)s" was accepted.')),
+    STATUS.REJECTED: (_('Your application was rejected'), _('Your application for "%(title)s" was rejected.')),
+    STATUS.SHORTLISTED: (_('Your application was shortlisted'),
+                         _('Your application for "%(title)s" was shortlisted.')),
+}
+
+
+def pending_applications(applications):
+    """locked rows of the applications of `applications` waiting for a decision"""
+    return list(applications.filter(status__in=PENDING_STATUSES)
+                .select_for_update(of=('self',))
+                .values('pk', 'job_id', 'job__title', 'seeker_id', 'status'))
+
+
+def decide(employer_id, decisions):
+    """
+        set the status of pending applications, one UPDATE per status
+        and one INSERT for the seekers' notifications, whatever the number of applications
+    """
+    now = timezone.now()
+    for status in {status for row, status in decisions}:
+        ids = [row['pk'] for row, application_status in decisions if application_status == status]
+        ApplicationModel.objects.filter(pk__in=ids).update(
+            status=status, updated_at=now, decided_at=None if status in PENDING_STATUSES else now
+        )
+
+    notifications = []
+    for row, status in decisions:
+        title, description = NOTIFICATIONS[status]
+        notifications.append(EmailNotificationModel(
+            to_user_id=row['seeker_id'], title=title, description=description % {'title': row['job__title']}
+        ))
+    EmailNotificationModel.objects.bulk_create(notifications)
+
+    applications_decided.send(sender=ApplicationModel, employer_id=employer_id, decisions=decisions)
+
+
+def accept_application(application):
+    """
+        accept `application`, reject the other pending applications of its job and close the job
+        the job row is locked, so concurrent decisions on the same job run one after another
+    """
+    with transaction.atomic():
+        job = JobModel.objects.select_for_update().get(pk=application.job_id)
+        pending = pending_applications(ApplicationModel.objects.filter(job=job))
+        if application.pk not in {row['pk'] for row in pending}:
+            raise ApplicationNotPending()
+
+        decide(job.employer_id, [
+            (row, STATUS.ACCEPTED if row['pk'] == application.pk else STATUS.REJECTED)
+            for row in pending
+        ])
+
+        job.is_closed = True
+        job.save(update_fields=['is_closed', 'updated_at'])
+
+    application.status = STATUS.ACCEPTED
+    return application
+
+
+def update_applications(employer, application_ids, status):
+    """
+        reject / shortlist the pending applications among `application_ids` of `employer`'s jobs,
+        ids of other employers and already decided applications are skipped, returns the updated count
+    """
+    if status not in BULK_ACTIONS:
+        raise ValueError(f'{status} is not a bulk action')
+
+    with transaction.atomic():
+        rows = pending_applications(ApplicationModel.objects.filter(pk__in=application_ids, job__employer=employer))
+        decisions = [(row, status) for row in rows if row['status'] != status]
+        if decisions:
+            decide(employer.pk, decisions)
+    return len(decisions)
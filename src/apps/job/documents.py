@@ -2,6 +2,7 @@
 from django_elasticsearch_dsl import Document, Index, fields
 from django_elasticsearch_dsl.registries import registry
 from .models import JobModel
+from .search.filters import normalize_location
 
 job_index = Index('jobs')
 job_index.settings(number_of_shards=1, number_of_replicas=0)
@@ -9,6 +10,13 @@ job_index.settings(number_of_shards=1, number_of_replicas=0)
 
 @registry.register_document
 class JobDocument(Document):
+    id = fields.IntegerField(attr='id')
+    employment_type = fields.KeywordField()
+    # salary range bounds (max / min, each falling back to the other)
+    # `salary` is the upper bound, also used for facets
+    salary = fields.IntegerField()
+    salary_low = fields.IntegerField()
+    location_key = fields.KeywordField()
     employer = fields.ObjectField(properties={
         'id': fields.IntegerField(),
         'email': fields.TextField(),
@@ -19,14 +27,27 @@ class JobDocument(Document):
 
     class Django:
         model = JobModel
+        # index is synced by apps.job.signals through the search backend
+        ignore_signals = True
         fields = [
             'title',
             'description',
             'location',
-            'employment_type',
             'salary_min',
             'salary_max',
             'is_approved',
             'is_closed',
             'created_at',
         ]
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('employer')
+
+    def prepare_salary(self, instance):
+        return instance.salary_max if instance.salary_max is not None else instance.salary_min
+
+    def prepare_salary_low(self, instance):
+        return instance.salary_min if instance.salary_min is not None else instance.salary_max
+
+    def prepare_location_key(self, instance):
+        return normalize_location(instance.location)
@@ -13,6 +13,27 @@ class EmploymentType(TextChoices):
 class STATUS(TextChoices):
 
     SUBMITTED = 'submitted', _('Submitted')
+    SHORTLISTED = 'shortlisted', _('Shortlisted')
     REJECTED = 'rejected', _('Rejected')
     ACCEPTED = 'accepted', _('Accepted')
 
+
+# waiting for the employer's decision
+PENDING_STATUSES = (STATUS.SUBMITTED, STATUS.SHORTLISTED)
+
+
+class ResumeTextStatus(TextChoices):
+
+    PENDING = 'pending', _('Pending')
+    DONE = 'done', _('Done')
+    FAILED = 'failed', _('Failed')
+    SKIPPED = 'skipped', _('Skipped')
+
+
+class SalaryBucket(TextChoices):
+
+    UNDER_10M = 'lt_10m', _('Under 10M')
+    FROM_10M_TO_20M = '10m_20m', _('10M - 20M')
+    FROM_20M_TO_40M = '20m_40m', _('20M - 40M')
+    OVER_40M = 'gte_40m', _('40M and more')
+    NOT_SPECIFIED = 'unspecified', _('Not specified')
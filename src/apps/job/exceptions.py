@@ -0,0 +1,56 @@
+from apps.core.exceptions import APIException
+from django.utils.translation import gettext_lazy as _
+
+
+class JobNotFound(APIException):
+    status_code = 404
+    default_code = 'job_not_found'
+    message = _('Job not found')
+
+
+class ApplicationAlreadyExists(APIException):
+    status_code = 409
+    default_code = 'application_already_exists'
+    message = _('You have already applied for this job.')
+
+
+class ApplicationNotPending(APIException):
+    status_code = 409
+    default_code = 'application_not_pending'
+    message = _('This application has already been decided.')
+
+
+class ResumeNotFound(APIException):
+    status_code = 404
+    default_code = 'resume_not_found'
+    message = _('Resume not found.')
+
+
+class ResumeUploadNotFound(APIException):
+    status_code = 404
+    default_code = 'resume_upload_not_found'
+    message = _('Upload not found or expired.')
+
+
+class ResumeUploadIncomplete(APIException):
+    status_code = 400
+    default_code = 'resume_upload_incomplete'
+    message = _('The resume upload is not finished yet.')
+
+
+class ResumeUploadOffsetMismatch(APIException):
+    status_code = 409
+    default_code = 'resume_upload_offset_mismatch'
+    message = _('Upload offset does not match, resume from the current offset.')
+
+
+class ResumeTooLarge(APIException):
+    status_code = 413
+    default_code = 'resume_too_large'
+    message = _('The resume or chunk is too large.')
+
+
+class UnsupportedResumeType(APIException):
+    status_code = 415
+    default_code = 'unsupported_resume_type'
+    message = _('Only PDF and Word resumes are accepted.')
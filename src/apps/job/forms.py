@@ -2,7 +2,10 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 
+from .decisions import BULK_ACTIONS, MAX_BULK_APPLICATIONS
+from .enums import STATUS
 from .models import JobModel, ApplicationModel
+from .search.filters import SALARY_FROM, SALARY_TO, LOCATION, normalize_location
 
 
 class JobForm(forms.ModelForm):
@@ -40,6 +43,62 @@ class JobForm(forms.ModelForm):
 
 
 class ApplicationForm(forms.ModelForm):
+    # token of a finished chunked upload (jobs/seeker/job_apply.html), instead of `resume`
+    resume_upload = forms.UUIDField(required=False, widget=forms.HiddenInput)
+
     class Meta:
         model = ApplicationModel
         fields = ['cover_letter', 'resume']
+
+
+class IdListField(forms.TypedMultipleChoiceField):
+    # any id is a valid choice, the view scopes them to the user's rows
+    def __init__(self, **kwargs):
+        super().__init__(coerce=int, **kwargs)
+
+    def valid_value(self, value):
+        return str(value).isdigit()
+
+
+class ApplicationBulkActionForm(forms.Form):
+    # selected applications of EmployerApplicationListView
+    action = forms.ChoiceField(choices=[(status, STATUS(status).label) for status in BULK_ACTIONS])
+    applications = IdListField(error_messages={'required': _('Select at least one application.')})
+
+    def clean_applications(self):
+        applications = self.cleaned_data['applications']
+        if len(applications) > MAX_BULK_APPLICATIONS:
+            raise forms.ValidationError(
+                _('Select at most %(max)s applications.') % {'max': MAX_BULK_APPLICATIONS}
+            )
+        return applications
+
+
+class JobSearchForm(forms.Form):
+    # GET filters of JobListView, invalid values are ignored instead of shown as errors
+    q = forms.CharField(required=False, max_length=200)
+    employment_type = forms.ChoiceField(required=False, choices=[('all', _('All'))] + list(JobModel.TYPE.choices))
+    salary_min = forms.IntegerField(required=False, min_value=0, label=_('Salary min'))
+    salary_max = forms.IntegerField(required=False, min_value=0, label=_('Salary max'))
+    location = forms.CharField(required=False, max_length=100, label=_('Location'))
+
+    def get_value(self, name):
+        # cleaned_data only keeps the valid fields
+        self.is_valid()
+        value = self.cleaned_data.get(name)
+        return None if value in ('', None) else value
+
+    def get_filters(self):
+        """search backend filters, salary bounds match jobs whose salary range overlaps them"""
+        filters = {'is_approved': True, 'is_closed': False}
+
+        employment_type = self.get_value('employment_type')
+        if employment_type and employment_type != 'all':
+            filters['employment_type'] = employment_type
+        if self.get_value('salary_min') is not None:
+            filters[SALARY_FROM] = self.get_value('salary_min')
+        if self.get_value('salary_max') is not None:
+            filters[SALARY_TO] = self.get_value('salary_max')
+        if self.get_value('location'):
+            filters[LOCATION] = normalize_location(self.get_value('location'))
+        return filters
@@ -0,0 +1,55 @@
+import random
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+
+from apps.account.enums import UserRoleEnum
+from apps.job.models import JobModel
+
+
+LOCATIONS = ['Tehran', 'Mashhad', 'Isfahan', 'Shiraz', 'Tabriz', 'Karaj', 'Qom', 'Ahvaz', 'Rasht', 'Kerman']
+TITLE_WORDS = ['python', 'django', 'backend', 'frontend', 'react', 'devops', 'data', 'mobile', 'senior', 'junior',
+               'developer', 'engineer', 'designer', 'analyst', 'manager', 'support', 'qa', 'android', 'ios', 'sql']
+# Zipf distributed description vocabulary, like real text a few words are everywhere and most are rare
+DESCRIPTION_WORDS = TITLE_WORDS + [f'skill{i}' for i in range(5000)]
+DESCRIPTION_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(DESCRIPTION_WORDS) + 1)))
+
+
+def get_benchmark_employer():
+    employer, _ = get_user_model().objects.get_or_create(
+        email='benchmark-employer@example.com', defaults={'role': UserRoleEnum.EMPLOYER},
+    )
+    return employer
+
+
+def random_words(rnd, count):
+    return rnd.choices(DESCRIPTION_WORDS, cum_weights=DESCRIPTION_WEIGHTS, k=count)
+
+
+def make_job(employer, rnd):
+    salary_min = rnd.choice([None, rnd.randrange(5, 60) * 1_000_000])
+    salary_max = rnd.choice([None, (salary_min or 5_000_000) + rnd.randrange(0, 30) * 1_000_000])
+    title = ' '.join(rnd.sample(TITLE_WORDS, 3))
+    return JobModel(
+        employer=employer,
+        title=title,
+        description=f'{title} ' + ' '.join(random_words(rnd, 20)),
+        location=rnd.choice(LOCATIONS),
+        employment_type=rnd.choice(JobModel.TYPE.values),
+        salary_min=salary_min,
+        salary_max=salary_max,
+        # roughly the share of active jobs of a live site
+        is_approved=rnd.random() < 0.9,
+        is_closed=rnd.random() < 0.3,
+    )
+
+
+def seed_jobs(count, employer, batch_size=5000, seed=0):
+    """bulk create `count` random jobs, returns the number created"""
+    rnd = random.Random(seed)
+    created = 0
+    while created < count:
+        size = min(batch_size, count - created)
+        JobModel.objects.bulk_create([make_job(employer, rnd) for _ in range(size)], batch_size=batch_size)
+        created += size
+    return created
@@ -0,0 +1,79 @@
+import random
+import statistics
+import time
+import resource
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.job.search.backends import LocalSearchBackend
+from apps.job.search.cache import job_list_cache
+
+from ._seed import make_job, random_words
+
+
+class Command(BaseCommand):
+    help = (
+        'memory footprint and query latency of the in-process inverted index (local search backend), '
+        'jobs are generated in memory, the database is not touched'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--jobs', type=int, default=100_000)
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--page-size', type=int, default=5)
+
+    def build(self, count):
+        rnd = random.Random(0)
+        employer = get_user_model()(email='benchmark-employer@example.com')
+        started = timezone.now()
+
+        backend = LocalSearchBackend(settings.JOB_SEARCH_CONFIG)
+        backend.synced_at = started
+        for pk in range(1, count + 1):
+            job = make_job(employer, rnd)
+            job.pk = pk
+            job.is_approved, job.is_closed = True, False
+            job.created_at = started - timedelta(seconds=count - pk)
+            backend.add(job)
+        # the index is complete, don't let the first query sync with the database
+        backend.built = True
+        backend.generation = job_list_cache.get_generation()
+        return backend
+
+    @staticmethod
+    def percentile(timings, percent):
+        return sorted(timings)[min(len(timings) - 1, int(len(timings) * percent / 100))]
+
+    def handle(self, *args, **options):
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        backend = self.build(options['jobs'])
+        build_time = time.perf_counter() - start
+        # ru_maxrss is in KiB on linux
+        memory = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) * 1024
+
+        self.stdout.write(f'jobs:              {len(backend.index):,}')
+        self.stdout.write(f'tokens:            {len(backend.index.postings):,}')
+        self.stdout.write(f'build:             {build_time:.2f} s')
+        self.stdout.write(f'posting arrays:    {backend.index.memory_usage() / 2 ** 20:.1f} MiB')
+        self.stdout.write(f'index + documents: {memory / 2 ** 20:.1f} MiB (peak rss growth)')
+
+        rnd = random.Random(1)
+        self.stdout.write(f'\n{"query":<12}{"hits":>10}{"median ms":>12}{"p95 ms":>10}{"p99 ms":>10}')
+        for size in (1, 2, 3):
+            timings, hits = [], []
+            for _ in range(options['queries']):
+                query = ' '.join(random_words(rnd, size))
+                start = time.perf_counter()
+                _, total = backend.execute(query, {'is_approved': True, 'is_closed': False}, '-created_at',
+                                           0, options['page_size'])
+                timings.append((time.perf_counter() - start) * 1000)
+                hits.append(total)
+            self.stdout.write(
+                f'{f"{size} token(s)":<12}{int(statistics.mean(hits)):>10,}{statistics.median(timings):>12.2f}'
+                f'{self.percentile(timings, 95):>10.2f}{self.percentile(timings, 99):>10.2f}'
+            )
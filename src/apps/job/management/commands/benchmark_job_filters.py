@@ -0,0 +1,76 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.job.models import JobModel
+from apps.job.search.filters import filter_queryset, SALARY_FROM, SALARY_TO, LOCATION
+
+from ._seed import get_benchmark_employer, seed_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        'seed jobs and compare JobListView filter latency (count + first page) at several table sizes, '
+        'everything runs in one transaction that is rolled back'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--page-size', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--force', action='store_true', help='run even when DEBUG is off')
+
+    def get_filters(self):
+        active = {'is_approved': True, 'is_closed': False}
+        return [
+            ('no filter', active),
+            ('salary overlap', {**active, SALARY_FROM: 20_000_000, SALARY_TO: 30_000_000}),
+            ('salary from', {**active, SALARY_FROM: 50_000_000}),
+            ('location', {**active, LOCATION: 'shiraz'}),
+            ('location + salary', {**active, LOCATION: 'shiraz', SALARY_FROM: 20_000_000, SALARY_TO: 30_000_000}),
+            ('type + salary', {**active, 'employment_type': JobModel.TYPE.REMOTE, SALARY_FROM: 40_000_000}),
+        ]
+
+    def run_query(self, filters, page_size):
+        qs = filter_queryset(JobModel.objects.all(), filters).order_by('-created_at', '-id')
+        start = time.perf_counter()
+        qs.count()
+        list(qs[:page_size])
+        return (time.perf_counter() - start) * 1000
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {JobModel._meta.db_table}')
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('Benchmark seeds up to millions of rows, use --force to run it without DEBUG')
+
+        sizes = sorted(options['sizes'])
+        filters = self.get_filters()
+
+        results = {label: [] for label, _ in filters}
+        with transaction.atomic():
+            employer = get_benchmark_employer()
+            seeded = JobModel.objects.count()
+            for size in sizes:
+                if size > seeded:
+                    self.stderr.write(f'seeding {size - seeded:,} jobs ...')
+                    seeded += seed_jobs(size - seeded, employer, options['batch_size'], seed=size)
+                self.analyze()
+
+                for label, lookup in filters:
+                    # first run warms the cache and is not counted
+                    self.run_query(lookup, options['page_size'])
+                    timings = [self.run_query(lookup, options['page_size']) for _ in range(options['repeat'])]
+                    results[label].append(statistics.median(timings))
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f'{"filter":<20}' + ''.join(f'{size:>14,}' for size in sizes) + '   (median ms)')
+        for label, timings in results.items():
+            self.stdout.write(f'{label:<20}' + ''.join(f'{timing:>14.2f}' for timing in timings))
@@ -0,0 +1,64 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.job.enums import STATUS
+from apps.job.models import JobModel, ApplicationModel
+from apps.job.search.filters import filter_queryset, SALARY_FROM, SALARY_TO, LOCATION
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot job/application queries and fail if any of them scans a whole table'
+
+    def get_queries(self):
+        active_jobs = JobModel.objects.filter(is_approved=True, is_closed=False)
+        return [
+            ('active jobs', active_jobs.order_by('-created_at', '-id')[:5]),
+            ('active jobs by type', active_jobs.filter(employment_type=JobModel.TYPE.REMOTE)
+             .order_by('-created_at', '-id')[:5]),
+            ('active jobs by salary range', filter_queryset(active_jobs, {SALARY_FROM: 20_000_000})),
+            ('active jobs by salary cap', filter_queryset(active_jobs, {SALARY_TO: 10_000_000})),
+            ('active jobs by location', filter_queryset(active_jobs, {LOCATION: 'tehran'})
+             .order_by('-created_at', '-id')[:5]),
+            ('job detail', active_jobs.filter(pk=1)),
+            ('employer jobs', JobModel.objects.filter(employer_id=1).order_by('-created_at', '-id')[:5]),
+            ('employer submitted applications', ApplicationModel.objects
+             .filter(job__employer_id=1, status=STATUS.SUBMITTED).order_by('-created_at')[:5]),
+            ('employer accepted applications', ApplicationModel.objects
+             .filter(job__employer_id=1, status=STATUS.ACCEPTED)),
+            ('seeker applications', ApplicationModel.objects.filter(seeker_id=1).order_by('-created_at', '-id')[:5]),
+        ]
+
+    @staticmethod
+    def has_full_scan(plan, vendor):
+        tables = [JobModel._meta.db_table, ApplicationModel._meta.db_table]
+        for table in tables:
+            if vendor == 'postgresql' and f'Seq Scan on {table}' in plan:
+                return True
+            if vendor == 'sqlite' and re.search(rf'SCAN {table}\b(?! USING)', plan):
+                return True
+        return False
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        failed = []
+
+        with transaction.atomic():
+            if vendor == 'postgresql':
+                # small tables are cheaper to seq scan, force the planner to show index usability
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for label, qs in self.get_queries():
+                plan = qs.explain()
+                if self.has_full_scan(plan, vendor):
+                    failed.append(label)
+                    self.stdout.write(self.style.ERROR(f'[full scan] {label}'))
+                else:
+                    self.stdout.write(self.style.SUCCESS(f'[index] {label}'))
+                if options['verbosity'] > 1:
+                    self.stdout.write(plan)
+
+        if failed:
+            raise CommandError(f'{len(failed)} hot queries do not use an index: {", ".join(failed)}')
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.job.uploads import clear_expired_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete chunked resume uploads not touched for RESUME_UPLOAD_CONFIG["EXPIRE_HOURS"] (run daily from cron)'
+
+    def handle(self, *args, **options):
+        count = clear_expired_uploads()
+        self.stdout.write(self.style.SUCCESS(f'{count} expired uploads deleted'))
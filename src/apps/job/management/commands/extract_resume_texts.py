@@ -0,0 +1,45 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.job.enums import ResumeTextStatus
+from apps.job.resume_text import resume_text_extractor
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker extracting the text of application resumes for the employer search, in a process pool. '
+        'Run a single instance (e.g. under supervisor / systemd), or with --once from cron. '
+        '--backfill queues every resume again (e.g. after installing a new extractor) and drains the queue.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.RESUME_TEXT_CONFIG.get('PROCESSES', 0),
+                            help='Extractor processes, 0 uses every core')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls of an empty queue')
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+        parser.add_argument('--backfill', action='store_true', help='Queue every resume again, implies --once')
+        parser.add_argument('--retry', action='store_true', help='Queue failed and skipped resumes again')
+
+    def handle(self, *args, **options):
+        processes = options['processes'] or os.cpu_count()
+        if options['backfill'] or options['retry']:
+            statuses = None if options['backfill'] else (ResumeTextStatus.FAILED, ResumeTextStatus.SKIPPED)
+            queued = resume_text_extractor.backfill(statuses)
+            self.stdout.write(f'{queued} applications queued')
+
+        once = options['once'] or options['backfill']
+        while True:
+            close_old_connections()
+            results = resume_text_extractor.run(processes)
+            if any(results.values()):
+                self.stdout.write(', '.join(f'{count} {status}' for status, count in results.items()))
+                continue
+            if once:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
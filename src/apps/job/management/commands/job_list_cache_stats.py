@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.job.search.cache import job_list_cache
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the job list result cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after printing them')
+
+    def handle(self, *args, **options):
+        stats = job_list_cache.stats()
+        self.stdout.write(f"generation: {stats['generation']}")
+        self.stdout.write(f"hits: {stats['hits']}")
+        self.stdout.write(f"misses: {stats['misses']}")
+        self.stdout.write(f"hit ratio: {stats['hit_ratio']:.2%}")
+
+        if options['reset']:
+            job_list_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
@@ -0,0 +1,188 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+WATERMARK_KEY = 'job_reindex:watermark'
+
+# Worker process state, the document is created once per worker
+_document = None
+
+
+def _init_worker():
+    global _document
+    from apps.job.documents import JobDocument
+    _document = JobDocument()
+
+
+def _serialize_chunk(jobs):
+    return [(job.pk, _document.prepare(job)) for job in jobs]
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the jobs search index: rows are streamed with a server-side cursor, serialized in a process pool '
+        'and sent with parallel bulk requests into a new index that replaces the old one by an alias swap. '
+        'With --incremental only rows updated after the last run are sent to the live index.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--incremental', action='store_true', help='Only index jobs updated after the watermark')
+        parser.add_argument('--since', help='Watermark for --incremental (ISO datetime), defaults to the last run')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows per cursor fetch / serializer task')
+        parser.add_argument('--bulk-size', type=int, default=1000, help='Documents per bulk request')
+        parser.add_argument('--workers', type=int, default=0, help='Serializer processes, 0 uses every core')
+        parser.add_argument('--threads', type=int, default=4, help='Concurrent bulk requests')
+        parser.add_argument('--keep-old', action='store_true', help='Keep the old index after the alias swap')
+
+    # Pipeline
+    @staticmethod
+    def iter_chunks(queryset, size):
+        chunk = []
+        # iterator() uses a server-side cursor on postgresql
+        for job in queryset.iterator(chunk_size=size):
+            chunk.append(job)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def serialize(chunks, executor, workers):
+        if executor is None:
+            _init_worker()
+            for chunk in chunks:
+                yield from _serialize_chunk(chunk)
+            return
+
+        # keep a bounded number of chunks in flight, results stay in cursor order
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_serialize_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def push(self, client, index, queryset, options):
+        from elasticsearch.helpers import parallel_bulk
+
+        workers = options['workers'] or os.cpu_count()
+        executor = None
+        if workers > 1:
+            # forked workers must not share the parent's database connections
+            connections.close_all()
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+        total = queryset.count()
+        indexed = failed = 0
+        started = time.monotonic()
+        try:
+            documents = self.serialize(self.iter_chunks(queryset, options['chunk_size']), executor, workers)
+            actions = ({'_index': index, '_id': pk, '_source': source} for pk, source in documents)
+            for ok, info in parallel_bulk(client, actions, thread_count=options['threads'],
+                                          chunk_size=options['bulk_size'], raise_on_error=False):
+                if ok:
+                    indexed += 1
+                else:
+                    failed += 1
+                    if failed <= 10:
+                        self.stderr.write(f'Failed: {info}')
+
+                if (indexed + failed) % 50_000 == 0:
+                    rate = (indexed + failed) / (time.monotonic() - started)
+                    self.stdout.write(f'{indexed + failed:,}/{total:,} jobs ({rate:,.0f}/s)')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(f'{indexed:,} jobs indexed into {index} in {elapsed:.1f}s, {failed:,} failed')
+        return indexed, failed
+
+    # Index management
+    @staticmethod
+    def get_alias_indices(client, alias):
+        if not client.indices.exists_alias(name=alias):
+            return []
+        return list(client.indices.get_alias(name=alias).keys())
+
+    def swap_alias(self, client, alias, new_index, keep_old):
+        old_indices = self.get_alias_indices(client, alias)
+        actions = [{'add': {'alias': alias, 'index': new_index}}]
+        if old_indices:
+            actions.append({'remove': {'alias': alias, 'indices': old_indices}})
+        elif client.indices.exists(index=alias):
+            # a concrete index still carries the alias name, replaced in the same atomic request
+            actions.append({'remove_index': {'index': alias}})
+
+        client.indices.update_aliases(actions=actions)
+        self.stdout.write(f"Alias '{alias}' now points to '{new_index}'")
+
+        if old_indices and not keep_old:
+            client.indices.delete(index=','.join(old_indices))
+            self.stdout.write(f"Deleted {', '.join(old_indices)}")
+
+    def rebuild(self, client, document, options):
+        alias = document._index._name
+        new_index = f"{alias}-{timezone.now().strftime('%Y%m%d%H%M%S')}"
+        index = document._index.clone(name=new_index)
+        live_settings = index.to_dict().get('settings', {})
+
+        # no refresh and no replicas while loading, restored before the swap
+        index.settings(refresh_interval='-1', number_of_replicas=0)
+        index.create(using=client)
+        self.stdout.write(f"Created index '{new_index}'")
+
+        started = timezone.now()
+        _, failed = self.push(client, new_index, document().get_queryset(), options)
+        if failed:
+            raise CommandError(f"{failed} jobs failed, alias '{alias}' is unchanged (index '{new_index}' kept)")
+
+        client.indices.put_settings(index=new_index, settings={'index': {
+            'refresh_interval': live_settings.get('refresh_interval', '1s'),
+            'number_of_replicas': live_settings.get('number_of_replicas', 1),
+        }})
+        client.indices.refresh(index=new_index)
+        self.swap_alias(client, alias, new_index, options['keep_old'])
+
+        # rows saved during the rebuild went to the old index, copy them over
+        self.push(client, alias, document().get_queryset().filter(updated_at__gte=started), {**options, 'workers': 1})
+        return started
+
+    def incremental(self, client, document, options):
+        since = parse_datetime(options['since']) if options['since'] else cache.get(WATERMARK_KEY)
+        if since is None:
+            raise CommandError('No watermark yet, run a full reindex first or pass --since.')
+
+        started = timezone.now()
+        # margin for clock skew between app servers
+        queryset = document().get_queryset().filter(updated_at__gte=since - timedelta(seconds=5))
+        self.push(client, document._index._name, queryset, options)
+        return started
+
+    def handle(self, *args, **options):
+        if not apps.is_installed('django_elasticsearch_dsl'):
+            raise CommandError('Elasticsearch is not enabled, set JOB_SEARCH_BACKEND=elasticsearch.')
+
+        from elasticsearch.dsl.connections import connections as es_connections
+        from apps.job.documents import JobDocument
+
+        client = es_connections.get_connection()
+        if options['incremental']:
+            watermark = self.incremental(client, JobDocument, options)
+        else:
+            watermark = self.rebuild(client, JobDocument, options)
+
+        cache.set(WATERMARK_KEY, watermark, timeout=None)
+        self.stdout.write(self.style.SUCCESS(f'Done. Watermark {watermark:%Y-%m-%d %H:%M:%S}'))
@@ -0,0 +1,55 @@
+import time
+
+import redis
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.job.search.backends import get_search_backend, SearchBackendUnavailable
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker writing queued job changes to the search index in bulk batches. '
+        'Run a single instance (e.g. under supervisor / systemd), or with --once from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=1.0,
+                            help='Seconds between polls, edits made meanwhile are coalesced')
+        parser.add_argument('--retry-after', type=float, default=10.0,
+                            help='Seconds to wait when the cluster or redis is unavailable')
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+
+    def drain(self, backend):
+        ids = backend.queue.claim()
+        batch_size = backend.config.get('SYNC_BATCH_SIZE', 500)
+        synced = failed = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            failed += backend.apply(batch)
+            backend.queue.ack(batch)
+            synced += len(batch)
+        return synced, failed
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if getattr(backend, 'queue', None) is None:
+            raise CommandError(f"The '{backend.name}' search backend does not use the sync queue.")
+
+        while True:
+            close_old_connections()
+            try:
+                synced, failed = self.drain(backend)
+            except (SearchBackendUnavailable, redis.RedisError) as e:
+                # claimed ids stay in the processing set and are retried
+                self.stderr.write(f'Sync failed: {e}')
+                if options['once']:
+                    raise CommandError('Search index sync failed.') from e
+                time.sleep(options['retry_after'])
+                continue
+
+            if synced:
+                self.stdout.write(f'{synced} jobs synced, {failed} failed')
+            if options['once']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,24 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.job.recommendation.engine import recommendation_engine
+
+
+class Command(BaseCommand):
+    help = 'Recompute the tf-idf job recommendations of job seekers (incremental unless --full)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Rebuild every seeker instead of the changed ones')
+        parser.add_argument(
+            '--processes', type=int, default=settings.JOB_RECOMMENDATION_CONFIG.get('PROCESSES', 1),
+            help='Worker processes used for scoring, 0 uses every core',
+        )
+
+    def handle(self, *args, **options):
+        processes = options['processes'] or os.cpu_count()
+        stats = recommendation_engine.run(full=options['full'], processes=processes)
+        self.stdout.write(self.style.SUCCESS(
+            'Done ({mode}). {jobs} active jobs, {seekers} seekers updated, {saved} recommendations saved.'.format(**stats)
+        ))
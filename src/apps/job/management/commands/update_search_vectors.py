@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.job.models import JobModel
+from apps.job.search.backends import PostgresSearchBackend
+
+
+class Command(BaseCommand):
+    help = 'Backfill JobModel.search_vector used by the postgres search backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--missing-only', action='store_true', help='Only fill jobs without a vector')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Search vectors are only supported on PostgreSQL.')
+
+        backend = PostgresSearchBackend(settings.JOB_SEARCH_CONFIG)
+        vector = backend.get_vector()
+        batch_size = options['batch_size']
+
+        qs = JobModel.objects.all()
+        if options['missing_only']:
+            qs = qs.filter(search_vector__isnull=True)
+
+        updated = 0
+        last_pk = 0
+        while True:
+            # walk the table by primary key ranges to keep each UPDATE short
+            pks = list(qs.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            updated += JobModel.objects.filter(pk__in=pks).update(search_vector=vector)
+            last_pk = pks[-1]
+            self.stdout.write(f'{updated} jobs updated')
+
+        self.stdout.write(self.style.SUCCESS(f'Done. {updated} search vectors updated.'))
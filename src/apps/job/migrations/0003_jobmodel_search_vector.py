@@ -0,0 +1,26 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from apps.core.migration_operations import PostgreSQLOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0002_remove_jobmodel_category_delete_jobcategorymodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobmodel',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search vector'),
+        ),
+        PostgreSQLOnly(
+            migrations.AddIndex(
+                model_name='jobmodel',
+                index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+from apps.core.migration_operations import AddIndexConcurrentlyIfPostgreSQL
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('job', '0003_jobmodel_search_vector'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(condition=models.Q(('is_approved', True), ('is_closed', False)), fields=['-created_at', '-id'], name='job_active_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(condition=models.Q(('is_approved', True), ('is_closed', False)), fields=['employment_type', '-created_at', '-id'], name='job_active_type_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(fields=['employer', '-created_at', '-id'], name='job_employer_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='applicationmodel',
+            index=models.Index(fields=['job', 'status', '-created_at'], name='application_job_status_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='applicationmodel',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['job', '-created_at', '-id'], name='application_submitted_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='applicationmodel',
+            index=models.Index(fields=['seeker', '-created_at', '-id'], name='application_seeker_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.core.migration_operations import AddIndexConcurrentlyIfPostgreSQL
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('job', '0004_job_application_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('salary_max', 'salary_min'), condition=models.Q(('is_approved', True), ('is_closed', False)), name='job_active_salary_high_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('salary_min', 'salary_max'), condition=models.Q(('is_approved', True), ('is_closed', False)), name='job_active_salary_low_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(django.db.models.functions.text.Lower('location'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), condition=models.Q(('is_approved', True), ('is_closed', False)), name='job_active_location_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0005_job_salary_location_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRecommendationModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creation Time')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Update Time')),
+                ('score', models.FloatField(verbose_name='Score')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='job.jobmodel', verbose_name='Job')),
+                ('seeker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_recommendations', to=settings.AUTH_USER_MODEL, verbose_name='Seeker')),
+            ],
+            options={
+                'verbose_name': 'Job recommendation',
+                'verbose_name_plural': 'Job recommendations',
+                'indexes': [models.Index(fields=['seeker', '-score'], name='job_recommendation_seeker_idx')],
+                'constraints': [models.UniqueConstraint(fields=('seeker', 'job'), name='job_recommendation_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_status_times(apps, schema_editor):
+    # approximation for existing rows: approved on creation, closed on the last update
+    JobModel = apps.get_model('job', 'JobModel')
+    JobModel.objects.filter(is_approved=True).update(approved_at=F('created_at'))
+    JobModel.objects.filter(is_closed=True).update(closed_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0006_jobrecommendationmodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobmodel',
+            name='approved_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Approved at'),
+        ),
+        migrations.AddField(
+            model_name='jobmodel',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Closed at'),
+        ),
+        migrations.RunPython(backfill_status_times, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+from apps.core.migration_operations import AddIndexConcurrentlyIfPostgreSQL
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('job', '0007_jobmodel_approved_at_closed_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='applicationmodel',
+            index=models.Index(fields=['created_at'], name='application_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(fields=['created_at'], name='job_created_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(condition=models.Q(('approved_at__isnull', False)), fields=['approved_at'], name='job_approved_at_idx'),
+        ),
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='jobmodel',
+            index=models.Index(condition=models.Q(('closed_at__isnull', False)), fields=['closed_at'], name='job_closed_at_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_decided_at(apps, schema_editor):
+    # approximation for existing rows: decided on the last update
+    ApplicationModel = apps.get_model('job', 'ApplicationModel')
+    ApplicationModel.objects.exclude(status='submitted').update(decided_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0008_job_application_rollup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobmodel',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Views count'),
+        ),
+        migrations.AddField(
+            model_name='applicationmodel',
+            name='decided_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Decided at'),
+        ),
+        migrations.RunPython(backfill_decided_at, migrations.RunPython.noop),
+    ]
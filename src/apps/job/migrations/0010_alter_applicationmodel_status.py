@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0009_jobmodel_views_count_applicationmodel_decided_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationmodel',
+            name='status',
+            field=models.CharField(choices=[('submitted', 'Submitted'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('accepted', 'Accepted')], default='submitted', max_length=20, verbose_name='Status'),
+        ),
+    ]
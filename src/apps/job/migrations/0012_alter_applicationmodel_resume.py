@@ -0,0 +1,18 @@
+import apps.core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('job', '0011_resumeuploadmodel'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationmodel',
+            name='resume',
+            field=models.FileField(blank=True, null=True, storage=apps.core.storage.get_blob_storage, upload_to='resumes/', verbose_name='Resume'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+def skip_without_resume(apps, schema_editor):
+    # only applications with a resume are queued for extraction
+    ApplicationModel = apps.get_model('job', 'ApplicationModel')
+    ApplicationModel.objects.filter(models.Q(resume='') | models.Q(resume__isnull=True)).update(
+        resume_text_status='skipped'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0012_alter_applicationmodel_resume'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationmodel',
+            name='resume_text',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Resume text'),
+        ),
+        migrations.AddField(
+            model_name='applicationmodel',
+            name='resume_text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed'), ('skipped', 'Skipped')], default='pending', editable=False, max_length=10, verbose_name='Resume text status'),
+        ),
+        migrations.AddField(
+            model_name='applicationmodel',
+            name='resume_text_attempts',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='Resume text attempts'),
+        ),
+        migrations.AddField(
+            model_name='applicationmodel',
+            name='resume_search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Resume search vector'),
+        ),
+        migrations.RunPython(skip_without_resume, migrations.RunPython.noop),
+    ]
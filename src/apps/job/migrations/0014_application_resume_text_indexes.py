@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+from apps.core.migration_operations import AddIndexConcurrentlyIfPostgreSQL, PostgreSQLOnly
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('job', '0013_applicationmodel_resume_text'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfPostgreSQL(
+            model_name='applicationmodel',
+            index=models.Index(condition=models.Q(('resume_text_status', 'done'), _negated=True), fields=['resume_text_status'], name='application_resume_text_idx'),
+        ),
+        PostgreSQLOnly(
+            AddIndexConcurrently(
+                model_name='applicationmodel',
+                index=django.contrib.postgres.indexes.GinIndex(fields=['resume_search_vector'], name='application_resume_vector_gin'),
+            ),
+        ),
+    ]
@@ -1,8 +1,17 @@
+import os
+import uuid
+
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Coalesce, Lower
+from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import BaseModel
+from apps.core.storage import get_blob_storage
 from . import enums
 
 
@@ -19,14 +28,58 @@ class JobModel(BaseModel):
     salary_max = models.IntegerField(_('Salary max'), null=True, blank=True)
     is_approved = models.BooleanField(_('Is approved'), default=False)
     is_closed = models.BooleanField(_('Is closed'), default=False)
+    search_vector = SearchVectorField(_('Search vector'), null=True, editable=False)
+    # read by the daily rollups (apps.dashboard.rollup)
+    approved_at = models.DateTimeField(_('Approved at'), null=True, blank=True, editable=False)
+    closed_at = models.DateTimeField(_('Closed at'), null=True, blank=True, editable=False)
+    # buffered in redis, see `flush_job_views` command
+    views_count = models.PositiveIntegerField(_('Views count'), default=0, editable=False)
 
     class Meta:
         verbose_name = _('Job')
         verbose_name_plural = _('Jobs')
+        indexes = [
+            GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+            # active job list (JobListView, JobDetailView, JobApplyView)
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_approved=True, is_closed=False),
+                         name='job_active_created_idx'),
+            models.Index(fields=['employment_type', '-created_at', '-id'],
+                         condition=models.Q(is_approved=True, is_closed=False), name='job_active_type_created_idx'),
+            # salary range overlap and location filters (apps.job.search.filters)
+            models.Index(Coalesce('salary_max', 'salary_min'), condition=models.Q(is_approved=True, is_closed=False),
+                         name='job_active_salary_high_idx'),
+            models.Index(Coalesce('salary_min', 'salary_max'), condition=models.Q(is_approved=True, is_closed=False),
+                         name='job_active_salary_low_idx'),
+            models.Index(Lower('location'), models.F('created_at').desc(), models.F('id').desc(),
+                         condition=models.Q(is_approved=True, is_closed=False), name='job_active_location_idx'),
+            # employer job list
+            models.Index(fields=['employer', '-created_at', '-id'], name='job_employer_created_idx'),
+            # daily rollups
+            models.Index(fields=['created_at'], name='job_created_idx'),
+            models.Index(fields=['approved_at'], condition=models.Q(approved_at__isnull=False),
+                         name='job_approved_at_idx'),
+            models.Index(fields=['closed_at'], condition=models.Q(closed_at__isnull=False), name='job_closed_at_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.employer.email}"
 
+    def save(self, *args, **kwargs):
+        self.stamp_status()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'is_approved', 'is_closed'}.intersection(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'approved_at', 'closed_at'}
+        super().save(*args, **kwargs)
+
+    def stamp_status(self):
+        # first approval and current closing time
+        if self.is_approved and self.approved_at is None:
+            self.approved_at = timezone.now()
+        if not self.is_closed:
+            self.closed_at = None
+        elif self.closed_at is None:
+            self.closed_at = timezone.now()
+
     def is_active(self):
         return self.is_approved and not self.is_closed
 
@@ -48,18 +101,107 @@ class ApplicationModel(BaseModel):
     seeker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
                                related_name="applications", verbose_name=_('Seeker'))
     cover_letter = models.TextField(_('Cover letter'), null=True, blank=True)
-    resume = models.FileField(_('Resume'), upload_to="resumes/", null=True, blank=True)
+    resume = models.FileField(_('Resume'), upload_to="resumes/", storage=get_blob_storage, null=True, blank=True)
     status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default=STATUS_CHOICES.SUBMITTED)
+    # time to decision of the employer funnel (apps.dashboard.funnel)
+    decided_at = models.DateTimeField(_('Decided at'), null=True, blank=True, editable=False)
+    # normalized text of the resume, filled by `extract_resume_texts` worker (apps.job.resume_text)
+    resume_text = models.TextField(_('Resume text'), blank=True, default='', editable=False)
+    resume_text_status = models.CharField(_('Resume text status'), max_length=10, choices=enums.ResumeTextStatus,
+                                          default=enums.ResumeTextStatus.PENDING, editable=False)
+    resume_text_attempts = models.PositiveSmallIntegerField(_('Resume text attempts'), default=0, editable=False)
+    resume_search_vector = SearchVectorField(_('Resume search vector'), null=True, editable=False)
 
     class Meta:
         verbose_name = _('Application')
         verbose_name_plural = _('Applications')
+        indexes = [
+            # employer application lists and dashboard counters
+            models.Index(fields=['job', 'status', '-created_at'], name='application_job_status_idx'),
+            models.Index(fields=['job', '-created_at', '-id'], condition=models.Q(status=enums.STATUS.SUBMITTED),
+                         name='application_submitted_idx'),
+            # seeker application list
+            models.Index(fields=['seeker', '-created_at', '-id'], name='application_seeker_created_idx'),
+            # daily rollups
+            models.Index(fields=['created_at'], name='application_created_idx'),
+            # resume text extraction queue
+            models.Index(fields=['resume_text_status'], name='application_resume_text_idx',
+                         condition=~models.Q(resume_text_status=enums.ResumeTextStatus.DONE)),
+            GinIndex(fields=['resume_search_vector'], name='application_resume_vector_gin'),
+        ]
 
     def __str__(self):
         return f"{self.seeker.email} → {self.job.title}"
 
+    def save(self, *args, **kwargs):
+        self.stamp_status()
+        if self._state.adding and not self.resume:
+            # nothing for the resume text worker
+            self.resume_text_status = enums.ResumeTextStatus.SKIPPED
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'decided_at'}
+        super().save(*args, **kwargs)
+
+    def stamp_status(self):
+        if self.status in enums.PENDING_STATUSES:
+            self.decided_at = None
+        elif self.decided_at is None:
+            self.decided_at = timezone.now()
+
     def has_resume(self):
         return bool(self.resume)
 
+    def get_resume_filename(self):
+        # stored names are content hashes (apps.core.storage)
+        return f'resume-{self.pk}{os.path.splitext(self.resume.name)[1]}'
+
+    def get_resume_url(self):
+        return reverse('job:application_resume', args=[self.pk])
+
     def is_pending(self):
-        return self.status == enums.STATUS.SUBMITTED
\ No newline at end of file
+        return self.status in enums.PENDING_STATUSES
+
+
+class JobRecommendationModel(BaseModel):
+    seeker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                               related_name='job_recommendations', verbose_name=_('Seeker'))
+    job = models.ForeignKey(JobModel, on_delete=models.CASCADE, related_name='recommendations', verbose_name=_('Job'))
+    score = models.FloatField(_('Score'))
+
+    class Meta:
+        verbose_name = _('Job recommendation')
+        verbose_name_plural = _('Job recommendations')
+        constraints = [
+            models.UniqueConstraint(fields=['seeker', 'job'], name='job_recommendation_unique'),
+        ]
+        indexes = [
+            # seeker dashboard
+            models.Index(fields=['seeker', '-score'], name='job_recommendation_seeker_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.seeker.email} → {self.job.title} ({self.score:.2f})"
+
+
+class ResumeUploadModel(BaseModel):
+    # chunked upload in progress, see apps.job.uploads
+    token = models.UUIDField(_('Token'), default=uuid.uuid4, unique=True, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+                             related_name='resume_uploads', verbose_name=_('User'))
+    filename = models.CharField(_('File name'), max_length=255)
+    size = models.PositiveIntegerField(_('Size'))
+    offset = models.PositiveIntegerField(_('Offset'), default=0)
+
+    class Meta:
+        verbose_name = _('Resume upload')
+        verbose_name_plural = _('Resume uploads')
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+    def get_path(self):
+        return os.path.join(settings.RESUME_UPLOAD_CONFIG['TEMP_DIR'], f'{self.token}.part')
+
+    def is_complete(self):
+        return self.offset == self.size
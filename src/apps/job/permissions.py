@@ -0,0 +1,36 @@
+from django.db.models import Q
+from rest_framework.permissions import BasePermission
+
+from apps.account.enums import UserRoleEnum
+
+from .models import ApplicationModel
+
+
+class RolePermission(BasePermission):
+    # api counterpart of apps.job.mixins, superusers pass every role check
+    roles = ()
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+        return user.is_superuser or user.role in self.roles
+
+    @classmethod
+    def repr(cls):
+        return cls.__name__
+
+
+class IsJobSeeker(RolePermission):
+    roles = (UserRoleEnum.ADMIN, UserRoleEnum.JOB_SEEKER)
+
+
+class IsEmployer(RolePermission):
+    roles = (UserRoleEnum.ADMIN, UserRoleEnum.EMPLOYER)
+
+
+def get_resume_applications(user):
+    """applications whose resume `user` may download, the seeker's own and the ones to the employer's jobs"""
+    if user.is_superuser:
+        return ApplicationModel.objects.all()
+    return ApplicationModel.objects.filter(Q(seeker=user) | Q(job__employer=user))
@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.account.enums import UserRoleEnum
+from apps.account.models import UserProfileModel
+
+from ..models import JobModel, JobRecommendationModel
+from .vectors import CSRMatrix, Vocabulary, tokenize, top_n_scores
+
+
+# Worker process state, set once per worker by `_init_worker` so the job matrix is pickled only once
+_worker_state = None
+
+
+def _init_worker(postings, n, min_score):
+    global _worker_state
+    _worker_state = (postings, n, min_score)
+
+
+def _score_batch(queries):
+    return top_n_scores(queries, *_worker_state)
+
+
+class RecommendationEngine:
+    """
+        tf-idf job recommendations for job seekers
+        seeker skills are matched against title / description / location of the active jobs,
+        the top N jobs of every seeker are stored in JobRecommendationModel
+    """
+
+    def __init__(self, config):
+        self.config = config
+
+    @property
+    def top_n(self):
+        return self.config.get('TOP_N', 10)
+
+    @property
+    def min_score(self):
+        return self.config.get('MIN_SCORE', 0.05)
+
+    @property
+    def batch_size(self):
+        return self.config.get('BATCH_SIZE', 500)
+
+    @property
+    def state_key(self):
+        return self.config.get('STATE_KEY', 'job_recommendation:last_run')
+
+    # Data
+    @staticmethod
+    def job_tokens(job):
+        # title counts twice
+        return tokenize(job.title) * 2 + tokenize(job.description) + tokenize(job.location)
+
+    @staticmethod
+    def get_active_jobs():
+        return (JobModel.objects
+                .filter(is_approved=True, is_closed=False)
+                .only('id', 'title', 'description', 'location')
+                .order_by('id'))
+
+    @staticmethod
+    def get_seekers():
+        return list(UserProfileModel.objects
+                    .filter(user__role=UserRoleEnum.JOB_SEEKER, user__is_active=True)
+                    .values_list('user_id', 'skills', 'updated_at'))
+
+    @staticmethod
+    def get_stored():
+        stored = {}
+        rows = JobRecommendationModel.objects.order_by('seeker_id', '-score', 'job_id')
+        for seeker_id, job_id, score in rows.values_list('seeker_id', 'job_id', 'score'):
+            stored.setdefault(seeker_id, []).append((job_id, score))
+        return stored
+
+    # Scoring
+    def score(self, queries, documents, processes=1):
+        """top N (document row, score) lists for every row of `queries`"""
+        postings = documents.transpose()
+        batches = [
+            queries.take_rows(range(start, min(start + self.batch_size, queries.shape[0])))
+            for start in range(0, queries.shape[0], self.batch_size)
+        ]
+        if processes <= 1 or len(batches) <= 1:
+            results = [top_n_scores(batch, postings, self.top_n, self.min_score) for batch in batches]
+        else:
+            with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                     initargs=(postings, self.top_n, self.min_score)) as executor:
+                results = list(executor.map(_score_batch, batches))
+        return [row for batch in results for row in batch]
+
+    def recommend(self, seekers, vocabulary, documents, job_ids, processes=1):
+        vectors = (vocabulary.vectorize(tokenize(skills)) for _, skills, _ in seekers)
+        queries = CSRMatrix.from_rows(vectors, len(vocabulary))
+        scores = self.score(queries, documents, processes)
+        return {
+            seeker[0]: [(job_ids[row], score) for row, score in rows]
+            for seeker, rows in zip(seekers, scores)
+        }
+
+    def merge(self, stored, fresh):
+        return sorted(stored + fresh, key=lambda item: (-item[1], item[0]))[:self.top_n]
+
+    # Storage
+    def save(self, recommendations, replace_all=False):
+        rows = [
+            JobRecommendationModel(seeker_id=seeker_id, job_id=job_id, score=score)
+            for seeker_id, items in recommendations.items()
+            for job_id, score in items
+        ]
+        with transaction.atomic():
+            stale = JobRecommendationModel.objects.all()
+            if not replace_all:
+                stale = stale.filter(seeker_id__in=list(recommendations))
+            stale.delete()
+            JobRecommendationModel.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    # Run
+    def run(self, full=False, processes=1):
+        started = timezone.now()
+        since = None if full else cache.get(self.state_key)
+
+        jobs = list(self.get_active_jobs())
+        job_ids = [job.pk for job in jobs]
+        job_tokens = [self.job_tokens(job) for job in jobs]
+        vocabulary = Vocabulary(job_tokens)
+        documents = CSRMatrix.from_rows((vocabulary.vectorize(tokens) for tokens in job_tokens), len(vocabulary))
+        seekers = self.get_seekers()
+
+        changed_job_ids = set()
+        if since is not None:
+            changed_job_ids = set(JobModel.objects.filter(updated_at__gte=since).values_list('id', flat=True))
+            # many changes shift the idf of the whole corpus, rebuild everything
+            if len(changed_job_ids) > self.config.get('INCREMENTAL_MAX_RATIO', 0.2) * max(len(job_ids), 1):
+                since = None
+
+        if since is None:
+            recommendations = self.recommend(seekers, vocabulary, documents, job_ids, processes)
+            saved = self.save(recommendations, replace_all=True)
+            cache.set(self.state_key, started, timeout=None)
+            return {'mode': 'full', 'jobs': len(job_ids), 'seekers': len(seekers), 'saved': saved}
+
+        # Incremental: seekers with a new profile, or with a changed job in their list, are recomputed,
+        # the others are only scored against the changed jobs and merged into their stored list
+        stored = self.get_stored()
+        refresh, rest = [], []
+        for seeker in seekers:
+            seeker_id, _, updated_at = seeker
+            affected = any(job_id in changed_job_ids for job_id, _ in stored.get(seeker_id, []))
+            (refresh if updated_at >= since or affected else rest).append(seeker)
+
+        recommendations = self.recommend(refresh, vocabulary, documents, job_ids, processes)
+
+        changed_rows = [row for row, job_id in enumerate(job_ids) if job_id in changed_job_ids]
+        if changed_job_ids and rest:
+            changed = self.recommend(rest, vocabulary, documents.take_rows(changed_rows),
+                                     [job_ids[row] for row in changed_rows], processes)
+            for seeker_id, fresh in changed.items():
+                merged = self.merge(stored.get(seeker_id, []), fresh)
+                if merged != stored.get(seeker_id, []):
+                    recommendations[seeker_id] = merged
+
+        saved = self.save(recommendations)
+        cache.set(self.state_key, started, timeout=None)
+        return {
+            'mode': 'incremental', 'jobs': len(job_ids), 'changed_jobs': len(changed_job_ids),
+            'seekers': len(recommendations), 'saved': saved,
+        }
+
+
+recommendation_engine = RecommendationEngine(settings.JOB_RECOMMENDATION_CONFIG)
@@ -0,0 +1,97 @@
+import heapq
+import math
+from array import array
+from collections import Counter
+
+from apps.core.utils import tokenize
+
+
+class Vocabulary:
+    """term -> column index plus smoothed idf, built from the job corpus"""
+
+    def __init__(self, documents):
+        document_frequency = Counter()
+        for tokens in documents:
+            document_frequency.update(set(tokens))
+
+        count = len(documents)
+        self.index = {term: i for i, term in enumerate(sorted(document_frequency))}
+        self.idf = array('d', (
+            math.log((1 + count) / (1 + document_frequency[term])) + 1 for term in sorted(document_frequency)
+        ))
+
+    def __len__(self):
+        return len(self.index)
+
+    def vectorize(self, tokens):
+        """l2 normalized sublinear tf-idf row as (indices, values), unknown terms are dropped"""
+        counts = Counter(token for token in tokens if token in self.index)
+        row = sorted((self.index[term], (1 + math.log(tf)) * self.idf[self.index[term]]) for term, tf in counts.items())
+        norm = math.sqrt(sum(value * value for _, value in row)) or 1.0
+        return [i for i, _ in row], [value / norm for _, value in row]
+
+
+class CSRMatrix:
+    """
+        minimal compressed sparse row matrix (scipy.sparse.csr_matrix layout) on top of `array`
+        compact to pickle into worker processes
+    """
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    @classmethod
+    def from_rows(cls, rows, n_cols):
+        indptr, indices, data = array('l', [0]), array('l'), array('d')
+        for row_indices, row_values in rows:
+            indices.extend(row_indices)
+            data.extend(row_values)
+            indptr.append(len(indices))
+        return cls(indptr, indices, data, (len(indptr) - 1, n_cols))
+
+    def row(self, i):
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def transpose(self):
+        """csr of the transpose (= csc of self), rows become term postings"""
+        n_rows, n_cols = self.shape
+        counts = array('l', [0]) * (n_cols + 1)
+        for col in self.indices:
+            counts[col + 1] += 1
+        for col in range(n_cols):
+            counts[col + 1] += counts[col]
+
+        indptr = array('l', counts)
+        indices = array('l', [0]) * len(self.indices)
+        data = array('d', [0.0]) * len(self.data)
+        for row in range(n_rows):
+            for k in range(self.indptr[row], self.indptr[row + 1]):
+                col = self.indices[k]
+                indices[counts[col]] = row
+                data[counts[col]] = self.data[k]
+                counts[col] += 1
+        return CSRMatrix(indptr, indices, data, (n_cols, n_rows))
+
+    def take_rows(self, rows):
+        return CSRMatrix.from_rows((self.row(i) for i in rows), self.shape[1])
+
+
+def top_n_scores(queries, postings, n, min_score=0.0):
+    """
+        cosine scores of every `queries` row against the documents of `postings` (transposed document matrix)
+        returns [(document row, score), ...] of the best `n` documents per query row
+    """
+    results = []
+    for i in range(queries.shape[0]):
+        scores = {}
+        for term, weight in zip(*queries.row(i)):
+            documents, values = postings.row(term)
+            for document, value in zip(documents, values):
+                scores[document] = scores.get(document, 0.0) + weight * value
+        best = heapq.nlargest(n, scores.items(), key=lambda item: (item[1], -item[0]))
+        results.append([(document, score) for document, score in best if score >= min_score])
+    return results
@@ -0,0 +1,189 @@
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from xml.etree import ElementTree
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection, connections
+from django.db.models import F, Min, Q, TextField, Value
+
+from apps.core.utils import normalize_text, tokenize
+
+from .enums import ResumeTextStatus
+from .models import ApplicationModel
+
+
+logger = logging.getLogger(__name__)
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class ResumeTextUnsupported(Exception):
+    """no extractor for the file type (or its optional dependency is not installed)"""
+
+
+# Extractors, run in the worker processes
+def extract_pdf(path, max_chars):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ResumeTextUnsupported('pypdf is not installed')
+
+    parts, size = [], 0
+    for page in PdfReader(path).pages:
+        text = page.extract_text() or ''
+        parts.append(text)
+        size += len(text)
+        if size >= max_chars:
+            break
+    return '\n'.join(parts)
+
+
+def extract_docx(path, max_chars):
+    parts, size = [], 0
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as document:
+        # streamed, the document xml of a large file is never loaded as a whole
+        for _event, element in ElementTree.iterparse(document):
+            if element.tag == f'{WORD_NAMESPACE}t' and element.text:
+                parts.append(element.text)
+                size += len(element.text)
+            elif element.tag == f'{WORD_NAMESPACE}p':
+                parts.append('\n')
+                element.clear()
+            if size >= max_chars:
+                break
+    return ''.join(parts)
+
+
+EXTRACTORS = {
+    '.pdf': extract_pdf,
+    '.docx': extract_docx,
+}
+
+
+def normalize_resume_text(text, max_chars):
+    # postgresql text cannot hold NUL
+    return normalize_text(text.replace('\x00', ' '))[:max_chars]
+
+
+def extract_text(path, max_chars):
+    extractor = EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    if extractor is None:
+        raise ResumeTextUnsupported(f'no extractor for {os.path.basename(path)}')
+    return normalize_resume_text(extractor(path, max_chars), max_chars)
+
+
+def _extract(name, path, max_chars):
+    """(name, status, text or error), a broken file only fails its own resume"""
+    try:
+        return name, ResumeTextStatus.DONE, extract_text(path, max_chars)
+    except ResumeTextUnsupported as e:
+        return name, ResumeTextStatus.SKIPPED, str(e)
+    except Exception as e:
+        return name, ResumeTextStatus.FAILED, f'{type(e).__name__}: {e}'
+
+
+class ResumeTextExtractor:
+    """
+        text of application resumes, extracted outside the request by `extract_resume_texts` worker
+        rows waiting for extraction are the queue (resume_text_status), each distinct resume file is
+        extracted once in a process pool and written to every application sharing it,
+        so running a batch again only rewrites the same text
+    """
+
+    def __init__(self, config):
+        self.config = config
+
+    @property
+    def max_chars(self):
+        return self.config.get('MAX_CHARS', 100_000)
+
+    @property
+    def text_config(self):
+        return settings.JOB_SEARCH_CONFIG.get('POSTGRES_TEXT_CONFIG', 'simple')
+
+    @staticmethod
+    def with_resume(applications):
+        return applications.exclude(resume='').exclude(resume__isnull=True)
+
+    def pending(self, limit):
+        """distinct resume names waiting for extraction, failed ones are retried up to MAX_ATTEMPTS"""
+        applications = self.with_resume(ApplicationModel.objects.filter(
+            Q(resume_text_status=ResumeTextStatus.PENDING)
+            | Q(resume_text_status=ResumeTextStatus.FAILED, resume_text_attempts__lt=self.config.get('MAX_ATTEMPTS', 3))
+        ))
+        return list(applications.order_by('resume').values_list('resume', flat=True).distinct()[:limit])
+
+    def known_texts(self, names):
+        """{name: text} of `names` already extracted for another application"""
+        first = (ApplicationModel.objects.filter(resume__in=names, resume_text_status=ResumeTextStatus.DONE)
+                 .values('resume').annotate(first=Min('pk')).order_by().values_list('first', flat=True))
+        return dict(ApplicationModel.objects.filter(pk__in=list(first)).values_list('resume', 'resume_text'))
+
+    def extract(self, names, processes=1):
+        """yields (name, status, text or error) of `names`"""
+        storage = ApplicationModel._meta.get_field('resume').storage
+        paths = [storage.path(name) for name in names]
+        if processes <= 1 or len(names) <= 1:
+            yield from map(_extract, names, paths, repeat(self.max_chars))
+            return
+
+        # forked workers must not share the parent's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            yield from executor.map(_extract, names, paths, repeat(self.max_chars))
+
+    def save(self, name, status, text):
+        applications = ApplicationModel.objects.filter(resume=name)
+        if status == ResumeTextStatus.DONE:
+            vector = (SearchVector(Value(text, output_field=TextField()), config=self.text_config)
+                      if connection.vendor == 'postgresql' else None)
+            return applications.update(resume_text=text, resume_text_status=status, resume_search_vector=vector)
+        # an earlier text is kept when extracting again fails
+        return applications.exclude(resume_text_status=ResumeTextStatus.DONE).update(
+            resume_text_status=status, resume_text_attempts=F('resume_text_attempts') + 1
+        )
+
+    def run(self, processes=1):
+        """extract one batch, returns {status: number of resume files}"""
+        names = self.pending(self.config.get('BATCH_SIZE', 200))
+        results = {status: 0 for status in ResumeTextStatus.values if status != ResumeTextStatus.PENDING}
+        if not names:
+            return results
+
+        known = self.known_texts(names)
+        extracted = ((name, ResumeTextStatus.DONE, text) for name, text in known.items())
+        missing = [name for name in names if name not in known]
+        for name, status, text in (*extracted, *self.extract(missing, processes)):
+            if status != ResumeTextStatus.DONE:
+                logger.warning('Could not extract text of %s: %s', name, text)
+            self.save(name, status, text)
+            results[status] += 1
+        return results
+
+    def backfill(self, statuses=None):
+        """queue the resumes with `statuses` (all by default) for extraction again, returns the number of rows"""
+        applications = self.with_resume(ApplicationModel.objects.all())
+        if statuses:
+            applications = applications.filter(resume_text_status__in=statuses)
+        return applications.update(resume_text_status=ResumeTextStatus.PENDING, resume_text_attempts=0)
+
+    # Search
+    def search(self, applications, query):
+        """`applications` whose resume text matches every word of `query`"""
+        query = normalize_text(query)
+        if not query:
+            return applications
+        if connection.vendor == 'postgresql':
+            return applications.filter(
+                resume_search_vector=SearchQuery(query, config=self.text_config, search_type='websearch')
+            )
+        for token in tokenize(query) or [query]:
+            applications = applications.filter(resume_text__contains=token)
+        return applications
+
+
+resume_text_extractor = ResumeTextExtractor(settings.RESUME_TEXT_CONFIG)
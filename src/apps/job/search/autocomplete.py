@@ -0,0 +1,148 @@
+import heapq
+
+from django.conf import settings
+
+from apps.core.utils import normalize_text
+
+from .sync import ActiveJobsIndex
+
+
+ZWNJ = '\u200c'
+
+
+def autocomplete_keys(text, max_words=6):
+    """
+        normalized keys a text is suggested for, one per word start
+        persian words written with a half-space are also indexed joined (`می‌خواهم` -> `میخواهم`)
+    """
+    keys = set()
+    for variant in {normalize_text(text), normalize_text(text.replace(ZWNJ, ''))}:
+        words = variant.split()
+        for i in range(min(len(words), max_words)):
+            keys.add(' '.join(words[i:]))
+    return keys
+
+
+class TrieNode:
+    __slots__ = ('children', 'entries', 'top')
+
+    def __init__(self):
+        self.children = {}
+        # {(key, text): count} of keys ending here (or passing max depth here)
+        self.entries = {}
+        # cached best (count, text) of the subtree
+        self.top = None
+
+
+class PrefixTrie:
+    """
+        character trie of normalized keys, every node caches the best `size` texts of its subtree
+        so a lookup costs one walk down the prefix; caches on the path are dropped on changes
+        keys are cut at `max_depth` characters, longer prefixes are filtered at the deepest node
+    """
+
+    def __init__(self, size=10, max_depth=24):
+        self.size = size
+        self.max_depth = max_depth
+        self.root = TrieNode()
+
+    def change(self, key, text, delta):
+        path = [self.root]
+        for char in key[:self.max_depth]:
+            path.append(path[-1].children.setdefault(char, TrieNode()))
+
+        entries = path[-1].entries
+        count = entries.get((key, text), 0) + delta
+        if count > 0:
+            entries[(key, text)] = count
+        else:
+            entries.pop((key, text), None)
+
+        for node in path:
+            node.top = None
+        # drop empty branches
+        for parent, char, node in zip(reversed(path[:-1]), reversed(key[:self.max_depth]), reversed(path[1:])):
+            if node.children or node.entries:
+                break
+            del parent.children[char]
+
+    def get_top(self, node):
+        if node.top is None:
+            best = {}
+            for (_, text), count in node.entries.items():
+                best[text] = max(best.get(text, 0), count)
+            for child in node.children.values():
+                for count, text in self.get_top(child):
+                    best[text] = max(best.get(text, 0), count)
+            node.top = heapq.nlargest(self.size, ((count, text) for text, count in best.items()))
+        return node.top
+
+    def suggest(self, prefix, limit):
+        prefix = normalize_text(prefix)
+        node = self.root
+        for char in prefix[:self.max_depth]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        if len(prefix) <= self.max_depth:
+            return [text for _, text in self.get_top(node)[:limit]]
+
+        best = {}
+        for (key, text), count in node.entries.items():
+            if key.startswith(prefix):
+                best[text] = max(best.get(text, 0), count)
+        return [text for _, text in heapq.nlargest(limit, ((count, text) for text, count in best.items()))]
+
+
+class JobAutocomplete(ActiveJobsIndex):
+    """title / location suggestions of the active jobs, ranked by the number of jobs using them"""
+    fields = ('title', 'location')
+
+    def __init__(self, config):
+        self.config = config
+        super().__init__()
+        self.entries = {}
+        self.tries = {}
+        self.clear()
+
+    @property
+    def limit(self):
+        return self.config.get('LIMIT', 8)
+
+    def clear(self):
+        self.entries = {}
+        self.tries = {
+            field: PrefixTrie(size=self.limit, max_depth=self.config.get('MAX_DEPTH', 24))
+            for field in self.fields
+        }
+
+    def change(self, values, delta):
+        for field, text in zip(self.fields, values):
+            if not text:
+                continue
+            for key in autocomplete_keys(text, self.config.get('MAX_WORDS', 6)):
+                self.tries[field].change(key, text.strip(), delta)
+
+    def add(self, job):
+        self.discard(job.pk)
+        values = tuple(getattr(job, field) for field in self.fields)
+        self.entries[job.pk] = values
+        self.change(values, 1)
+
+    def discard(self, pk):
+        values = self.entries.pop(pk, None)
+        if values is not None:
+            self.change(values, -1)
+
+    def indexed_ids(self):
+        return self.entries.keys()
+
+    def suggest(self, prefix, limit=None):
+        limit = min(limit or self.limit, self.limit)
+        self.ensure_synced()
+        with self.lock:
+            return {field: self.tries[field].suggest(prefix, limit) for field in self.fields}
+
+
+job_autocomplete = JobAutocomplete(settings.JOB_AUTOCOMPLETE_CONFIG)
@@ -0,0 +1,344 @@
+import heapq
+import logging
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection, transaction
+from django.db.models import F
+
+from ..enums import SalaryBucket
+from ..models import JobModel
+from .facets import count_facets, empty_facets, add_facet_row, get_salary_bucket, SALARY_BUCKET_RANGES
+from .filters import filter_queryset, document_matcher, normalize_location, split_filters, SALARY_FROM, SALARY_TO, LOCATION
+from .inverted_index import InvertedIndex
+from .queue import SearchSyncQueue
+from .results import SearchResults
+from .sync import ActiveJobsIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchBackendUnavailable(Exception):
+    pass
+
+
+class BaseSearchBackend:
+    """
+        base class of job search backends
+        `execute` must return (list of job ids, total hits)
+    """
+    name = None
+
+    def __init__(self, config):
+        self.config = config
+        self._unavailable_until = 0
+
+    def is_available(self):
+        return time.monotonic() >= self._unavailable_until
+
+    def mark_unavailable(self):
+        self._unavailable_until = time.monotonic() + self.config.get('RETRY_AFTER', 30)
+
+    def search(self, query='', filters=None, ordering='-created_at'):
+        filters = filters or {}
+        fallback = DatabaseSearchBackend.build_queryset(query, filters, ordering)
+        if not self.is_available():
+            return fallback
+        return SearchResults(self, query, filters, ordering, fallback)
+
+    def execute(self, query, filters, ordering, offset, limit):
+        raise NotImplementedError
+
+    def facets(self, query='', filters=None):
+        return count_facets(DatabaseSearchBackend.build_queryset(query, filters or {}, '-created_at'))
+
+    def update(self, job):
+        pass
+
+    def remove(self, job):
+        pass
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    name = 'database'
+
+    @staticmethod
+    def build_queryset(query, filters, ordering):
+        qs = filter_queryset(JobModel.objects.all(), filters)
+        if query:
+            qs = qs.filter(title__icontains=query)
+        return qs.order_by(ordering, ordering.replace('created_at', 'id'))
+
+    def search(self, query='', filters=None, ordering='-created_at'):
+        return self.build_queryset(query, filters or {}, ordering)
+
+
+class PostgresSearchBackend(DatabaseSearchBackend):
+    """
+        postgresql full-text search over the stored `JobModel.search_vector`
+        vectors are refreshed on save and backfilled by `update_search_vectors` command
+    """
+    name = 'postgres'
+
+    @property
+    def text_config(self):
+        return self.config.get('POSTGRES_TEXT_CONFIG', 'simple')
+
+    def get_vector(self):
+        return (
+            SearchVector('title', weight='A', config=self.text_config)
+            + SearchVector('description', weight='B', config=self.text_config)
+            + SearchVector('location', weight='C', config=self.text_config)
+        )
+
+    def get_search_query(self, query):
+        return SearchQuery(query, config=self.text_config, search_type='websearch')
+
+    def search(self, query='', filters=None, ordering='-created_at'):
+        if not query or connection.vendor != 'postgresql':
+            return super().search(query, filters, ordering)
+
+        search_query = self.get_search_query(query)
+        return (filter_queryset(JobModel.objects.filter(search_vector=search_query), filters or {})
+                .annotate(rank=SearchRank(F('search_vector'), search_query))
+                .order_by('-rank', ordering, ordering.replace('created_at', 'id')))
+
+    def facets(self, query='', filters=None):
+        if not query or connection.vendor != 'postgresql':
+            return super().facets(query, filters)
+        return count_facets(filter_queryset(
+            JobModel.objects.filter(search_vector=self.get_search_query(query)), filters or {}
+        ))
+
+    def update(self, job):
+        if connection.vendor == 'postgresql':
+            JobModel.objects.filter(pk=job.pk).update(search_vector=self.get_vector())
+
+
+class LocalSearchBackend(ActiveJobsIndex, BaseSearchBackend):
+    """
+        in-process search over an inverted index of the active jobs
+        for deployments without a search cluster (and for tests / local development)
+    """
+    name = 'local'
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.index = InvertedIndex()
+        self.documents = {}
+
+    @staticmethod
+    def prepare(job):
+        salary_low = job.salary_min if job.salary_min is not None else job.salary_max
+        salary_high = job.salary_max if job.salary_max is not None else job.salary_min
+        return {
+            'id': job.pk,
+            'employment_type': job.employment_type,
+            'is_approved': job.is_approved,
+            'is_closed': job.is_closed,
+            'created_at': job.created_at,
+            'timestamp': job.created_at.timestamp(),
+            'salary_low': salary_low,
+            'salary_high': salary_high,
+            'salary_bucket': get_salary_bucket(salary_high),
+            'location_key': normalize_location(job.location),
+        }
+
+    def clear(self):
+        self.documents = {}
+        self.index.clear()
+
+    def add(self, job):
+        self.documents[job.pk] = self.prepare(job)
+        self.index.add(job.pk, {'title': job.title, 'description': job.description, 'location': job.location})
+
+    def discard(self, pk):
+        self.documents.pop(pk, None)
+        self.index.remove(pk)
+
+    def indexed_ids(self):
+        return self.documents.keys()
+
+    def match(self, query, filters):
+        """[(document, score), ...] of the jobs matching every query token"""
+        self.ensure_synced()
+        # only active jobs are indexed
+        filters = {
+            field: value for field, value in filters.items()
+            if (field, value) not in (('is_approved', True), ('is_closed', False))
+        }
+        matcher = document_matcher(filters) if filters else None
+
+        with self.lock:
+            if query:
+                hits = ((self.documents[pk], score) for pk, score in self.index.search(query).items())
+            else:
+                hits = ((doc, 0.0) for doc in self.documents.values())
+            return [(doc, score) for doc, score in hits if matcher is None or matcher(doc)]
+
+    def execute(self, query, filters, ordering, offset, limit):
+        hits = self.match(query, filters)
+        sign = -1 if ordering.startswith('-') else 1
+        # best rank first, then `ordering`, only the requested page is sorted
+        page = heapq.nsmallest(
+            offset + limit, hits, key=lambda hit: (-hit[1], sign * hit[0]['timestamp'], sign * hit[0]['id'])
+        )
+        return [doc['id'] for doc, _ in page[offset:]], len(hits)
+
+    def facets(self, query='', filters=None):
+        facets = empty_facets()
+        for doc, _ in self.match(query, filters or {}):
+            add_facet_row(facets, doc['employment_type'], doc['salary_bucket'], 1)
+        return facets
+
+
+class ElasticsearchBackend(BaseSearchBackend):
+    """
+        changes are queued (SYNC_QUEUE) and written in bulk by the `sync_search_index` worker,
+        so saving a job does not wait for the cluster
+    """
+    name = 'elasticsearch'
+    search_fields = ['title^3', 'description', 'location']
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.queue = SearchSyncQueue(config) if config.get('SYNC_QUEUE', True) else None
+
+    @property
+    def errors(self):
+        from elasticsearch import ApiError, TransportError
+        return ApiError, TransportError
+
+    @property
+    def document(self):
+        from ..documents import JobDocument
+        return JobDocument
+
+    def build_search(self, query, filters):
+        search = self.document.search()
+        if query:
+            search = search.query('multi_match', query=query, fields=self.search_fields, operator='and')
+
+        filters, ranges = split_filters(filters)
+        for field, value in filters.items():
+            search = search.filter('term', **{field: value})
+        if SALARY_FROM in ranges:
+            search = search.filter('range', salary={'gte': ranges[SALARY_FROM]})
+        if SALARY_TO in ranges:
+            search = search.filter('range', salary_low={'lte': ranges[SALARY_TO]})
+        if LOCATION in ranges:
+            search = search.filter('term', location_key=normalize_location(ranges[LOCATION]))
+        return search
+
+    def execute(self, query, filters, ordering, offset, limit):
+        search = self.build_search(query, filters)
+        search = search.sort(ordering, ordering.replace('created_at', 'id'))
+        search = search.extra(track_total_hits=True).source(False)[offset:offset + limit]
+
+        try:
+            response = search.execute()
+        except self.errors as e:
+            raise SearchBackendUnavailable(e) from e
+
+        return [int(hit.meta.id) for hit in response], response.hits.total.value
+
+    def facets(self, query='', filters=None):
+        if not self.is_available():
+            return super().facets(query, filters)
+
+        search = self.build_search(query, filters or {}).extra(track_total_hits=True)[0:0]
+        search.aggs.bucket('employment_type', 'terms', field='employment_type')
+        search.aggs.bucket('salary', 'range', field='salary', keyed=True, ranges=[
+            {'key': bucket.value, **({'from': low} if low is not None else {}), **({'to': high} if high is not None else {})}
+            for bucket, low, high in SALARY_BUCKET_RANGES
+        ])
+
+        try:
+            response = search.execute()
+        except self.errors:
+            self.mark_unavailable()
+            return super().facets(query, filters)
+
+        facets = empty_facets()
+        for bucket in response.aggregations.employment_type.buckets:
+            if bucket.key in facets['employment_type']:
+                facets['employment_type'][bucket.key] = bucket.doc_count
+        salary_buckets = response.aggregations.salary.buckets.to_dict()
+        for key, bucket in salary_buckets.items():
+            facets['salary'][key] = bucket['doc_count']
+        facets['salary'][SalaryBucket.NOT_SPECIFIED.value] = (
+            response.hits.total.value - sum(bucket['doc_count'] for bucket in salary_buckets.values())
+        )
+        return facets
+
+    def _send(self, job, action):
+        if not self.is_available():
+            return
+        try:
+            self.document().update(job, action=action, raise_on_error=False)
+        except self.errors as e:
+            logger.warning('Could not %s job %s in search index: %s', action, job.pk, e)
+            self.mark_unavailable()
+
+    def _enqueue(self, job, action):
+        if self.queue is None:
+            return self._send(job, action)
+
+        def push():
+            # inline write when redis is down
+            if not self.queue.push(job.pk):
+                self._send(job, action)
+
+        # the worker must read the committed row
+        transaction.on_commit(push)
+
+    def update(self, job):
+        self._enqueue(job, 'index')
+
+    def remove(self, job):
+        self._enqueue(job, 'delete')
+
+    def apply(self, ids):
+        """
+            write the current state of the jobs `ids` in one bulk request, missing rows are deleted
+            returns the number of failed documents, cluster errors are raised
+        """
+        from elasticsearch.helpers import bulk
+
+        document = self.document()
+        index = document._index._name
+        jobs = {job.pk: job for job in document.get_queryset().filter(pk__in=ids)}
+        actions = [
+            {'_op_type': 'index', '_index': index, '_id': pk, '_source': document.prepare(jobs[pk])}
+            if pk in jobs else
+            {'_op_type': 'delete', '_index': index, '_id': pk}
+            for pk in ids
+        ]
+
+        try:
+            _, errors = bulk(document._get_connection(), actions, raise_on_error=False)
+        except self.errors as e:
+            raise SearchBackendUnavailable(e) from e
+
+        # deleting a job that was never indexed is fine
+        errors = [error for error in errors if error.get('delete', {}).get('status') != 404]
+        for error in errors[:10]:
+            logger.warning('Could not sync job to search index: %s', error)
+        return len(errors)
+
+
+SEARCH_BACKENDS = {
+    DatabaseSearchBackend.name: DatabaseSearchBackend,
+    PostgresSearchBackend.name: PostgresSearchBackend,
+    LocalSearchBackend.name: LocalSearchBackend,
+    ElasticsearchBackend.name: ElasticsearchBackend,
+}
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    conf = settings.JOB_SEARCH_CONFIG
+    return SEARCH_BACKENDS[conf['BACKEND']](conf)
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import transaction
+
+from apps.core.pagination import CursorPage
+
+from ..models import JobModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class _CachedCount:
+    """object list stand-in so Paginator can rebuild page numbers from a cached count"""
+
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+
+class JobListCache:
+    """
+        caches job id lists of JobListView pages
+        keys carry a generation number, committed JobModel save/delete bumps it (see apps.job.signals)
+        so stale pages are never read and simply expire
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.prefix = config.get('PREFIX', 'job_list')
+
+    @property
+    def enabled(self):
+        return self.config.get('ENABLED', True)
+
+    def _key(self, name):
+        return f'{self.prefix}:{name}'
+
+    def _incr(self, name):
+        key = self._key(name)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, 0, timeout=None)
+            return cache.incr(key)
+
+    # Generation
+    def get_generation(self):
+        generation = cache.get(self._key('generation'))
+        if generation is None:
+            cache.add(self._key('generation'), 1, timeout=None)
+            generation = cache.get(self._key('generation'), 1)
+        return generation
+
+    def bump_generation(self):
+        return self._incr('generation')
+
+    def invalidate(self):
+        """bump the generation once the transaction commits, a concurrent request can not cache the old ids under it"""
+
+        def bump():
+            try:
+                self.bump_generation()
+            except redis.RedisError as e:
+                # cached pages expire after TIMEOUT
+                logger.warning('Could not invalidate the job list cache: %s', e)
+
+        transaction.on_commit(bump)
+
+    # Pages
+    def make_key(self, params):
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        return self._key(f'{self.get_generation()}:{digest}')
+
+    def get(self, params):
+        value = cache.get(self.make_key(params))
+        self._incr('hits' if value is not None else 'misses')
+        return value
+
+    def set(self, params, value):
+        cache.set(self.make_key(params), value, timeout=self.config.get('TIMEOUT', 600))
+
+    @staticmethod
+    def dump_page(page):
+        ids = [job.pk for job in page.object_list]
+        if getattr(page, 'is_cursor', False):
+            return {'ids': ids, 'next_cursor': page.next_cursor, 'previous_cursor': page.previous_cursor}
+        return {'ids': ids, 'number': page.number, 'count': page.paginator.count}
+
+    @staticmethod
+    def load_page(value, per_page):
+        jobs = JobModel.objects.select_related('employer').in_bulk(value['ids'])
+        objects = [jobs[pk] for pk in value['ids'] if pk in jobs]
+
+        if 'count' in value:
+            paginator = Paginator(_CachedCount(value['count']), per_page)
+            page = Page(objects, value['number'], paginator)
+        else:
+            paginator = None
+            page = CursorPage(objects, paginator, value['next_cursor'], value['previous_cursor'])
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    # Stats
+    def stats(self):
+        hits = cache.get(self._key('hits'), 0)
+        misses = cache.get(self._key('misses'), 0)
+        total = hits + misses
+        return {
+            'generation': self.get_generation(),
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        cache.delete_many([self._key('hits'), self._key('misses')])
+
+
+job_list_cache = JobListCache(settings.JOB_LIST_CACHE_CONFIG)
@@ -0,0 +1,61 @@
+from django.db.models import Case, Count, Value, When
+
+from ..enums import EmploymentType, SalaryBucket
+from .filters import salary_high_expression
+
+
+# (bucket, lower bound inclusive, upper bound exclusive)
+SALARY_BUCKET_RANGES = [
+    (SalaryBucket.UNDER_10M, None, 10_000_000),
+    (SalaryBucket.FROM_10M_TO_20M, 10_000_000, 20_000_000),
+    (SalaryBucket.FROM_20M_TO_40M, 20_000_000, 40_000_000),
+    (SalaryBucket.OVER_40M, 40_000_000, None),
+]
+
+
+def salary_bucket_expression():
+    whens = []
+    for bucket, low, high in SALARY_BUCKET_RANGES:
+        lookup = {}
+        if low is not None:
+            lookup['salary__gte'] = low
+        if high is not None:
+            lookup['salary__lt'] = high
+        whens.append(When(then=Value(bucket.value), **lookup))
+    return Case(*whens, default=Value(SalaryBucket.NOT_SPECIFIED.value))
+
+
+def get_salary_bucket(salary):
+    if salary is None:
+        return SalaryBucket.NOT_SPECIFIED.value
+    for bucket, low, high in SALARY_BUCKET_RANGES:
+        if (low is None or salary >= low) and (high is None or salary < high):
+            return bucket.value
+    return SalaryBucket.NOT_SPECIFIED.value
+
+
+def empty_facets():
+    return {
+        'employment_type': {value: 0 for value in EmploymentType.values},
+        'salary': {value: 0 for value in SalaryBucket.values},
+    }
+
+
+def add_facet_row(facets, employment_type, salary_bucket, count):
+    if employment_type in facets['employment_type']:
+        facets['employment_type'][employment_type] += count
+    facets['salary'][salary_bucket] += count
+
+
+def count_facets(queryset):
+    """employment type and salary bucket counts of `queryset` in one GROUP BY query"""
+    facets = empty_facets()
+    rows = (queryset
+            .order_by()
+            .annotate(salary=salary_high_expression())
+            .annotate(salary_bucket=salary_bucket_expression())
+            .values('employment_type', 'salary_bucket')
+            .annotate(count=Count('id')))
+    for row in rows:
+        add_facet_row(facets, row['employment_type'], row['salary_bucket'], row['count'])
+    return facets
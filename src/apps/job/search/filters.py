@@ -0,0 +1,66 @@
+from django.db.models import F
+from django.db.models.functions import Coalesce, Lower
+
+
+# Range / location filter keys understood by every search backend,
+# other keys are plain equality filters
+SALARY_FROM = 'salary_from'
+SALARY_TO = 'salary_to'
+LOCATION = 'location'
+
+
+# Job salary range bounds, a job with only one bound set is treated as that single value
+def salary_low_expression():
+    return Coalesce(F('salary_min'), F('salary_max'))
+
+
+def salary_high_expression():
+    return Coalesce(F('salary_max'), F('salary_min'))
+
+
+def location_expression():
+    return Lower('location')
+
+
+# Same normalization as `location_expression`, job forms already strip the value
+def normalize_location(value):
+    return (value or '').strip().lower()
+
+
+def split_filters(filters):
+    filters = dict(filters)
+    ranges = {key: filters.pop(key) for key in (SALARY_FROM, SALARY_TO, LOCATION) if filters.get(key) is not None}
+    return filters, ranges
+
+
+def filter_queryset(queryset, filters):
+    """apply search filters; salary range overlap and location use the expression indexes of JobModel"""
+    filters, ranges = split_filters(filters)
+
+    if SALARY_FROM in ranges:
+        queryset = queryset.alias(salary_high=salary_high_expression()).filter(salary_high__gte=ranges[SALARY_FROM])
+    if SALARY_TO in ranges:
+        queryset = queryset.alias(salary_low=salary_low_expression()).filter(salary_low__lte=ranges[SALARY_TO])
+    if LOCATION in ranges:
+        queryset = queryset.alias(location_key=location_expression()).filter(
+            location_key=normalize_location(ranges[LOCATION])
+        )
+    return queryset.filter(**filters)
+
+
+def document_matcher(filters):
+    """python version of `filter_queryset`, returns a predicate for in-memory documents"""
+    filters, ranges = split_filters(filters)
+    salary_from, salary_to = ranges.get(SALARY_FROM), ranges.get(SALARY_TO)
+    location = normalize_location(ranges[LOCATION]) if LOCATION in ranges else None
+
+    def match(doc):
+        if salary_from is not None and (doc['salary_high'] is None or doc['salary_high'] < salary_from):
+            return False
+        if salary_to is not None and (doc['salary_low'] is None or doc['salary_low'] > salary_to):
+            return False
+        if location is not None and doc['location_key'] != location:
+            return False
+        return all(doc.get(field) == value for field, value in filters.items())
+
+    return match
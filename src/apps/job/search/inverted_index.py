@@ -0,0 +1,115 @@
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+from apps.core.utils import tokenize
+
+
+class InvertedIndex:
+    """
+        token -> posting list of document ids (sorted `array`) with a tf weight per posting
+        AND queries intersect the postings starting from the shortest one,
+        matches are ranked by the sum of idf * tf weight of the query tokens
+    """
+    # Field weights, same boost as the elasticsearch backend
+    field_weights = {'title': 3, 'description': 1, 'location': 1}
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.postings = {}
+            self.weights = {}
+            self.doc_tokens = {}
+
+    def __len__(self):
+        return len(self.doc_tokens)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.doc_tokens
+
+    def analyze(self, fields):
+        counts = Counter()
+        for field, text in fields.items():
+            for token in tokenize(text):
+                counts[token] += self.field_weights.get(field, 1)
+        return {token: 1 + math.log(count) for token, count in counts.items()}
+
+    def add(self, doc_id, fields):
+        with self.lock:
+            self.remove(doc_id)
+            tokens = self.analyze(fields)
+            for token, weight in tokens.items():
+                postings = self.postings.setdefault(token, array('l'))
+                weights = self.weights.setdefault(token, array('f'))
+                # ids mostly grow, so this is an append
+                position = len(postings) if not postings or postings[-1] < doc_id else bisect_left(postings, doc_id)
+                postings.insert(position, doc_id)
+                weights.insert(position, weight)
+            self.doc_tokens[doc_id] = tuple(tokens)
+
+    def remove(self, doc_id):
+        with self.lock:
+            for token in self.doc_tokens.pop(doc_id, ()):
+                postings, weights = self.postings[token], self.weights[token]
+                position = bisect_left(postings, doc_id)
+                del postings[position]
+                del weights[position]
+                if not postings:
+                    del self.postings[token], self.weights[token]
+
+    def search(self, query):
+        """{doc id: score} of documents containing every token of `query`"""
+        tokens = set(tokenize(query))
+        with self.lock:
+            if not tokens or any(token not in self.postings for token in tokens):
+                return {}
+
+            # shortest posting list first, its ids are probed in the longer ones
+            tokens = sorted(tokens, key=lambda token: len(self.postings[token]))
+            total = len(self.doc_tokens)
+            idf = {token: math.log(1 + total / len(self.postings[token])) for token in tokens}
+
+            first = tokens[0]
+            ids = self.postings[first]
+            scores = [idf[first] * weight for weight in self.weights[first]]
+            for token in tokens[1:]:
+                ids, scores = self.intersect(ids, scores, token, idf[token])
+                if not ids:
+                    break
+            return dict(zip(ids, scores))
+
+    def intersect(self, ids, scores, token, idf):
+        postings, weights = self.postings[token], self.weights[token]
+        matched_ids, matched_scores = array('l'), []
+
+        # few candidates: binary search the posting list, otherwise one pass over it
+        if len(ids) * 16 < len(postings):
+            low = 0
+            for doc_id, score in zip(ids, scores):
+                low = bisect_left(postings, doc_id, low)
+                if low == len(postings):
+                    break
+                if postings[low] == doc_id:
+                    matched_ids.append(doc_id)
+                    matched_scores.append(score + idf * weights[low])
+        else:
+            other = dict(zip(postings, weights))
+            for doc_id, score in zip(ids, scores):
+                weight = other.get(doc_id)
+                if weight is not None:
+                    matched_ids.append(doc_id)
+                    matched_scores.append(score + idf * weight)
+        return matched_ids, matched_scores
+
+    def memory_usage(self):
+        """approximate bytes used by the posting arrays"""
+        with self.lock:
+            return sum(
+                postings.itemsize * len(postings) + self.weights[token].itemsize * len(self.weights[token])
+                for token, postings in self.postings.items()
+            )
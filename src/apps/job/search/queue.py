@@ -0,0 +1,49 @@
+import logging
+
+import redis
+
+from apps.core.redis_utils import redis_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchSyncQueue:
+    """
+        redis set of job ids waiting to be written to the search index
+        a set keeps one entry per job, so a burst of edits ends up as one index write
+        the worker claims the whole set by renaming it, ids are acknowledged after the bulk request
+        (a crashed worker leaves the claimed set behind and it is retried first)
+    """
+
+    def __init__(self, config):
+        self.key = config.get('SYNC_QUEUE_KEY', 'job_search:pending')
+        self.processing_key = f'{self.key}:processing'
+
+    @property
+    def conn(self):
+        return redis_manager.get_conn()
+
+    def push(self, *ids):
+        try:
+            self.conn.sadd(self.key, *ids)
+        except redis.RedisError as e:
+            logger.warning('Could not queue jobs %s for search sync: %s', ids, e)
+            return False
+        return True
+
+    def claim(self):
+        if not self.conn.exists(self.processing_key):
+            try:
+                self.conn.rename(self.key, self.processing_key)
+            except redis.ResponseError:
+                # nothing queued
+                return []
+        return sorted(int(pk) for pk in self.conn.smembers(self.processing_key))
+
+    def ack(self, ids):
+        if ids:
+            self.conn.srem(self.processing_key, *ids)
+
+    def __len__(self):
+        return self.conn.scard(self.key) + self.conn.scard(self.processing_key)
@@ -0,0 +1,74 @@
+import logging
+
+from ..models import JobModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResults:
+    """
+        lazy, sliceable list of jobs returned by a search backend
+        works with django Paginator and falls back to `fallback` queryset
+        when the backend becomes unavailable
+    """
+
+    def __init__(self, backend, query, filters, ordering, fallback):
+        self.backend = backend
+        self.query = query
+        self.filters = filters
+        self.ordering = ordering
+        self.fallback = fallback
+        self.use_fallback = False
+        self._count = None
+
+    def _execute(self, offset, limit):
+        from .backends import SearchBackendUnavailable
+
+        try:
+            return self.backend.execute(self.query, self.filters, self.ordering, offset, limit)
+        except SearchBackendUnavailable as e:
+            logger.warning('Search backend %s unavailable, falling back to database: %s', self.backend.name, e)
+            self.backend.mark_unavailable()
+            self.use_fallback = True
+            return None
+
+    def count(self):
+        if self.use_fallback:
+            return self.fallback.count()
+        if self._count is None:
+            result = self._execute(0, 0)
+            if result is None:
+                return self.fallback.count()
+            self._count = result[1]
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, item):
+        if self.use_fallback:
+            return self.fallback[item]
+
+        if isinstance(item, slice):
+            start = item.start or 0
+            stop = item.stop if item.stop is not None else self.count()
+        else:
+            start, stop = item, item + 1
+
+        result = self._execute(start, max(stop - start, 0))
+        if result is None:
+            return self.fallback[item]
+
+        ids, self._count = result
+        jobs = JobModel.objects.select_related('employer').in_bulk(ids)
+        objects = [jobs[pk] for pk in ids if pk in jobs]
+
+        if isinstance(item, slice):
+            return objects
+        if not objects:
+            raise IndexError(item)
+        return objects[0]
+
+    def __iter__(self):
+        return iter(self[0:self.count()])
@@ -0,0 +1,152 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+import redis
+from django.conf import settings
+from django.utils import timezone
+
+from apps.core.redis_utils import redis_manager
+
+from ..models import JobModel
+from .cache import job_list_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeletedJobs:
+    """
+        ids of deleted jobs scored by the time of deletion (redis sorted set), filled by apps.job.signals
+        so other processes catch up on deletions without loading every active id,
+        entries older than DELETED_JOBS_RETENTION are trimmed
+    """
+
+    def __init__(self, config):
+        self.key = config.get('DELETED_JOBS_KEY', 'job_search:deleted')
+        self.retention = config.get('DELETED_JOBS_RETENTION', 24 * 3600)
+
+    @property
+    def conn(self):
+        return redis_manager.get_conn()
+
+    def record(self, *ids):
+        now = time.time()
+        try:
+            pipe = self.conn.pipeline()
+            pipe.zadd(self.key, {pk: now for pk in ids})
+            pipe.zremrangebyscore(self.key, '-inf', now - self.retention)
+            pipe.execute()
+        except redis.RedisError as e:
+            # dropped by the next reconcile of ActiveJobsIndex
+            logger.warning('Could not record deleted jobs %s: %s', ids, e)
+
+    def since(self, timestamp):
+        """ids deleted since `timestamp`, None when the log can not tell (redis down or trimmed)"""
+        if timestamp < time.time() - self.retention:
+            return None
+        try:
+            return [int(pk) for pk in self.conn.zrangebyscore(self.key, timestamp, '+inf')]
+        except redis.RedisError as e:
+            logger.warning('Could not read deleted jobs: %s', e)
+            return None
+
+
+deleted_jobs = DeletedJobs(settings.JOB_SEARCH_CONFIG)
+
+
+class ActiveJobsIndex:
+    """
+        base of the in-process indexes over active jobs (local search backend, autocomplete)
+        built lazily and kept in sync by apps.job.signals, other processes notice the change
+        through the job list cache generation and catch up by `updated_at` and `deleted_jobs`
+        subclasses implement `clear`, `add`, `discard` and `indexed_ids`
+    """
+    # seconds of clock skew tolerated between servers when catching up
+    sync_margin = 5
+    # seconds between full comparisons of the indexed and the active ids
+    reconcile_interval = 3600
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        self.built = False
+        self.generation = None
+        self.synced_at = None
+        self.reconciled_at = None
+
+    @staticmethod
+    def is_active(job):
+        return job.is_approved and not job.is_closed
+
+    @staticmethod
+    def get_active_jobs():
+        return JobModel.objects.filter(is_approved=True, is_closed=False)
+
+    def clear(self):
+        raise NotImplementedError
+
+    def add(self, job):
+        raise NotImplementedError
+
+    def discard(self, pk):
+        raise NotImplementedError
+
+    def indexed_ids(self):
+        raise NotImplementedError
+
+    def build(self):
+        self.synced_at = self.reconciled_at = timezone.now()
+        self.clear()
+        for job in self.get_active_jobs().iterator(chunk_size=2000):
+            self.add(job)
+        self.built = True
+
+    def reconcile(self):
+        """drop every indexed id that is no longer active, loads all active ids"""
+        self.reconciled_at = timezone.now()
+        for pk in set(self.indexed_ids()) - set(self.get_active_jobs().values_list('id', flat=True)):
+            self.discard(pk)
+
+    def sync(self):
+        since = self.synced_at - timedelta(seconds=self.sync_margin)
+        self.synced_at = timezone.now()
+        for job in JobModel.objects.filter(updated_at__gte=since).iterator():
+            self.update(job)
+
+        # deleted jobs leave no row, their ids come from the deletion log
+        deleted = deleted_jobs.since(since.timestamp())
+        if deleted is None or self.reconciled_at < self.synced_at - timedelta(seconds=self.reconcile_interval):
+            self.reconcile()
+        else:
+            for pk in deleted:
+                self.discard(pk)
+
+    def ensure_synced(self):
+        generation = job_list_cache.get_generation()
+        with self.lock:
+            if not self.built:
+                self.build()
+            elif generation != self.generation:
+                self.sync()
+            self.generation = generation
+
+    def update(self, job):
+        with self.lock:
+            if not self.built:
+                return
+            if self.is_active(job):
+                self.add(job)
+            else:
+                self.discard(job.pk)
+
+    def remove(self, job):
+        with self.lock:
+            if self.built:
+                self.discard(job.pk)
+
+    def reset(self):
+        with self.lock:
+            self.built = False
+            self.clear()
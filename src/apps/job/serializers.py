@@ -0,0 +1,153 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import serializers
+
+from apps.core.serializers import ListSerializer, ListParamsSerializer, CursorListSerializer, CursorListParamsSerializer
+
+from . import models, exceptions, uploads
+from .decisions import BULK_ACTIONS, MAX_BULK_APPLICATIONS
+
+
+class EmployerSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = get_user_model()
+        fields = ('id', 'first_name', 'last_name')
+
+
+class JobSerializer(serializers.ModelSerializer):
+    employer = EmployerSerializer()
+
+    class Meta:
+        model = models.JobModel
+        fields = (
+            'id', 'title', 'description', 'location', 'employment_type',
+            'salary_min', 'salary_max', 'employer', 'created_at', 'updated_at'
+        )
+
+
+class JobDetailSerializer(JobSerializer):
+    # set by the view
+    has_applied = serializers.BooleanField(read_only=True)
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ('has_applied',)
+
+
+class JobListParamsSerializer(ListParamsSerializer):
+    # same filters as the job list page (apps.job.forms.JobSearchForm)
+    q = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    employment_type = serializers.ChoiceField(required=False, choices=models.JobModel.TYPE.choices)
+    salary_min = serializers.IntegerField(required=False, min_value=0)
+    salary_max = serializers.IntegerField(required=False, min_value=0)
+    location = serializers.CharField(required=False, allow_blank=True, max_length=100)
+
+
+class JobListSerializer(ListSerializer):
+    data = JobSerializer(many=True)
+
+
+class ApplicationJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = models.JobModel
+        fields = ('id', 'title', 'location', 'employment_type', 'is_closed')
+
+
+class ApplicationSerializer(serializers.ModelSerializer):
+    job = ApplicationJobSerializer()
+    # authorized download (api-application_resume), files are not public under MEDIA_URL
+    resume = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.ApplicationModel
+        fields = ('id', 'job', 'cover_letter', 'resume', 'status', 'created_at', 'updated_at')
+
+    def get_resume(self, obj):
+        if not obj.resume:
+            return None
+        url = reverse('job:api-application_resume', args=[obj.pk])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class ApplicationListSerializer(CursorListSerializer):
+    data = ApplicationSerializer(many=True)
+
+
+class SeekerSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = get_user_model()
+        fields = ('id', 'first_name', 'last_name', 'email')
+
+
+class ReceivedApplicationListParamsSerializer(CursorListParamsSerializer):
+    status = serializers.ChoiceField(required=False, choices=models.ApplicationModel.STATUS_CHOICES.choices)
+    # words searched in the extracted resume text (apps.job.resume_text)
+    q = serializers.CharField(required=False, allow_blank=True, max_length=200)
+
+
+class ReceivedApplicationSerializer(ApplicationSerializer):
+    seeker = SeekerSerializer()
+
+    class Meta(ApplicationSerializer.Meta):
+        fields = ApplicationSerializer.Meta.fields + ('seeker',)
+
+
+class ReceivedApplicationListSerializer(CursorListSerializer):
+    data = ReceivedApplicationSerializer(many=True)
+
+
+class ApplicationCreateSerializer(serializers.ModelSerializer):
+    job = serializers.PrimaryKeyRelatedField(queryset=models.JobModel.objects.filter(is_approved=True, is_closed=False))
+    seeker = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    # token of a finished chunked upload, instead of `resume`
+    resume_upload = serializers.UUIDField(required=False, write_only=True)
+
+    class Meta:
+        model = models.ApplicationModel
+        fields = ('job', 'seeker', 'cover_letter', 'resume', 'resume_upload')
+
+    def validate(self, attrs):
+        if models.ApplicationModel.objects.filter(job=attrs['job'], seeker=attrs['seeker']).exists():
+            raise exceptions.ApplicationAlreadyExists()
+        if 'resume_upload' in attrs:
+            attrs['resume_upload'] = uploads.get_upload(attrs['seeker'], attrs['resume_upload'])
+            if not attrs['resume_upload'].is_complete():
+                raise exceptions.ResumeUploadIncomplete()
+        return attrs
+
+    def create(self, validated_data):
+        upload = validated_data.pop('resume_upload', None)
+        if upload is None:
+            return super().create(validated_data)
+        with uploads.attach(upload) as resume:
+            return super().create({**validated_data, 'resume': resume})
+
+
+class ApplicationBulkActionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=BULK_ACTIONS)
+    applications = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), min_length=1, max_length=MAX_BULK_APPLICATIONS
+    )
+
+
+class ApplicationBulkActionResponseSerializer(serializers.Serializer):
+    action = serializers.CharField()
+    updated = serializers.IntegerField()
+
+
+class ResumeUploadCreateSerializer(serializers.Serializer):
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+
+
+class ResumeUploadSerializer(serializers.ModelSerializer):
+    complete = serializers.BooleanField(source='is_complete', read_only=True)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.ResumeUploadModel
+        fields = ('token', 'filename', 'size', 'offset', 'complete', 'chunk_size')
+
+    def get_chunk_size(self, obj) -> int:
+        return settings.RESUME_UPLOAD_CONFIG['CHUNK_SIZE']
@@ -0,0 +1,62 @@
+import copy
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.account.models import User, UserProfileModel
+from apps.core.storage import track_file_references
+
+from .cache import job_detail_cache
+from .models import JobModel, ApplicationModel
+from .search.autocomplete import job_autocomplete
+from .search.backends import get_search_backend
+from .search.cache import job_list_cache
+from .search.sync import deleted_jobs
+
+
+# Job model save receiver (Sync search index and autocomplete, invalidate job list cache)
+@receiver(post_save, sender=JobModel)
+def job_post_save(sender, instance, *args, **kwargs):
+    def sync():
+        get_search_backend().update(instance)
+        job_autocomplete.update(instance)
+
+    # the in-process indexes must not keep a rolled back change
+    transaction.on_commit(sync)
+    job_list_cache.invalidate()
+
+
+# Job model delete receiver (Sync search index and autocomplete, invalidate job list cache)
+@receiver(post_delete, sender=JobModel)
+def job_post_delete(sender, instance, *args, **kwargs):
+    # the collector clears instance.pk before an outer transaction commits
+    job = copy.copy(instance)
+
+    def sync():
+        # before the generation bump, other processes read it when they catch up
+        deleted_jobs.record(job.pk)
+        get_search_backend().remove(job)
+        job_autocomplete.remove(job)
+
+    transaction.on_commit(sync)
+    job_list_cache.invalidate()
+
+
+# Application save / delete receiver (Invalidate the seeker's applied job ids)
+@receiver(post_save, sender=ApplicationModel)
+@receiver(post_delete, sender=ApplicationModel)
+def application_changed(sender, instance, *args, **kwargs):
+    job_detail_cache.invalidate_applied_job_ids(instance.seeker_id)
+
+
+# User / profile save receiver (Invalidate the employer fragment of job detail pages)
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=UserProfileModel)
+def employer_changed(sender, instance, *args, **kwargs):
+    user_id = instance.pk if sender is User else instance.user_id
+    job_detail_cache.invalidate_employer_fragment(user_id)
+
+
+# Release the stored resume of deleted / updated applications
+track_file_references(ApplicationModel, 'resume')
@@ -0,0 +1,88 @@
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.account.enums import UserRoleEnum
+from apps.dashboard.funnel import employer_funnel
+
+from .enums import STATUS
+from .management.commands.check_query_plans import Command as CheckQueryPlans
+from .models import JobModel, ApplicationModel
+
+
+@skipUnless(connection.vendor in ('postgresql', 'sqlite'), 'EXPLAIN output is backend specific')
+class QueryPlanTests(TestCase):
+    """hot job / application queries keep using the indexes of JobModel.Meta and ApplicationModel.Meta"""
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # empty tables are cheaper to seq scan, the test transaction keeps the setting local
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, *names):
+        plan = queryset.explain()
+        self.assertFalse(CheckQueryPlans.has_full_scan(plan, connection.vendor), plan)
+        if names:
+            self.assertTrue(any(name in plan for name in names), plan)
+
+    @staticmethod
+    def get_active_jobs():
+        return JobModel.objects.filter(is_approved=True, is_closed=False)
+
+    def test_job_list(self):
+        self.assertUsesIndex(self.get_active_jobs().order_by('-created_at', '-id')[:20], 'job_active_created_idx')
+        self.assertUsesIndex(
+            self.get_active_jobs().filter(employment_type=JobModel.TYPE.REMOTE).order_by('-created_at', '-id')[:20],
+            'job_active_type_created_idx',
+        )
+
+    def test_apply(self):
+        self.assertUsesIndex(self.get_active_jobs().filter(pk=1))
+        self.assertUsesIndex(ApplicationModel.objects.filter(job_id=1, seeker_id=1))
+
+    def test_employer_applications(self):
+        for status in (STATUS.SUBMITTED, STATUS.SHORTLISTED):
+            self.assertUsesIndex(
+                ApplicationModel.objects.filter(job__employer_id=1, status=status).order_by('-created_at')[:5],
+                'application_job_status_idx', 'application_submitted_idx',
+            )
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+@mock.patch.object(employer_funnel, 'record_view')
+class JobDetailQueryTests(TestCase):
+    """JobDetailView runs 4 queries with warm caches: session, user, validator and the job"""
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        employer = User.objects.create_user(email='employer@example.com', password='password')
+        employer.role = UserRoleEnum.EMPLOYER
+        employer.save()
+        cls.job = JobModel.objects.create(
+            employer=employer, title='Backend developer', description='Django', location='Tehran',
+            employment_type=JobModel.TYPE.REMOTE, is_approved=True,
+        )
+        cls.seeker = User.objects.create_user(email='seeker@example.com', password='password')
+        cls.applicant = User.objects.create_user(email='applicant@example.com', password='password')
+        ApplicationModel.objects.create(job=cls.job, seeker=cls.applicant, cover_letter='Hello')
+
+    def assertDetailQueries(self, user, has_applied):
+        self.client.force_login(user)
+        url = reverse('job:job_detail', args=[self.job.pk])
+        # the first request fills the applied job ids and the employer fragment
+        self.client.get(url)
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['has_applied'], has_applied)
+
+    def test_not_applied(self, record_view):
+        self.assertDetailQueries(self.seeker, False)
+
+    def test_applied(self, record_view):
+        self.assertDetailQueries(self.applicant, True)
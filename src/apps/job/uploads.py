@@ -0,0 +1,144 @@
+import os
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from . import exceptions
+from .models import ResumeUploadModel
+
+
+# bytes read from the request per write, the chunk never sits in memory as a whole
+READ_SIZE = 64 * 1024
+
+
+class UploadedResume(File):
+    """finished upload, ContentAddressedStorage links a file with `temporary_file_path` instead of copying it"""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def get_config():
+    return settings.RESUME_UPLOAD_CONFIG
+
+
+def get_extension(filename):
+    return os.path.splitext(filename)[1].lower()
+
+
+def create_upload(user, filename, size):
+    """register an upload of `size` bytes, the name and size are checked before any byte is sent"""
+    config = get_config()
+    if get_extension(filename) not in config['TYPES']:
+        raise exceptions.UnsupportedResumeType()
+    if size > config['MAX_SIZE']:
+        raise exceptions.ResumeTooLarge()
+
+    upload = ResumeUploadModel.objects.create(user=user, filename=os.path.basename(filename), size=size)
+    os.makedirs(config['TEMP_DIR'], exist_ok=True)
+    open(upload.get_path(), 'wb').close()
+    return upload
+
+
+def get_upload(user, token):
+    try:
+        return ResumeUploadModel.objects.get(user=user, token=token)
+    except (ResumeUploadModel.DoesNotExist, ValueError):
+        raise exceptions.ResumeUploadNotFound()
+
+
+def write_chunk(upload, offset, stream, length):
+    """
+        copy `length` bytes of `stream` to the part file at `offset`, READ_SIZE bytes at a time
+        the offset only moves once the whole chunk is on disk, a broken chunk is sent again from the same offset
+    """
+    config = get_config()
+    if offset != upload.offset:
+        raise exceptions.ResumeUploadOffsetMismatch()
+    if length > config['CHUNK_SIZE'] or offset + length > upload.size:
+        raise exceptions.ResumeTooLarge()
+
+    signature = config['TYPES'][get_extension(upload.filename)]
+    written = 0
+    with open_part(upload, 'r+b') as part:
+        part.seek(offset)
+        while written < length:
+            data = stream.read(min(READ_SIZE, length - written))
+            if not data:
+                break
+            if offset + written < len(signature):
+                # file type is checked on the first bytes, before the rest is accepted
+                start = offset + written
+                expected = signature[start:start + len(data)]
+                if data[:len(expected)] != expected:
+                    delete_upload(upload)
+                    raise exceptions.UnsupportedResumeType()
+            part.write(data)
+            written += len(data)
+
+    if written < length:
+        # client went away, the partial bytes are overwritten by the retry
+        raise exceptions.ResumeUploadOffsetMismatch()
+
+    # a concurrent request at the same offset loses
+    updated = ResumeUploadModel.objects.filter(pk=upload.pk, offset=offset).update(
+        offset=offset + written, updated_at=timezone.now()
+    )
+    if not updated:
+        raise exceptions.ResumeUploadOffsetMismatch()
+    upload.offset = offset + written
+    return upload
+
+
+def open_part(upload, mode):
+    try:
+        return open(upload.get_path(), mode)
+    except FileNotFoundError:
+        # removed by clear_expired_uploads meanwhile
+        delete_upload(upload)
+        raise exceptions.ResumeUploadNotFound()
+
+
+def open_upload(upload):
+    """finished upload as a File for ApplicationModel.resume"""
+    if not upload.is_complete():
+        raise exceptions.ResumeUploadIncomplete()
+    return UploadedResume(open_part(upload, 'rb'), name=upload.filename)
+
+
+@contextmanager
+def attach(upload):
+    """
+        finished upload to assign to ApplicationModel.resume inside the block,
+        the upload is removed once the block saved it and its transaction committed, and kept for a retry otherwise
+    """
+    resume = open_upload(upload)
+    try:
+        yield resume
+    finally:
+        resume.close()
+    transaction.on_commit(lambda: delete_upload(upload))
+
+
+def delete_upload(upload):
+    try:
+        os.remove(upload.get_path())
+    except FileNotFoundError:
+        pass
+    upload.delete()
+
+
+def clear_expired_uploads():
+    """uploads not touched for EXPIRE_HOURS, returns their number"""
+    expired = ResumeUploadModel.objects.filter(
+        updated_at__lt=timezone.now() - timedelta(hours=get_config()['EXPIRE_HOURS'])
+    )
+    count = 0
+    for upload in expired.iterator():
+        delete_upload(upload)
+        count += 1
+    return count
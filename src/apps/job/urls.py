@@ -1,24 +1,42 @@
 from django.urls import path
 
-from . import views
+from .views import api_views, template_views
 
 app_name = 'apps.job'
 
 
 urlpatterns = [
-    path('', views.JobListView.as_view(), name='job_list'),
-    path('jobs/<int:pk>/', views.JobDetailView.as_view(), name='job_detail'),
-
-    path('create/', views.JobCreateView.as_view(), name='create'),
-    path('my-jobs/', views. EmployerJobListView.as_view(), name='employer-job-list'),
-    path('employer/applications/', views.EmployerApplicationListView.as_view(), name='employer_applications'),
-    path('employer/accepted-jobs/', views.EmployerAcceptedJobsView.as_view(), name='employer_accepted_jobs'),
-    path('applications/<int:pk>/approve/', views.ApplicationApproveView.as_view(), name='application_approve'),
-    path('applications/<int:pk>/reject/', views.ApplicationRejectView.as_view(), name='application_reject'),
-    path('employer/jobs/<int:pk>/delete/', views.EmployerJobDeleteView.as_view(), name='employer_job_delete'),
-    path('employer/jobs/<int:pk>/edit/', views.EmployerJobUpdateView.as_view(), name='employer_job_edit'),
-
-    path('jobs/<int:pk>/apply/', views.JobApplyView.as_view(), name='job_apply'),
-    path('my-applications/', views.MyApplicationsView.as_view(), name='my_applications'),
-    path('applications/<int:pk>/cancel/', views.CancelApplicationView.as_view(), name='cancel_application'),
+
+    # api views
+    path('api/jobs/', api_views.JobList.as_view(), name='api-job_list'),
+    path('api/jobs/<int:pk>/', api_views.JobDetail.as_view(), name='api-job_detail'),
+    path('api/jobs/<int:pk>/apply/', api_views.JobApply.as_view(), name='api-job_apply'),
+    path('api/applications/', api_views.MyApplicationList.as_view(), name='api-my_applications'),
+    path('api/applications/received/', api_views.ReceivedApplicationList.as_view(), name='api-received_applications'),
+    path('api/applications/<int:pk>/resume/', api_views.ApplicationResume.as_view(), name='api-application_resume'),
+    path('api/applications/bulk/', api_views.ApplicationBulkAction.as_view(), name='api-application_bulk_action'),
+    path('api/resume-uploads/', api_views.ResumeUploadCreate.as_view(), name='api-resume_upload_create'),
+    path('api/resume-uploads/<uuid:token>/', api_views.ResumeUploadDetail.as_view(), name='api-resume_upload_detail'),
+    path('api/resume-uploads/<uuid:token>/chunk/', api_views.ResumeUploadChunk.as_view(),
+         name='api-resume_upload_chunk'),
+
+    # templates views
+    path('', template_views.JobListView.as_view(), name='job_list'),
+    path('autocomplete/', template_views.JobAutocompleteView.as_view(), name='job_autocomplete'),
+    path('jobs/<int:pk>/', template_views.JobDetailView.as_view(), name='job_detail'),
+
+    path('create/', template_views.JobCreateView.as_view(), name='create'),
+    path('my-jobs/', template_views.EmployerJobListView.as_view(), name='employer-job-list'),
+    path('employer/applications/', template_views.EmployerApplicationListView.as_view(), name='employer_applications'),
+    path('employer/accepted-jobs/', template_views.EmployerAcceptedJobsView.as_view(), name='employer_accepted_jobs'),
+    path('applications/<int:pk>/approve/', template_views.ApplicationApproveView.as_view(), name='application_approve'),
+    path('applications/<int:pk>/reject/', template_views.ApplicationRejectView.as_view(), name='application_reject'),
+    path('applications/<int:pk>/resume/', template_views.ApplicationResumeView.as_view(), name='application_resume'),
+    path('applications/bulk/', template_views.ApplicationBulkActionView.as_view(), name='application_bulk_action'),
+    path('employer/jobs/<int:pk>/delete/', template_views.EmployerJobDeleteView.as_view(), name='employer_job_delete'),
+    path('employer/jobs/<int:pk>/edit/', template_views.EmployerJobUpdateView.as_view(), name='employer_job_edit'),
+
+    path('jobs/<int:pk>/apply/', template_views.JobApplyView.as_view(), name='job_apply'),
+    path('my-applications/', template_views.MyApplicationsView.as_view(), name='my_applications'),
+    path('applications/<int:pk>/cancel/', template_views.CancelApplicationView.as_view(), name='cancel_application'),
 ]
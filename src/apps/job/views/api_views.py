@@ -0,0 +1,231 @@
+from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework import permissions as base_permissions
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.account.auth.authentication import BaseJWTAuthentication
+from apps.core.downloads import serve_file
+from apps.core.exceptions import ValidationErrorAPI
+from apps.core.serializers import CursorListParamsSerializer
+from apps.core.swagger import mixins as ms
+from apps.core.views.mixins import ConditionalResponseMixin, CreateViewMixin, DetailViewMixin, ListViewMixin
+
+from .. import serializers, exceptions, permissions, uploads
+from ..decisions import update_applications
+from ..forms import JobSearchForm
+from ..models import JobModel, ApplicationModel
+from ..resume_text import resume_text_extractor
+from ..search.backends import get_search_backend
+
+
+# ---Api Views---------------------------------------------------
+def get_active_job(pk):
+    try:
+        return JobModel.objects.select_related('employer').get(pk=pk, is_approved=True, is_closed=False)
+    except JobModel.DoesNotExist:
+        raise exceptions.JobNotFound()
+
+
+class JobList(ms.SwaggerViewMixin, ConditionalResponseMixin, ListViewMixin, APIView):
+    """
+        search active jobs, same query and filters as the job list page
+    """
+    swagger_title = 'Job list'
+    swagger_tags = ['Job']
+    serializer = serializers.JobListParamsSerializer
+    serializer_response = serializers.JobListSerializer
+    etag_related = ('employer',)
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request)
+
+    def get_queryset(self):
+        filters = JobSearchForm(self.query_params).get_filters()
+        jobs = get_search_backend().search(query=self.query_params.get('q', '').strip(), filters=filters)
+        if isinstance(jobs, QuerySet):
+            jobs = jobs.select_related('employer')
+        return jobs
+
+
+class JobDetail(ms.SwaggerViewMixin, ConditionalResponseMixin, DetailViewMixin, APIView):
+    """
+        active job detail, `has_applied` is true when the current user already applied
+    """
+    swagger_title = 'Job detail'
+    swagger_tags = ['Job']
+    serializer_response = serializers.JobDetailSerializer
+    etag_related = ('employer',)
+    job = None
+
+    def get(self, request, *args, **kwargs):
+        return self.detail(request)
+
+    def get_instance(self):
+        self.job = get_active_job(self.kwargs['pk'])
+        self.job.has_applied = self.job.applications.filter(seeker=self.request.user).exists()
+        return self.job
+
+    def get_etag_extra(self):
+        return self.job.has_applied
+
+
+class JobApply(ms.SwaggerViewMixin, CreateViewMixin, APIView):
+    """
+        apply for an active job
+    """
+    swagger_title = 'Job apply'
+    swagger_tags = ['Job']
+    swagger_response_code = 201
+    permission_classes = (base_permissions.IsAuthenticated, permissions.IsJobSeeker)
+    serializer = serializers.ApplicationCreateSerializer
+    serializer_response = serializers.ApplicationSerializer
+    job = None
+
+    def post(self, request, *args, **kwargs):
+        self.job = get_active_job(kwargs['pk'])
+        return self.create(request)
+
+    def additional_data(self):
+        return {'job': self.job.pk}
+
+
+class MyApplicationList(ms.SwaggerViewMixin, ConditionalResponseMixin, ListViewMixin, APIView):
+    """
+        applications of the current job seeker, newest first
+    """
+    swagger_title = 'My applications'
+    swagger_tags = ['Job']
+    permission_classes = (base_permissions.IsAuthenticated, permissions.IsJobSeeker)
+    serializer = CursorListParamsSerializer
+    serializer_response = serializers.ApplicationListSerializer
+    cursor_pagination = True
+    etag_related = ('job',)
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request)
+
+    def get_queryset(self):
+        return ApplicationModel.objects.select_related('job').filter(seeker=self.request.user)
+
+
+class ReceivedApplicationList(ms.SwaggerViewMixin, ConditionalResponseMixin, ListViewMixin, APIView):
+    """
+        applications to the employer's jobs, newest first
+        `q` searches the resume text, resumes are indexed in the background so a new one may not match yet
+    """
+    swagger_title = 'Received applications'
+    swagger_tags = ['Job']
+    permission_classes = (base_permissions.IsAuthenticated, permissions.IsEmployer)
+    serializer = serializers.ReceivedApplicationListParamsSerializer
+    serializer_response = serializers.ReceivedApplicationListSerializer
+    cursor_pagination = True
+    etag_related = ('job', 'seeker')
+
+    def get(self, request, *args, **kwargs):
+        return self.list(request)
+
+    def get_queryset(self):
+        applications = ApplicationModel.objects.select_related('job', 'seeker').filter(job__employer=self.request.user)
+        if self.query_params.get('status'):
+            applications = applications.filter(status=self.query_params['status'])
+        return resume_text_extractor.search(applications, self.query_params.get('q', ''))
+
+
+class ApplicationResume(ms.SwaggerViewMixin, APIView):
+    """
+        resume file of an application, for the seeker and the employer of the job
+        supports `Range` requests, the bytes may be sent by the web server (X-Accel-Redirect / X-Sendfile)
+    """
+    swagger_title = 'Application resume'
+    swagger_tags = ['Job']
+    authentication_classes = (BaseJWTAuthentication, SessionAuthentication)
+    permission_classes = (base_permissions.IsAuthenticated,)
+
+    def get(self, request, *args, **kwargs):
+        application = permissions.get_resume_applications(request.user).exclude(resume='').filter(
+            pk=kwargs['pk']
+        ).first()
+        if application is None:
+            raise exceptions.ResumeNotFound()
+        return serve_file(request, application.resume, filename=application.get_resume_filename())
+
+
+class ApplicationBulkAction(ms.SwaggerViewMixin, APIView):
+    """
+        reject / shortlist many applications of the employer's jobs at once,
+        applications of other employers and already decided ones are skipped
+    """
+    swagger_title = 'Application bulk action'
+    swagger_tags = ['Job']
+    permission_classes = (base_permissions.IsAuthenticated, permissions.IsEmployer)
+    serializer = serializers.ApplicationBulkActionSerializer
+    serializer_response = serializers.ApplicationBulkActionResponseSerializer
+
+    def post(self, request, *args, **kwargs):
+        ser = self.serializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+
+        action = ser.validated_data['action']
+        updated = update_applications(request.user, ser.validated_data['applications'], action)
+        return Response(self.serializer_response({'action': action, 'updated': updated}).data)
+
+
+class ResumeUploadMixin:
+    # the apply page uploads with the session (X-CSRFToken header), api clients with jwt
+    authentication_classes = (BaseJWTAuthentication, SessionAuthentication)
+    permission_classes = (base_permissions.IsAuthenticated, permissions.IsJobSeeker)
+
+
+class ResumeUploadCreate(ms.SwaggerViewMixin, ResumeUploadMixin, APIView):
+    """
+        start a chunked resume upload, file name and size are checked before any byte is sent
+        send the file with `Resume upload chunk` requests, then apply with the returned `token` as `resume_upload`
+    """
+    swagger_title = 'Resume upload create'
+    swagger_tags = ['Job']
+    swagger_response_code = 201
+    serializer = serializers.ResumeUploadCreateSerializer
+    serializer_response = serializers.ResumeUploadSerializer
+
+    def post(self, request, *args, **kwargs):
+        ser = self.serializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        upload = uploads.create_upload(request.user, **ser.validated_data)
+        return Response(self.serializer_response(upload).data, status=status.HTTP_201_CREATED)
+
+
+class ResumeUploadDetail(ms.SwaggerViewMixin, ResumeUploadMixin, APIView):
+    """
+        offset of an upload, an interrupted upload resumes from it
+    """
+    swagger_title = 'Resume upload detail'
+    swagger_tags = ['Job']
+    serializer_response = serializers.ResumeUploadSerializer
+
+    def get(self, request, *args, **kwargs):
+        upload = uploads.get_upload(request.user, kwargs['token'])
+        return Response(self.serializer_response(upload).data)
+
+
+class ResumeUploadChunk(ms.SwaggerViewMixin, ResumeUploadMixin, APIView):
+    """
+        append the raw request body (at most `chunk_size` bytes) at the `Upload-Offset` header,
+        the body is streamed to disk and never parsed
+    """
+    swagger_title = 'Resume upload chunk'
+    swagger_tags = ['Job']
+    serializer_response = serializers.ResumeUploadSerializer
+
+    def put(self, request, *args, **kwargs):
+        upload = uploads.get_upload(request.user, kwargs['token'])
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.headers['Content-Length'])
+        except (KeyError, ValueError):
+            raise ValidationErrorAPI(message=_('Upload-Offset and Content-Length headers are required.'))
+
+        uploads.write_chunk(upload, offset, request.stream, length)
+        return Response(self.serializer_response(upload).data)
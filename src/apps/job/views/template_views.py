@@ -0,0 +1,372 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.generic import CreateView, ListView, DeleteView, UpdateView, DetailView, FormView
+from django.views import View
+from django.shortcuts import get_object_or_404, redirect
+from django.contrib import messages
+from django.utils.translation import gettext_lazy as _
+from django.urls import reverse, reverse_lazy
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from django.utils.http import urlencode
+
+from apps.core.downloads import serve_file
+from apps.core.utils import validate_form, toast_form_errors
+from apps.core.views.mixins import ConditionalGetMixin, CursorPaginationMixin
+from apps.dashboard.funnel import employer_funnel
+
+from ..cache import job_detail_cache
+from ..decisions import accept_application, update_applications
+from ..exceptions import ApplicationNotPending, ResumeUploadNotFound, ResumeUploadIncomplete
+from ..models import JobModel, ApplicationModel
+from ..forms import JobForm, ApplicationForm, ApplicationBulkActionForm, JobSearchForm
+from ..mixins import JobEmployerRequiredMixin, JobSeekerRequiredMixin
+from ..permissions import get_resume_applications
+from ..enums import STATUS, PENDING_STATUSES, SalaryBucket
+from .. import uploads
+from ..resume_text import resume_text_extractor
+from ..search.autocomplete import job_autocomplete
+from ..search.backends import get_search_backend
+from ..search.cache import job_list_cache
+
+
+class JobListView(LoginRequiredMixin, CursorPaginationMixin, ListView):
+    model = JobModel
+    template_name = 'jobs/job_list.html'
+    context_object_name = 'jobs'
+    paginate_by = 5
+
+    def get_search_form(self):
+        if not hasattr(self, '_search_form'):
+            self._search_form = JobSearchForm(self.request.GET)
+        return self._search_form
+
+    def get_search_filters(self):
+        return self.get_search_form().get_filters()
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        return get_search_backend().search(query=self.get_search_query(), filters=self.get_search_filters())
+
+    def get_facets(self):
+        # facet counts ignore the employment type filter so every option shows its own count
+        filters = self.get_search_filters()
+        filters.pop('employment_type', None)
+
+        params = {
+            'facets': True,
+            'q': ' '.join(self.get_search_query().lower().split()),
+            'filters': filters,
+            'backend': get_search_backend().name,
+        }
+        facets = job_list_cache.get(params) if job_list_cache.enabled else None
+        if facets is None:
+            facets = get_search_backend().facets(query=self.get_search_query(), filters=filters)
+            if job_list_cache.enabled:
+                job_list_cache.set(params, facets)
+        return facets
+
+    def get_cache_params(self, page_size):
+        return {
+            'q': ' '.join(self.get_search_query().lower().split()),
+            'filters': self.get_search_filters(),
+            'page': self.request.GET.get(self.page_kwarg) or '1',
+            'cursor': self.request.GET.get(self.cursor_kwarg, ''),
+            'page_size': page_size,
+            'backend': get_search_backend().name,
+        }
+
+    def paginate_queryset(self, queryset, page_size):
+        if not job_list_cache.enabled:
+            return super().paginate_queryset(queryset, page_size)
+
+        params = self.get_cache_params(page_size)
+        cached = job_list_cache.get(params)
+        if cached is not None:
+            return job_list_cache.load_page(cached, page_size)
+
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        job_list_cache.set(params, job_list_cache.dump_page(page))
+        return paginator, page, object_list, is_paginated
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        facets = self.get_facets()
+        type_counts = facets['employment_type']
+        context['employment_type_selected'] = self.request.GET.get('employment_type', 'all')
+        context['employment_type_choices'] = [('all', _('All'), sum(type_counts.values()))] + [
+            (value, label, type_counts.get(value, 0)) for value, label in JobModel.TYPE.choices
+        ]
+        context['salary_facets'] = [
+            (value, label, facets['salary'].get(value, 0)) for value, label in SalaryBucket.choices
+        ]
+        context['page_title'] = _("Job List")
+        context['search_query'] = self.request.GET.get('q', '')
+        context['search_form'] = self.get_search_form()
+        # current filters for pagination links
+        params = self.request.GET.copy()
+        params.pop(self.page_kwarg, None)
+        params.pop(self.cursor_kwarg, None)
+        context['filter_query'] = params.urlencode()
+        return context
+
+
+class JobAutocompleteView(LoginRequiredMixin, View):
+    # title / location suggestions for the job list search box, served from in-memory prefix tries
+    def get(self, request):
+        prefix = request.GET.get('q', '').strip()[:100]
+        try:
+            limit = int(request.GET.get('limit', 0))
+        except ValueError:
+            limit = 0
+
+        suggestions = job_autocomplete.suggest(prefix, limit) if prefix else {'title': [], 'location': []}
+        return JsonResponse(
+            {'titles': suggestions['title'], 'locations': suggestions['location']},
+            json_dumps_params={'ensure_ascii': False},
+        )
+
+
+class JobDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
+    model = JobModel
+    template_name = 'jobs/job_detail.html'
+    context_object_name = 'job'
+    conditional_fields = ('updated_at', 'employer__updated_at', 'employer__profile__updated_at')
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        # not modified responses are views too, employers are not counted
+        if response.status_code in (200, 304) and self.can_apply():
+            employer_funnel.record_view(self.kwargs['pk'])
+        return response
+
+    def get_queryset(self):
+        # job, employer and profile in one query
+        return JobModel.objects.filter(is_approved=True, is_closed=False).select_related('employer__profile')
+
+    def can_apply(self):
+        return getattr(self.request.user, 'role', None) != 'employer'
+
+    def has_applied(self):
+        return self.can_apply() and self.kwargs['pk'] in job_detail_cache.get_applied_job_ids(self.request.user)
+
+    def get_conditional_extra(self):
+        return self.has_applied()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['can_apply'] = self.can_apply()
+        context['has_applied'] = self.has_applied()
+        context['employer_profile'] = getattr(self.object.employer, 'profile', None)
+        context['employer_fragment_timeout'] = job_detail_cache.fragment_timeout
+        return context
+
+
+class JobCreateView(LoginRequiredMixin, JobEmployerRequiredMixin, CreateView):
+    model = JobModel
+    form_class = JobForm
+    template_name = 'jobs/employer/job_create.html'
+    success_url = reverse_lazy('dashboard:dashboard')
+
+    def form_valid(self, form):
+        form.instance.employer = self.request.user
+        messages.success(self.request, _('Job posting created successfully.'))
+        return super().form_valid(form)
+
+    def form_invalid(self, form):
+        validate_form(self.request, form)
+        toast_form_errors(self.request, form)
+        return super().form_invalid(form)
+
+
+class EmployerJobListView(LoginRequiredMixin, JobEmployerRequiredMixin, CursorPaginationMixin, ListView):
+    model = JobModel
+    template_name = 'jobs/employer/employer_job_list.html'
+    context_object_name = 'jobs'
+    paginate_by = 5
+
+    def get_queryset(self):
+        return JobModel.objects.filter(employer=self.request.user).order_by('-created_at')
+
+
+class EmployerApplicationListView(LoginRequiredMixin, JobEmployerRequiredMixin, CursorPaginationMixin, ListView):
+    model = ApplicationModel
+    template_name = 'jobs/employer/employer_application_list.html'
+    context_object_name = 'applications'
+    paginate_by = 5
+
+    def get_status(self):
+        # submitted / shortlisted tabs
+        status = self.request.GET.get('status')
+        return status if status in PENDING_STATUSES else STATUS.SUBMITTED
+
+    def get_query(self):
+        return self.request.GET.get('q', '').strip()[:200]
+
+    def get_queryset(self):
+        applications = (ApplicationModel.objects
+                        .filter(job__employer=self.request.user, status=self.get_status())
+                        .select_related('job', 'seeker')
+                        .order_by('-created_at'))
+        # search in the resume text
+        return resume_text_extractor.search(applications, self.get_query())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['status'] = self.get_status()
+        context['q'] = self.get_query()
+        context['statuses'] = [(status, STATUS(status).label) for status in PENDING_STATUSES]
+        context['bulk_form'] = ApplicationBulkActionForm()
+        return context
+
+
+class ApplicationApproveView(LoginRequiredMixin, JobEmployerRequiredMixin, View):
+    def post(self, request, pk):
+        app = get_object_or_404(ApplicationModel, pk=pk, job__employer=request.user)
+        try:
+            # other submitted applications of the job are rejected
+            accept_application(app)
+        except ApplicationNotPending as e:
+            messages.error(request, e.message)
+            return redirect('job:employer_applications')
+
+        messages.success(request, _('Application accepted and job closed.'))
+        return redirect('job:employer_applications')
+
+
+class ApplicationRejectView(LoginRequiredMixin, JobEmployerRequiredMixin, View):
+    def post(self, request, pk):
+        app = get_object_or_404(ApplicationModel, pk=pk, job__employer=request.user)
+        if not update_applications(request.user, [app.pk], STATUS.REJECTED):
+            messages.error(request, ApplicationNotPending.message)
+            return redirect('job:employer_applications')
+
+        messages.info(request, _('Application rejected.'))
+        return redirect('job:employer_applications')
+
+
+class ApplicationBulkActionView(LoginRequiredMixin, JobEmployerRequiredMixin, View):
+    def get_redirect_url(self):
+        # back to the tab the action was sent from
+        url = reverse('job:employer_applications')
+        status = self.request.POST.get('status')
+        return f'{url}?{urlencode({"status": status})}' if status in STATUS.values else url
+
+    def post(self, request):
+        form = ApplicationBulkActionForm(request.POST)
+        if not form.is_valid():
+            toast_form_errors(request, form)
+            return redirect(self.get_redirect_url())
+
+        action = form.cleaned_data['action']
+        updated = update_applications(request.user, form.cleaned_data['applications'], action)
+        messages.success(request, _('%(count)s applications updated to "%(status)s".') % {
+            'count': updated, 'status': STATUS(action).label,
+        })
+        return redirect(self.get_redirect_url())
+
+
+class ApplicationResumeView(LoginRequiredMixin, View):
+    """resume of an application, for the seeker and the employer of the job"""
+
+    def get(self, request, pk):
+        application = get_object_or_404(get_resume_applications(request.user).exclude(resume=''), pk=pk)
+        return serve_file(request, application.resume, filename=application.get_resume_filename())
+
+
+class EmployerJobDeleteView(LoginRequiredMixin, JobEmployerRequiredMixin, DeleteView):
+    model = JobModel
+    template_name = 'jobs/employer/employer_job_confirm_delete.html'
+    success_url = reverse_lazy('job:employer-job-list')
+
+    def get_object(self, queryset=None):
+        obj = super().get_object(queryset)
+        return obj
+
+
+class EmployerAcceptedJobsView(LoginRequiredMixin, JobEmployerRequiredMixin, CursorPaginationMixin, ListView):
+    model = ApplicationModel
+    template_name = 'jobs/employer/employer_accepted_jobs.html'
+    context_object_name = 'accepted_jobs'
+    paginate_by = 5
+
+    def get_queryset(self):
+        return (ApplicationModel.objects
+                .filter(job__employer=self.request.user, status='accepted')
+                .select_related('job', 'seeker')
+                .order_by('-created_at'))
+
+
+class EmployerJobUpdateView(LoginRequiredMixin, JobEmployerRequiredMixin, UpdateView):
+    model = JobModel
+    form_class = JobForm
+    template_name = 'jobs/employer/employer_job_form.html'
+    context_object_name = 'job'
+    success_url = reverse_lazy('job:employer-job-list')
+
+    def get_object(self, queryset=None):
+        obj = super().get_object(queryset)
+        if obj.employer != self.request.user and not self.request.user.is_superuser:
+            raise PermissionDenied(_("You do not have permission to edit this job posting."))
+        return obj
+
+
+class JobApplyView(LoginRequiredMixin, JobSeekerRequiredMixin, FormView):
+    form_class = ApplicationForm
+    template_name = 'jobs/seeker/job_apply.html'
+    success_url = reverse_lazy('dashboard:dashboard')
+
+    def dispatch(self, request, *args, **kwargs):
+        self.job = get_object_or_404(JobModel, pk=self.kwargs['pk'], is_approved=True, is_closed=False)
+        return super().dispatch(request, *args, **kwargs)
+
+    def form_valid(self, form):
+        user = self.request.user
+        if ApplicationModel.objects.filter(job=self.job, seeker=user).exists():
+            messages.warning(self.request, _("You have already applied for this job."))
+            return redirect('job:job_detail', pk=self.job.pk)
+
+        application = form.save(commit=False)
+        application.job = self.job
+        application.seeker = user
+        application.status = STATUS.SUBMITTED
+
+        token = form.cleaned_data.get('resume_upload')
+        if token:
+            try:
+                # resume sent in chunks, the finished file is linked into the storage
+                with uploads.attach(uploads.get_upload(user, token)) as resume:
+                    application.resume = resume
+                    application.save()
+            except (ResumeUploadNotFound, ResumeUploadIncomplete) as e:
+                messages.error(self.request, e.message)
+                return self.form_invalid(form)
+        else:
+            application.save()
+
+        messages.success(self.request, _("Your application has been submitted."))
+        return redirect('job:job_detail', pk=self.job.pk)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['job'] = self.job
+        return context
+
+
+class MyApplicationsView(LoginRequiredMixin, JobSeekerRequiredMixin, CursorPaginationMixin, ListView):
+    model = ApplicationModel
+    template_name = 'jobs/seeker/my_applications.html'
+    context_object_name = 'applications'
+    paginate_by = 5
+
+    def get_queryset(self):
+        return ApplicationModel.objects.select_related('job').filter(seeker=self.request.user).order_by('-created_at')
+
+
+class CancelApplicationView(LoginRequiredMixin, JobSeekerRequiredMixin, View):
+    def post(self, request, pk):
+        application = get_object_or_404(ApplicationModel, pk=pk, seeker=request.user)
+        application.delete()
+        messages.success(request, _("Your application has been cancelled."))
+        return redirect('dashboard:dashboard')
@@ -1,10 +1,12 @@
 from django.views.generic import ListView
 from django.contrib.auth.mixins import LoginRequiredMixin
 
+from apps.core.views.mixins import ConditionalGetMixin, CursorPaginationMixin
+
 from .models import EmailNotificationModel
 
 
-class NotificationsViews(LoginRequiredMixin, ListView):
+class NotificationsViews(LoginRequiredMixin, ConditionalGetMixin, CursorPaginationMixin, ListView):
     model = EmailNotificationModel
     template_name = 'public/notifications.html'
     context_object_name = 'notifications'
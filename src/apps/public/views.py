@@ -9,6 +9,7 @@ from django.contrib.messages import get_messages
 
 
 from apps.account.mixins import AccessRequiredMixin
+from apps.core.views.mixins import CursorPaginationMixin
 from .forms import ContactUsForm, ContactUsReplyForm
 from .models import ContactUs
 
@@ -38,7 +39,7 @@ class ContactUsView(LoginRequiredMixin, FormView):
         return HttpResponseRedirect(self.error_redirect_url)
 
 
-class ContactUsListView(LoginRequiredMixin, AccessRequiredMixin, ListView):
+class ContactUsListView(LoginRequiredMixin, AccessRequiredMixin, CursorPaginationMixin, ListView):
     model = ContactUs
     template_name = 'public/contact_list.html'
     context_object_name = 'contacts'
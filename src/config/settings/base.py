@@ -40,7 +40,6 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt.token_blacklist',
     'drf_yasg',
     'rosetta',
-    #'django_elasticsearch_dsl',
 
     # apps
     'apps.core.apps.CoreConfig',
@@ -142,6 +141,47 @@ STATICFILES_DIRS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / os.getenv('MEDIA_ROOT', 'static/media')
 ENABLE_MEDIA_SERVE_IN_LOCAL = bool(int(os.getenv('ENABLE_MEDIA_SERVE_IN_LOCAL', 0)))
+
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    # resumes and profile images, stored once per distinct content (apps.core.storage)
+    'blobs': {'BACKEND': 'apps.core.storage.ContentAddressedStorage'},
+}
+
+# resumes and profile images are only sent by authorized views (apps.core.downloads), not under MEDIA_URL
+# SENDFILE: nginx (X-Accel-Redirect), apache (X-Sendfile, mod_xsendfile) or empty (streamed by django)
+# nginx: location /protected-media/ { internal; alias <MEDIA_ROOT>/; }
+FILE_DOWNLOAD_CONFIG = {
+    'SENDFILE': os.getenv('FILE_DOWNLOAD_SENDFILE', ''),
+    'INTERNAL_URL': os.getenv('FILE_DOWNLOAD_INTERNAL_URL', '/protected-media/'),
+    'MAX_AGE': 3600,
+}
+
+# avatar variants of profile pictures (webp and jpeg), made by `generate_profile_thumbnails` worker
+PROFILE_THUMBNAIL_CONFIG = {
+    # name: width and height in pixels
+    'SIZES': {'small': 96, 'medium': 192},
+    'QUALITY': 80,
+    # decompression bomb guard, larger pictures are only sent as uploaded
+    'MAX_PIXELS': 40_000_000,
+    'QUEUE_KEY': 'profile_thumbnails:pending',
+    'PROCESSES': int(os.getenv('PROFILE_THUMBNAIL_PROCESSES', 1)),
+}
+
+# chunked resume uploads (apps.job.uploads), parts are kept outside MEDIA_ROOT on the same disk
+RESUME_UPLOAD_CONFIG = {
+    'TEMP_DIR': BASE_DIR / os.getenv('RESUME_UPLOAD_DIR', 'static/uploads'),
+    'MAX_SIZE': 10 * 1024 * 1024,
+    'CHUNK_SIZE': 1024 * 1024,
+    'EXPIRE_HOURS': 24,
+    # extension: leading bytes of the file
+    'TYPES': {
+        '.pdf': b'%PDF-',
+        '.doc': b'\xd0\xcf\x11\xe0',
+        '.docx': b'PK\x03\x04',
+    },
+}
 # ----------------------------------------------------------------
 
 
@@ -151,7 +191,7 @@ if int(os.getenv('ENABLE_WHITENOISE', default=0)):
     MIDDLEWARE += [
         'whitenoise.middleware.WhiteNoiseMiddleware',
     ]
-    STATICFILES_STORAGE = 'whitenoise.storage.StaticFilesStorage'
+    STORAGES['staticfiles'] = {'BACKEND': 'whitenoise.storage.StaticFilesStorage'}
 # ----------------------------------------------------------------
 
 
@@ -260,12 +300,107 @@ ROSETTA_ACCESS_CONTROL_FUNCTION = lambda u: u.is_staff
 # ---------------------------------------------------------------
 
 
+# ---CONDITIONAL GET---------------------------------------------
+# ETag / Last-Modified of template views (apps.core.views.mixins.ConditionalGetMixin)
+# VERSION is part of every ETag, change it on deploys that change templates
+CONDITIONAL_GET_CONFIG = {
+    'ENABLED': bool(int(os.getenv('CONDITIONAL_GET_ENABLED', 1))),
+    'VERSION': os.getenv('APP_VERSION', '1'),
+}
+# ---------------------------------------------------------------
+
+
+# ---JOB SEARCH--------------------------------------------------
+# BACKEND: database | postgres | elasticsearch | local (in-process inverted index)
+JOB_SEARCH_CONFIG = {
+    'BACKEND': os.getenv('JOB_SEARCH_BACKEND', 'database'),
+    'RETRY_AFTER': int(os.getenv('JOB_SEARCH_RETRY_AFTER', 30)),
+    'POSTGRES_TEXT_CONFIG': os.getenv('JOB_SEARCH_POSTGRES_TEXT_CONFIG', 'simple'),
+    # elasticsearch: queue index writes in redis for the `sync_search_index` worker
+    'SYNC_QUEUE': bool(int(os.getenv('JOB_SEARCH_SYNC_QUEUE', 1))),
+    'SYNC_QUEUE_KEY': 'job_search:pending',
+    'SYNC_BATCH_SIZE': 500,
+    # local / autocomplete: deleted job ids read by the in-process indexes of other processes
+    'DELETED_JOBS_KEY': 'job_search:deleted',
+    'DELETED_JOBS_RETENTION': 24 * 3600,
+}
+
+JOB_LIST_CACHE_CONFIG = {
+    'ENABLED': bool(int(os.getenv('JOB_LIST_CACHE_ENABLED', 1))),
+    'TIMEOUT': int(os.getenv('JOB_LIST_CACHE_TIMEOUT', 600)),
+    'PREFIX': 'job_list',
+}
+
+# applied job ids per user and employer fragment of the job detail page
+JOB_DETAIL_CACHE_CONFIG = {
+    'APPLIED_JOBS_TIMEOUT': 3600,
+    'EMPLOYER_FRAGMENT_TIMEOUT': 3600,
+    'PREFIX': 'job_detail',
+}
+
+# in-process prefix tries of active job titles / locations
+JOB_AUTOCOMPLETE_CONFIG = {
+    'LIMIT': 8,
+    'MAX_DEPTH': 24,
+    'MAX_WORDS': 6,
+}
+
+# text of application resumes searched by employers, see `extract_resume_texts` command
+RESUME_TEXT_CONFIG = {
+    'MAX_CHARS': 100_000,
+    'MAX_ATTEMPTS': 3,
+    'BATCH_SIZE': 200,
+    'PROCESSES': int(os.getenv('RESUME_TEXT_PROCESSES', 0)),
+}
+# ---------------------------------------------------------------
+
+
+# ---JOB RECOMMENDATION------------------------------------------
+# see `update_job_recommendations` command
+JOB_RECOMMENDATION_CONFIG = {
+    'TOP_N': int(os.getenv('JOB_RECOMMENDATION_TOP_N', 10)),
+    'MIN_SCORE': float(os.getenv('JOB_RECOMMENDATION_MIN_SCORE', 0.05)),
+    'BATCH_SIZE': 500,
+    'PROCESSES': int(os.getenv('JOB_RECOMMENDATION_PROCESSES', 1)),
+    # incremental runs fall back to a full rebuild above this share of changed jobs
+    'INCREMENTAL_MAX_RATIO': 0.2,
+    'STATE_KEY': 'job_recommendation:last_run',
+}
+# ---------------------------------------------------------------
+
+
+# ---DASHBOARD---------------------------------------------------
+# redis hashes of dashboard counters, see `reconcile_dashboard_counters` command
+DASHBOARD_COUNTERS_CONFIG = {
+    'PREFIX': 'dashboard',
+}
+# daily rows written by `rollup_daily_stats` command, admin dashboard shows the last DAYS
+DASHBOARD_ROLLUP_CONFIG = {
+    'DAYS': 30,
+}
+# per employer funnel analytics, job views are flushed by `flush_job_views` command
+JOB_FUNNEL_CONFIG = {
+    'PREFIX': 'funnel',
+    'DAYS': 30,
+    'TIMEOUT': 7 * 24 * 3600,
+    'PAGE_SIZE': 20,
+}
+# ---------------------------------------------------------------
+
+
 # ---ELASTICSEARCH-----------------------------------------------
-#ELASTICSEARCH_DSL = {
-#    'default': {
-#        'hosts': os.getenv('ELASTICSEARCH_HOST', 'localhost:9200')
-#    }
-#}
+if JOB_SEARCH_CONFIG['BACKEND'] == 'elasticsearch':
+    INSTALLED_APPS += [
+        'django_elasticsearch_dsl',
+    ]
+
+ELASTICSEARCH_DSL = {
+    'default': {
+        'hosts': os.getenv('ELASTICSEARCH_HOST', 'http://localhost:9200'),
+        'request_timeout': int(os.getenv('ELASTICSEARCH_TIMEOUT', 2)),
+    }
+}
+ELASTICSEARCH_DSL_AUTOSYNC = False
 # ---------------------------------------------------------------
 
 
@@ -51,5 +51,5 @@ urlpatterns = [
 ]
 if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    # media (resumes, profile images) is only sent by authorized views, see apps.core.downloads
 # ----------------------------------------------------------------
@@ -141,3 +141,36 @@ if (container) {
   setTimeout(() => container.remove(), 500);
 }
 }, 5000);
+
+
+document.addEventListener("DOMContentLoaded", () => {
+  const inputs = document.querySelectorAll("[data-autocomplete-url]");
+
+  inputs.forEach(input => {
+    const list = document.getElementById(input.getAttribute("list"));
+    let timer = null;
+
+    input.addEventListener("input", () => {
+      clearTimeout(timer);
+      const prefix = input.value.trim();
+      if (!prefix) {
+        list.innerHTML = "";
+        return;
+      }
+
+      timer = setTimeout(() => {
+        fetch(`${input.dataset.autocompleteUrl}?q=${encodeURIComponent(prefix)}`)
+          .then(response => response.json())
+          .then(data => {
+            list.innerHTML = "";
+            (data[input.dataset.autocompleteField] || []).forEach(text => {
+              const option = document.createElement("option");
+              option.value = text;
+              list.appendChild(option);
+            });
+          })
+          .catch(() => {});
+      }, 150);
+    });
+  });
+});